@@ -0,0 +1,79 @@
+"""
+Latency of assembling user_data from a profile service, offline.
+
+Compares fetching a user's friends one at a time with RecommendationService,
+both against StubProfileBackend with the same injected latency, and then
+runs a batch of concurrent requests that share friends to show coalescing.
+
+Run with: python -m benchmarks.async_service [--friends 50] [--latency 0.005]
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.generator import generate_population
+from viewing_party.party import get_available_recs
+from viewing_party.service import RecommendationService, StubProfileBackend
+
+
+async def sequential(backend, user_record):
+    friends = [{"watched": await backend.fetch_watched(friend_id)} for friend_id in user_record["friends"]]
+    return get_available_recs(dict(user_record, friends=friends))
+
+
+def make_data(user_count, friend_count, seed=0):
+    users, _ = generate_population(
+        user_count,
+        seed=seed,
+        friend_pool=friend_count * 2,
+        friends_per_user=friend_count,
+    )
+    profiles = {}
+    records = []
+    for user_data in users:
+        friend_ids = []
+        for friend in user_data["friends"]:
+            friend_ids.append(id(friend))
+            profiles[id(friend)] = friend
+        records.append(dict(user_data, friends=friend_ids))
+    return records, profiles
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--friends", type=int, default=50)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    records, profiles = make_data(args.users, args.friends)
+
+    backend = StubProfileBackend(profiles, latency=args.latency)
+    start = time.perf_counter()
+    expected = asyncio.run(sequential(backend, records[0]))
+    sequential_seconds = time.perf_counter() - start
+
+    backend = StubProfileBackend(profiles, latency=args.latency)
+    service = RecommendationService(backend, concurrency=args.concurrency)
+    start = time.perf_counter()
+    result = asyncio.run(service.recommend(records[0]))
+    concurrent_seconds = time.perf_counter() - start
+    assert result == expected
+
+    backend = StubProfileBackend(profiles, latency=args.latency)
+    service = RecommendationService(backend, concurrency=args.concurrency)
+    start = time.perf_counter()
+    asyncio.run(service.recommend_many(records))
+    batch_seconds = time.perf_counter() - start
+
+    print(f"one user, {args.friends} friends, {args.latency * 1000:.1f} ms per fetch")
+    print(f"  sequential fetches: {sequential_seconds * 1000:8.1f} ms")
+    print(f"  concurrent fetches: {concurrent_seconds * 1000:8.1f} ms ({sequential_seconds / concurrent_seconds:.1f}x faster)")
+    print(f"{args.users} concurrent users sharing friends")
+    print(f"  total:              {batch_seconds * 1000:8.1f} ms")
+    print(f"  fetches:            {backend.fetches:8} ({service.coalesced} coalesced)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Throughput of ConcurrentUserLibrary under several threads.
+
+Each thread repeatedly adds a movie to a watchlist and watches it. With
+--shared every thread works on one user (all contending for one lock);
+otherwise each thread has its own user and lock. Under CPython's GIL the
+per-user locks show up as flat, not falling, throughput as threads are
+added, while one shared user shows the cost of lock contention.
+
+Run with: python -m benchmarks.concurrency [--shared]
+"""
+import argparse
+import threading
+import time
+
+from viewing_party.party import create_movie
+from viewing_party.threadsafe import LibraryRegistry
+
+
+def run(thread_count, moves_per_thread, shared):
+    registry = LibraryRegistry()
+    movies = [
+        [create_movie(f"Movie {number}-{index}", "Horror", 3.0) for index in range(moves_per_thread)]
+        for number in range(thread_count)
+    ]
+
+    def work(number):
+        library = registry.get(0 if shared else number)
+        for movie in movies[number]:
+            library.add_to_watchlist(movie)
+            library.watch_movie(movie["title"])
+
+    threads = [threading.Thread(target=work, args=(number,)) for number in range(thread_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    watched = sum(len(registry.get(user).snapshot()["watched"]) for user in range(1 if shared else thread_count))
+    assert watched == thread_count * moves_per_thread
+    return thread_count * moves_per_thread / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--moves", type=int, default=20_000, help="moves per thread")
+    parser.add_argument("--shared", action="store_true", help="all threads use one user")
+    args = parser.parse_args(argv)
+
+    print(f"{'threads':>8} {'moves/sec':>12}")
+    for thread_count in args.threads:
+        print(f"{thread_count:>8} {run(thread_count, args.moves, args.shared):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Write and replay throughput of the mutation event log.
+
+Writes --events events for --users users through EventLog, then measures
+recovering from the log alone and from a snapshot taken at --snapshot-at
+of the way through, which only replays the tail.
+
+Run with: python -m benchmarks.event_replay [--events 1000000]
+"""
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from viewing_party.eventlog import EventLog
+from viewing_party.party import create_movie
+
+
+def write_events(directory, event_count, user_count, snapshot_at=None, seed=0):
+    rng = random.Random(seed)
+    genres = ["Fantasy", "Horror", "Action", "Intrigue"]
+    movies = [
+        dict(create_movie(f"Movie {number}", rng.choice(genres), rng.randrange(1, 6)), host="netflix")
+        for number in range(10_000)
+    ]
+
+    with EventLog(directory) as log:
+        for user_id in range(user_count):
+            log.add_user(user_id, {"subscriptions": ["netflix"]})
+
+        while log.seq < event_count:
+            user_id = rng.randrange(user_count)
+            movie = rng.choice(movies)
+            if rng.random() < 0.5:
+                log.add_to_watched(user_id, movie)
+            else:
+                log.add_to_watchlist(user_id, movie)
+                log.watch_movie(user_id, movie["title"])
+
+            if snapshot_at is not None and log.seq >= snapshot_at:
+                log.snapshot()
+                snapshot_at = None
+
+
+def time_recovery(directory):
+    start = time.perf_counter()
+    log = EventLog(directory)
+    elapsed = time.perf_counter() - start
+    log.close()
+    return log.replayed, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--snapshot-at", type=float, default=0.9)
+    args = parser.parse_args(argv)
+
+    for snapshot_at in (None, int(args.events * args.snapshot_at)):
+        directory = tempfile.mkdtemp(prefix="viewing-party-events-")
+        try:
+            start = time.perf_counter()
+            write_events(directory, args.events, args.users, snapshot_at)
+            written = time.perf_counter() - start
+            replayed, elapsed = time_recovery(directory)
+        finally:
+            shutil.rmtree(directory)
+
+        if snapshot_at is None:
+            label, detail = "log only", f"{replayed / elapsed:,.0f} events/s"
+        else:
+            label, detail = f"snapshot at {snapshot_at:,}", "including snapshot load"
+        print(
+            f"{label:>22}: write {args.events / written:>10,.0f} events/s, "
+            f"recover {elapsed:6.2f}s ({replayed:,} events replayed, {detail})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Scaling benchmark for get_rec_from_favorites.
+
+Doubles the number of friends (and with it the total input size) and times
+both the hashed implementation and the old list-membership scan. The hashed
+version should roughly double in time at each step; the old one grows with
+favorites x friends x watched.
+
+Run with: python -m benchmarks.favorites
+"""
+import gc
+import math
+import random
+import time
+
+from viewing_party.party import get_rec_from_favorites
+
+GENRES = ["Horror", "Fantasy", "Action", "Intrigue", "Comedy"]
+HOSTS = ["netflix", "hulu", "amazon", "disney+"]
+
+
+def make_movie(number):
+    return {
+        "title": f"Movie {number}",
+        "genre": GENRES[number % len(GENRES)],
+        "rating": round(1 + (number % 40) / 10, 1),
+        "host": HOSTS[number % len(HOSTS)],
+    }
+
+
+def make_user_data(friend_count, watched_per_friend=50, favorite_count=200, seed=0):
+    rng = random.Random(seed)
+    catalog_size = max(1000, friend_count * watched_per_friend)
+    movies = [make_movie(number) for number in range(catalog_size)]
+
+    return {
+        "favorites": rng.sample(movies, favorite_count),
+        "friends": [
+            {"watched": rng.sample(movies, watched_per_friend)}
+            for _ in range(friend_count)
+        ],
+    }
+
+
+def list_scan_rec_from_favorites(user_data):
+    # The original implementation, kept here as the comparison point.
+    rec_movies = []
+
+    for movie in user_data["favorites"]:
+        if not any(movie in friend["watched"] for friend in user_data["friends"]):
+            rec_movies.append(movie)
+
+    return rec_movies
+
+
+def best_time(function, user_data, repeat=5):
+    best = math.inf
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function(user_data)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main(friend_counts=(25, 50, 100, 200, 400, 800), list_scan_limit=200):
+    print(f"{'friends':>8} {'movies':>8} {'hashed (ms)':>12} {'list scan (ms)':>15} {'exponent':>9}")
+
+    previous = None
+    for friend_count in friend_counts:
+        user_data = make_user_data(friend_count)
+        total = len(user_data["favorites"]) + sum(
+            len(friend["watched"]) for friend in user_data["friends"]
+        )
+
+        hashed = best_time(get_rec_from_favorites, user_data)
+        if friend_count <= list_scan_limit:
+            assert get_rec_from_favorites(user_data) == list_scan_rec_from_favorites(user_data)
+            list_scan = f"{best_time(list_scan_rec_from_favorites, user_data, 1) * 1000:15.2f}"
+        else:
+            list_scan = f"{'skipped':>15}"
+
+        # Slope of log(time) against log(size): ~1.0 means linear scaling.
+        exponent = ""
+        if previous is not None:
+            exponent = f"{math.log(hashed / previous[1]) / math.log(total / previous[0]):9.2f}"
+        previous = (total, hashed)
+
+        print(f"{friend_count:>8} {total:>8} {hashed * 1000:12.2f} {list_scan} {exponent:>9}")
+
+
+if __name__ == "__main__":
+    main()
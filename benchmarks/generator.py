@@ -0,0 +1,140 @@
+"""
+Seeded synthetic data in the user_data shape used by viewing_party.party.
+
+Genres and hosts are drawn from Zipf-like weights: with a skew of 0 every
+genre (or host) is equally likely, and larger skews concentrate movies in
+the first few. The same arguments and seed always produce the same data.
+"""
+import itertools
+import random
+
+GENRES = ("Fantasy", "Action", "Intrigue", "Horror", "Comedy", "Drama", "Romance", "Sci-Fi")
+HOSTS = ("netflix", "hulu", "amazon", "disney+", "max", "peacock")
+
+
+def zipf_weights(count, skew):
+    return [1 / (rank + 1) ** skew for rank in range(count)]
+
+
+def generate_movies(count, seed=0, genres=GENRES, hosts=HOSTS, genre_skew=1.0, host_skew=1.0):
+    """
+    Returns a list of distinct movie dicts with title, genre, rating and host.
+    """
+    rng = random.Random(seed)
+    movie_genres = rng.choices(genres, zipf_weights(len(genres), genre_skew), k=count)
+    movie_hosts = rng.choices(hosts, zipf_weights(len(hosts), host_skew), k=count)
+
+    return [
+        {
+            "title": f"Movie {number}",
+            "genre": genre,
+            "rating": rng.randint(10, 50) / 10,
+            "host": host,
+        }
+        for number, genre, host in zip(range(count), movie_genres, movie_hosts)
+    ]
+
+
+def _sample(rng, movies, count):
+    return rng.sample(movies, min(count, len(movies)))
+
+
+def generate_user(
+    movies,
+    seed=0,
+    watched=20,
+    watchlist=5,
+    favorites=3,
+    friends=5,
+    watched_per_friend=20,
+    subscriptions=2,
+    hosts=HOSTS,
+):
+    """
+    Returns one user_data dict with its own friend dicts, drawn from movies.
+    """
+    rng = random.Random(seed)
+    user_watched = _sample(rng, movies, watched)
+
+    return {
+        "watched": user_watched,
+        "watchlist": _sample(rng, movies, watchlist),
+        "favorites": _sample(rng, user_watched, favorites),
+        "subscriptions": rng.sample(hosts, min(subscriptions, len(hosts))),
+        "friends": [
+            {"watched": _sample(rng, movies, watched_per_friend)}
+            for _ in range(friends)
+        ],
+    }
+
+
+def generate_population(
+    user_count,
+    seed=0,
+    catalog_size=None,
+    friend_pool=None,
+    friends_per_user=5,
+    genre_skew=1.0,
+    host_skew=1.0,
+    **user_sizes
+):
+    """
+    Returns (users, movies) for a population whose users share friends.
+
+    Every user's 'friends' are drawn from one pool of friend dicts, so a
+    friend is the same object for every user who lists them, as they would
+    be when loaded from a shared profile service.
+
+    Args:
+        user_count (int): How many users to generate.
+        seed (int): Seed for every random choice.
+        catalog_size (int): Distinct movies; defaults to 10 per user.
+        friend_pool (int): Distinct friends; defaults to user_count.
+        friends_per_user (int): Friends each user lists.
+        genre_skew (float): Zipf skew of genres.
+        host_skew (float): Zipf skew of hosts.
+        **user_sizes: watched, watchlist, favorites, watched_per_friend and
+            subscriptions, as for generate_user.
+    """
+    rng = random.Random(seed)
+    movies = generate_movies(
+        catalog_size or max(10 * user_count, 100),
+        seed,
+        genre_skew=genre_skew,
+        host_skew=host_skew,
+    )
+
+    pool = [
+        {"watched": _sample(rng, movies, user_sizes.get("watched_per_friend", 20))}
+        for _ in range(friend_pool or max(user_count, friends_per_user))
+    ]
+
+    users = []
+    seeds = itertools.count(seed + 1)
+    for _ in range(user_count):
+        user_data = generate_user(movies, next(seeds), friends=0, **user_sizes)
+        user_data["friends"] = _sample(rng, pool, friends_per_user)
+        users.append(user_data)
+
+    return users, movies
+
+
+def generate_sized_user(size, seed=0, genre_skew=1.0, host_skew=1.0):
+    """
+    Returns a user whose total input grows linearly with size.
+
+    The user has ``size`` watched, watchlist and favorite movies, and about
+    sqrt(size) friends with sqrt(size) movies each, so the friends hold about
+    ``size`` movies in total. This is the unit of the benchmark size ladder.
+    """
+    side = max(int(size ** 0.5), 1)
+    movies = generate_movies(2 * size + side * side, seed, genre_skew=genre_skew, host_skew=host_skew)
+    return generate_user(
+        movies,
+        seed,
+        watched=size,
+        watchlist=size,
+        favorites=size,
+        friends=side,
+        watched_per_friend=side,
+    )
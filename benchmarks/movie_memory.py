@@ -0,0 +1,63 @@
+"""
+Memory comparison of movie dicts and compact Movie records.
+
+Builds the same movies both ways from freshly created genre and host
+strings, as a parser reading a catalog feed would, and reports the memory
+tracemalloc attributes to the records (titles are allocated beforehand and
+shared by both).
+
+Run with: python -m benchmarks.movie_memory [count]
+"""
+import sys
+import tracemalloc
+
+from viewing_party.party import Movie, create_movie
+
+GENRES = ["Horror", "Fantasy", "Action", "Intrigue", "Comedy"]
+HOSTS = ["netflix", "hulu", "amazon", "disney+"]
+
+
+def fresh(text):
+    # A new string object each call, like one decoded from JSON.
+    return "".join(list(text))
+
+
+def build(count, titles, compact):
+    movies = []
+    for number in range(count):
+        genre = fresh(GENRES[number % len(GENRES)])
+        host = fresh(HOSTS[number % len(HOSTS)])
+        rating = 1 + (number % 40) / 10
+
+        if compact:
+            movie = Movie(titles[number], genre, rating, host)
+        else:
+            movie = create_movie(titles[number], genre, rating)
+            movie["host"] = host
+        movies.append(movie)
+    return movies
+
+
+def measure(count, titles, compact):
+    tracemalloc.start()
+    movies = build(count, titles, compact)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del movies
+    return current
+
+
+def main(count=1_000_000):
+    titles = [f"Movie number {number}" for number in range(count)]
+
+    dict_bytes = measure(count, titles, compact=False)
+    movie_bytes = measure(count, titles, compact=True)
+
+    print(f"{count:,} movies")
+    print(f"  dict records:  {dict_bytes / 2**20:8.1f} MiB ({dict_bytes / count:6.1f} B/movie)")
+    print(f"  Movie records: {movie_bytes / 2**20:8.1f} MiB ({movie_bytes / count:6.1f} B/movie)")
+    print(f"  saved:         {1 - movie_bytes / dict_bytes:8.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
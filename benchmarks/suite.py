@@ -0,0 +1,236 @@
+"""
+Times every public function in viewing_party.party across a size ladder.
+
+For each size the suite builds one synthetic user whose total input is
+about that size (see generator.generate_sized_user), times each function
+until it has run for at least --min-time seconds, and reports ops/sec. The
+scaling exponent is the slope of log(time per call) against log(size): about
+0 is constant time, 1 linear and 2 quadratic.
+
+Results can be saved as a baseline and later runs compared against it;
+--compare exits with status 1 if any function got slower than the baseline
+by more than --tolerance.
+
+The default ladder runs from 10 to 1,000,000. Every function in party.py
+now scales about linearly, so the whole ladder finishes in a couple of
+minutes; building the 1M user takes about 1 GiB of memory. Use --sizes to
+run a shorter ladder and --only to time a few functions.
+
+Run with: python -m benchmarks.suite --sizes 10 100 1000 10000
+"""
+import argparse
+import gc
+import inspect
+import json
+import math
+import sys
+import time
+
+from benchmarks.generator import generate_sized_user
+from viewing_party import party
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+MISSING_TITLE = "Non-Existent Movie Title"
+
+
+def _consume(function):
+    # Generators only do their work when iterated.
+    return lambda *args: list(function(*args))
+
+
+# How to call each function with the benchmark user. Mutators are called in
+# ways that don't grow the data between calls.
+CALLS = {
+    "create_movie": lambda user, movie: ((movie["title"], movie["genre"], movie["rating"]), {}),
+    "create_movies": lambda user, movie: (
+        tuple([movie[field] for movie in user["watched"]] for field in ("title", "genre", "rating")),
+        {},
+    ),
+    "add_to_watched": lambda user, movie: (({"watched": []}, movie), {}),
+    "add_to_watchlist": lambda user, movie: (({"watchlist": []}, movie), {}),
+    "watch_movie": lambda user, movie: ((user, MISSING_TITLE), {}),
+    "add_many_to_watched": lambda user, movie: (({"watched": []}, [movie] * 10), {}),
+    "add_many_to_watchlist": lambda user, movie: (({"watchlist": []}, [movie] * 10), {}),
+    "watch_movies": lambda user, movie: ((user, [MISSING_TITLE] * 10), {}),
+}
+
+
+def public_functions():
+    """
+    Returns name -> function for the public functions defined in party.py.
+    """
+    return {
+        name: function
+        for name, function in inspect.getmembers(party, inspect.isfunction)
+        if not name.startswith("_") and function.__module__ == party.__name__
+    }
+
+
+def call_for(name, function, user):
+    movie = user["watched"][0]
+    if name in CALLS:
+        args, kwargs = CALLS[name](user, movie)
+    else:
+        parameters = [
+            parameter for parameter in inspect.signature(function).parameters.values()
+            if parameter.default is inspect.Parameter.empty
+        ]
+        if [parameter.name for parameter in parameters] != ["user_data"]:
+            return None
+        args, kwargs = (user,), {}
+
+    if inspect.isgeneratorfunction(function):
+        function = _consume(function)
+    return lambda: function(*args, **kwargs)
+
+
+def time_call(call, min_time):
+    """
+    Returns seconds per call, running call until min_time has passed.
+    """
+    calls = 0
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time or calls == 0:
+            call()
+            calls += 1
+            elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    return elapsed / calls
+
+
+def scaling_exponent(sizes, seconds):
+    """
+    Returns the least-squares slope of log(seconds) against log(sizes).
+    """
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, seconds) if value > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run(sizes=DEFAULT_SIZES, min_time=0.05, seed=0, only=None, log=None):
+    """
+    Returns {"sizes": [...], "functions": {name: {...}}} for the ladder.
+
+    Each function entry has "ops_per_sec" (one value per size) and
+    "exponent". Functions the suite doesn't know how to call are listed
+    under "skipped".
+    """
+    functions = public_functions()
+    if only:
+        functions = {name: functions[name] for name in only}
+
+    results = {"sizes": list(sizes), "functions": {}, "skipped": []}
+    timings = {name: [] for name in functions}
+
+    for size in sizes:
+        user = generate_sized_user(size, seed)
+        for name, function in functions.items():
+            call = call_for(name, function, user)
+            if call is None:
+                continue
+            timings[name].append(time_call(call, min_time))
+        if log:
+            log(f"size {size} done")
+
+    for name, seconds in timings.items():
+        if not seconds:
+            results["skipped"].append(name)
+            continue
+        results["functions"][name] = {
+            "ops_per_sec": [1 / value for value in seconds],
+            "exponent": scaling_exponent(sizes, seconds),
+        }
+
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Returns (name, size, ops/sec, baseline ops/sec) for every regression.
+
+    A regression is a function running at fewer than (1 - tolerance) times
+    its baseline ops/sec at a size both runs measured.
+    """
+    regressions = []
+    baseline_sizes = baseline["sizes"]
+
+    for name, entry in results["functions"].items():
+        previous = baseline["functions"].get(name)
+        if previous is None:
+            continue
+        for size, ops in zip(results["sizes"], entry["ops_per_sec"]):
+            if size not in baseline_sizes:
+                continue
+            previous_ops = previous["ops_per_sec"][baseline_sizes.index(size)]
+            if ops < previous_ops * (1 - tolerance):
+                regressions.append((name, size, ops, previous_ops))
+
+    return regressions
+
+
+def _format_ops(ops):
+    # Large inputs run well under 1 op/sec; keep some digits for them.
+    return f"{ops:>12,.0f}" if ops >= 100 else f"{ops:>12,.2f}"
+
+
+def format_results(results):
+    sizes = results["sizes"]
+    name_width = max([len(name) for name in results["functions"]] + [8])
+    lines = [
+        f"{'function':<{name_width}} " + " ".join(f"{size:>12,}" for size in sizes) + f" {'exponent':>9}"
+    ]
+    for name, entry in sorted(results["functions"].items()):
+        exponent = entry["exponent"]
+        lines.append(
+            f"{name:<{name_width}} "
+            + " ".join(_format_ops(ops) for ops in entry["ops_per_sec"])
+            + (f" {exponent:>9.2f}" if exponent is not None else f" {'-':>9}")
+        )
+    if results["skipped"]:
+        lines.append("skipped (no benchmark call): " + ", ".join(sorted(results["skipped"])))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark viewing_party.party across input sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds to time each call for")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", help="function names to benchmark")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.min_time, args.seed, args.only, log=lambda text: print(text, file=sys.stderr))
+    print("ops/sec by input size")
+    print(format_results(results))
+
+    if args.save:
+        with open(args.save, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for name, size, ops, previous_ops in regressions:
+            print(f"REGRESSION {name} at size {size:,}: {ops:,.0f} ops/sec, baseline {previous_ops:,.0f}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import pytest
+from viewing_party.party import *
+from viewing_party.batch import BatchEngine, FriendProfile
+from tests.test_constants import *
+
+
+def make_registry():
+    sonyas_data = clean_wave_5_data()
+    return {
+        "alex": sonyas_data["friends"][0],
+        "sam": sonyas_data["friends"][1],
+        "kim": {"watched": [ACTION_2b, ACTION_3b, INTRIGUE_2b, ACTION_2b]},
+    }
+
+
+def make_users():
+    users = []
+    for friends in (["alex", "sam"], ["sam", "kim"], ["kim"], []):
+        user_data = clean_wave_5_data()
+        user_data["friends"] = friends
+        users.append(user_data)
+    users[2]["watched"] = [ACTION_1b, INTRIGUE_3b]
+    users[3]["watched"] = []
+    return users
+
+
+def test_batch_matches_single_user_functions():
+    # Arrange
+    engine = BatchEngine(make_registry())
+    users = make_users()
+
+    # Act
+    results = list(engine.run(users))
+
+    # Assert
+    assert len(results) == len(users)
+    for user_data, result in zip(users, results):
+        resolved = engine.resolve(user_data)
+        assert result["unique_watched"] == get_unique_watched(resolved)
+        assert result["friends_unique_watched"] == get_friends_unique_watched(resolved)
+        assert result["available_recs"] == get_available_recs(resolved)
+        assert result["new_rec_by_genre"] == get_new_rec_by_genre(resolved)
+
+
+def test_batch_builds_each_friend_profile_once():
+    # Arrange
+    engine = BatchEngine(make_registry())
+
+    # Act
+    list(engine.run(make_users(), recommenders=("available_recs",)))
+
+    # Assert
+    assert len(engine) == 3
+    assert engine.profile("sam") is engine.profile("sam")
+
+
+def test_batch_accepts_friend_dicts():
+    # Arrange
+    engine = BatchEngine()
+    sonyas_data = clean_wave_5_data()
+
+    # Act
+    result = engine.recommend(sonyas_data)
+
+    # Assert
+    assert result["available_recs"] == get_available_recs(sonyas_data)
+    assert result["new_rec_by_genre"] == get_new_rec_by_genre(sonyas_data)
+    assert sonyas_data == clean_wave_5_data()
+
+
+def test_friend_profile_dedupes_titles():
+    # Act
+    profile = FriendProfile(make_registry()["kim"])
+
+    # Assert
+    assert [movie for title, host, movie in profile.movies] == [ACTION_2b, ACTION_3b, INTRIGUE_2b]
+    assert len(profile.by_genre["Action"]) == 2
+
+
+def test_batch_rejects_unknown_recommender():
+    # Arrange
+    engine = BatchEngine()
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        list(engine.run([clean_wave_5_data()], recommenders=("favorites",)))
+
+
+def test_batch_does_not_keep_friend_dict_profiles():
+    # Arrange
+    engine = BatchEngine(make_registry())
+    users = [clean_wave_5_data() for _ in range(1000)]
+
+    # Act
+    results = list(engine.run(users, recommenders=("available_recs",), chunksize=100))
+    chunk_results = engine.recommend_chunk(users[:10], ("available_recs",))
+
+    # Assert
+    assert len(engine) == 0
+    assert results[0]["available_recs"] == get_available_recs(clean_wave_5_data())
+    assert chunk_results == results[:10]
+
+
+def test_batch_shares_friend_dict_profiles_within_a_scope():
+    # Arrange
+    engine = BatchEngine()
+    friend = clean_wave_5_data()["friends"][0]
+    scope = {}
+
+    # Act
+    first = engine.profile(friend, scope)
+    second = engine.profile(friend, scope)
+
+    # Assert
+    assert first is second
+    assert engine.profile(friend) is not first
+    assert len(engine) == 0
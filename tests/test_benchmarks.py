@@ -0,0 +1,89 @@
+import pytest
+from viewing_party.party import *
+from benchmarks.generator import generate_movies, generate_population, generate_sized_user
+from benchmarks.suite import DEFAULT_SIZES, compare, format_results, public_functions, run, scaling_exponent
+
+
+def test_generator_is_seeded():
+    # Act
+    first, _ = generate_population(20, seed=3)
+    second, _ = generate_population(20, seed=3)
+    other, _ = generate_population(20, seed=4)
+
+    # Assert
+    assert first == second
+    assert first != other
+    assert all(len(user_data["friends"]) == 5 for user_data in first)
+
+
+def test_generator_genre_skew():
+    # Act
+    movies = generate_movies(2000, genre_skew=3.0)
+
+    # Assert
+    genres = [movie["genre"] for movie in movies]
+    assert genres.count("Fantasy") > len(genres) / 2
+    assert all(create_movie(movie["title"], movie["genre"], movie["rating"]) for movie in movies)
+
+
+def test_generate_sized_user():
+    # Act
+    user_data = generate_sized_user(100)
+
+    # Assert
+    assert len(user_data["watched"]) == 100
+    assert sum(len(friend["watched"]) for friend in user_data["friends"]) == 100
+
+
+def test_suite_times_every_public_function():
+    # Act
+    results = run(sizes=(10, 40), min_time=0)
+
+    # Assert
+    assert set(results["functions"]) | set(results["skipped"]) == set(public_functions())
+    assert "get_available_recs" in results["functions"]
+    assert len(results["functions"]["get_available_recs"]["ops_per_sec"]) == 2
+
+
+def test_suite_scaling_and_regressions():
+    # Arrange
+    baseline = {"sizes": [10, 100], "functions": {"f": {"ops_per_sec": [100.0, 10.0]}}}
+    results = {"sizes": [10, 100], "functions": {"f": {"ops_per_sec": [100.0, 5.0]}}}
+
+    # Act
+    regressions = compare(results, baseline, tolerance=0.25)
+
+    # Assert
+    assert scaling_exponent([10, 100, 1000], [1.0, 10.0, 100.0]) == pytest.approx(1.0)
+    assert regressions == [("f", 100, 5.0, 10.0)]
+
+
+def test_suite_default_ladder_calls_every_function_at_small_sizes():
+    # Arrange
+    sizes = [size for size in DEFAULT_SIZES if size <= 1_000]
+
+    # Act
+    results = run(sizes=sizes, min_time=0)
+
+    # Assert
+    assert results["skipped"] == []
+    assert set(results["functions"]) == set(public_functions())
+    for entry in results["functions"].values():
+        assert len(entry["ops_per_sec"]) == len(sizes)
+        assert all(ops > 0 for ops in entry["ops_per_sec"])
+
+
+def test_format_results_keeps_digits_for_slow_functions():
+    # Arrange
+    results = {
+        "sizes": [10, 1_000_000],
+        "functions": {"get_available_recs": {"ops_per_sec": [12_345.6, 0.42], "exponent": 1.0}},
+        "skipped": [],
+    }
+
+    # Act
+    table = format_results(results)
+
+    # Assert
+    assert "12,346" in table
+    assert "0.42" in table
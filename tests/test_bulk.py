@@ -0,0 +1,97 @@
+import copy
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+
+def watch_one_by_one(user_data, titles):
+    for title in titles:
+        watch_movie(user_data, title)
+    return user_data
+
+
+def test_add_many_to_watched_keeps_order():
+    # Arrange
+    janes_data = {"watched": [HORROR_1]}
+
+    # Act
+    updated_data = add_many_to_watched(janes_data, iter([FANTASY_1, INTRIGUE_1]))
+
+    # Assert
+    assert updated_data is janes_data
+    assert updated_data["watched"] == [HORROR_1, FANTASY_1, INTRIGUE_1]
+
+
+def test_add_many_to_watchlist_in_user_library():
+    # Arrange
+    library = UserLibrary()
+
+    # Act
+    add_many_to_watchlist(library, [FANTASY_1, ACTION_1])
+
+    # Assert
+    assert library["watchlist"] == [FANTASY_1, ACTION_1]
+    assert library.in_watchlist(ACTION_1["title"])
+
+
+def test_watch_movies_moves_titles_in_request_order():
+    # Arrange
+    janes_data = {
+        "watchlist": [FANTASY_1, HORROR_1, INTRIGUE_1, ACTION_1],
+        "watched": [FANTASY_2]
+    }
+
+    # Act
+    updated_data = watch_movies(janes_data, [ACTION_1["title"], FANTASY_1["title"]])
+
+    # Assert
+    assert updated_data is janes_data
+    assert updated_data["watchlist"] == [HORROR_1, INTRIGUE_1]
+    assert updated_data["watched"] == [FANTASY_2, ACTION_1, FANTASY_1]
+
+
+def test_watch_movies_ignores_missing_titles():
+    # Arrange
+    janes_data = {"watchlist": [FANTASY_1], "watched": [FANTASY_2]}
+    watchlist = janes_data["watchlist"]
+
+    # Act
+    updated_data = watch_movies(janes_data, ["Non-Existent Movie Title"])
+
+    # Assert
+    assert updated_data["watchlist"] is watchlist
+    assert updated_data["watchlist"] == [FANTASY_1]
+    assert updated_data["watched"] == [FANTASY_2]
+
+
+@pytest.mark.parametrize("titles", [
+    [],
+    [HORROR_1["title"], HORROR_1["title"], HORROR_1["title"]],
+    [INTRIGUE_1["title"], "Nope", HORROR_1["title"], INTRIGUE_1["title"]],
+])
+def test_watch_movies_matches_watch_movie_with_duplicates(titles):
+    # Arrange
+    other_horror = dict(HORROR_1, rating=1.0)
+    janes_data = {
+        "watchlist": [HORROR_1, INTRIGUE_1, other_horror, FANTASY_1],
+        "watched": []
+    }
+    expected = watch_one_by_one(copy.deepcopy(janes_data), titles)
+
+    # Act
+    watch_movies(janes_data, titles)
+
+    # Assert
+    assert janes_data == expected
+
+
+def test_watch_movies_in_user_library():
+    # Arrange
+    library = UserLibrary({"watchlist": [FANTASY_1, HORROR_1, INTRIGUE_1]})
+
+    # Act
+    watch_movies(library, [INTRIGUE_1["title"], FANTASY_1["title"], "Nope"])
+
+    # Assert
+    assert library["watchlist"] == [HORROR_1]
+    assert library["watched"] == [INTRIGUE_1, FANTASY_1]
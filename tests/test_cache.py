@@ -0,0 +1,97 @@
+import pytest
+from viewing_party.party import *
+from viewing_party.cache import RecommendationCache
+from tests.test_constants import *
+
+
+def test_repeat_reads_are_cache_hits():
+    # Arrange
+    cache = RecommendationCache()
+    sonyas_data = UserLibrary(clean_wave_5_data())
+
+    # Act
+    first = cache.get_available_recs(sonyas_data)
+    second = cache.get_available_recs(sonyas_data)
+
+    # Assert
+    assert first == second == get_available_recs(clean_wave_5_data())
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_user_mutation_invalidates_entry():
+    # Arrange
+    cache = RecommendationCache()
+    sonyas_data = UserLibrary(clean_wave_5_data())
+    sonyas_data["watchlist"].append(FANTASY_4b)
+    before = cache.get_friends_unique_watched(sonyas_data)
+
+    # Act
+    watch_movie(sonyas_data, FANTASY_4b["title"])
+    after = cache.get_friends_unique_watched(sonyas_data)
+
+    # Assert
+    assert FANTASY_4b in before
+    assert FANTASY_4b not in after
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["misses"] == 2
+
+
+def test_friend_mutation_invalidates_entry():
+    # Arrange
+    cache = RecommendationCache()
+    sonyas_data = UserLibrary(clean_wave_5_data())
+    before = cache.get_available_recs(sonyas_data)
+
+    # Act
+    sonyas_data["friends"][0] = UserLibrary({"watched": [ACTION_3b]})
+    replaced = cache.get_available_recs(sonyas_data)
+    add_to_watched(sonyas_data["friends"][0], HORROR_1b)
+    added = cache.get_available_recs(sonyas_data)
+    add_to_watched(sonyas_data["friends"][1], ACTION_2b)
+    cache.get_available_recs(sonyas_data)
+
+    # Assert
+    assert before == [FANTASY_4b, HORROR_1b]
+    assert replaced == [ACTION_3b, FANTASY_4b]
+    assert added == [ACTION_3b, HORROR_1b, FANTASY_4b]
+    assert cache.stats()["misses"] == 4
+
+
+def test_cache_evicts_least_recently_used():
+    # Arrange
+    cache = RecommendationCache(maxsize=2)
+    users = [UserLibrary(clean_wave_5_data()) for _ in range(3)]
+
+    # Act
+    cache.get_unique_watched(users[0])
+    cache.get_unique_watched(users[1])
+    cache.get_unique_watched(users[0])
+    cache.get_unique_watched(users[2])
+    cache.get_unique_watched(users[0])
+    cache.get_unique_watched(users[1])
+
+    # Assert
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 4,
+        "evictions": 2,
+        "bypasses": 0,
+        "size": 2,
+        "maxsize": 2
+    }
+
+
+def test_plain_user_data_bypasses_cache():
+    # Arrange
+    cache = RecommendationCache()
+    sonyas_data = clean_wave_5_data()
+
+    # Act
+    recommendations = cache.get_new_rec_by_genre(sonyas_data)
+    cache.get_new_rec_by_genre(sonyas_data)
+
+    # Assert
+    assert recommendations == get_new_rec_by_genre(sonyas_data)
+    assert cache.stats()["bypasses"] == 2
+    assert len(cache) == 0
@@ -0,0 +1,68 @@
+import pytest
+from viewing_party.party import *
+from viewing_party.catalog import MovieCatalog
+from tests.test_constants import *
+
+
+def test_catalog_assigns_dense_ids_by_title():
+    # Arrange
+    catalog = MovieCatalog()
+
+    # Act
+    ids = catalog.encode([FANTASY_1b, HORROR_1b, FANTASY_1b, dict(HORROR_1b)])
+
+    # Assert
+    assert ids == [0, 1, 0, 1]
+    assert len(catalog) == 2
+    assert catalog.id_of(HORROR_1b["title"]) == 1
+    assert catalog.id_of("Non-Existent Movie Title") is None
+    assert catalog.title_of(0) == FANTASY_1b["title"]
+    assert catalog.decode([1, 0]) == [HORROR_1b, FANTASY_1b]
+
+
+def test_catalog_recommenders_match_party():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    catalog = MovieCatalog()
+
+    # Act
+    user = catalog.encode_user(sonyas_data)
+
+    # Assert
+    assert catalog.get_unique_watched(user) == get_unique_watched(sonyas_data)
+    assert catalog.get_friends_unique_watched(user) == get_friends_unique_watched(sonyas_data)
+    assert catalog.get_available_recs(user) == get_available_recs(sonyas_data)
+    assert catalog.get_new_rec_by_genre(user) == get_new_rec_by_genre(sonyas_data)
+    assert catalog.get_rec_from_favorites(user) == get_rec_from_favorites(sonyas_data)
+    assert sonyas_data == clean_wave_5_data()
+
+
+def test_catalog_with_empty_user():
+    # Arrange
+    catalog = MovieCatalog()
+
+    # Act
+    user = catalog.encode_user({"friends": [{"watched": [INTRIGUE_1b]}]})
+
+    # Assert
+    assert catalog.get_unique_watched(user) == []
+    assert catalog.get_friends_unique_watched(user) == [INTRIGUE_1b]
+    assert catalog.get_available_recs(user) == []
+    assert catalog.get_new_rec_by_genre(user) == []
+
+
+def test_catalog_friend_cache_encodes_shared_friends_once():
+    # Arrange
+    catalog = MovieCatalog()
+    friend_cache = {}
+    sonyas_data = clean_wave_5_data()
+    other_data = dict(sonyas_data, watched=[])
+
+    # Act
+    first = catalog.encode_user(sonyas_data, friend_cache)
+    second = catalog.encode_user(other_data, friend_cache)
+
+    # Assert
+    assert len(friend_cache) == 2
+    assert first.friends[0] is second.friends[0]
+    assert catalog.get_friends_unique_watched(second) == get_friends_unique_watched(other_data)
@@ -0,0 +1,57 @@
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+np = pytest.importorskip("numpy")
+
+from viewing_party.columnar import WatchedColumns
+
+
+def make_population():
+    tied_data = {"watched": [INTRIGUE_1, FANTASY_1, FANTASY_2, INTRIGUE_2, ACTION_1]}
+    return [
+        clean_wave_2_data(),
+        {"watched": []},
+        clean_wave_2b_data(),
+        tied_data,
+        clean_wave_5_data(),
+        {"watched": [HORROR_1]},
+    ]
+
+
+def test_columnar_average_ratings_match_scalar():
+    # Arrange
+    users = make_population()
+
+    # Act
+    averages = WatchedColumns.from_users(users).average_ratings()
+
+    # Assert
+    assert averages.tolist() == [get_watched_avg_rating(user_data) for user_data in users]
+    assert averages[1] == 0
+
+
+def test_columnar_most_watched_genres_match_scalar():
+    # Arrange
+    users = make_population()
+
+    # Act
+    genres = WatchedColumns.from_users(users).most_watched_genres()
+
+    # Assert
+    assert genres == [get_most_watched_genre(user_data) for user_data in users]
+    assert genres[1] is None
+    assert genres[3] == "Intrigue"
+
+
+def test_columnar_with_no_watched_movies():
+    # Arrange
+    users = [{"watched": []}, {"watched": []}]
+
+    # Act
+    columns = WatchedColumns.from_users(users)
+
+    # Assert
+    assert len(columns) == 0
+    assert columns.average_ratings().tolist() == [0, 0]
+    assert columns.most_watched_genres() == [None, None]
@@ -0,0 +1,85 @@
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+# The Wave 1 create_movie cases, plus empty strings and a zero rating.
+TITLES = [MOVIE_TITLE_1, None, MOVIE_TITLE_1, MOVIE_TITLE_1, "", MOVIE_TITLE_1]
+GENRES = [GENRE_1, GENRE_1, None, GENRE_1, GENRE_1, ""]
+RATINGS = [RATING_1, RATING_1, RATING_1, None, 0, RATING_1]
+
+
+def expected_movies(titles, genres, ratings):
+    movies = [create_movie(*row) for row in zip(titles, genres, ratings)]
+    return [movie for movie in movies if movie is not None], [movie is None for movie in movies]
+
+
+def test_create_movies_matches_create_movie():
+    # Arrange
+    expected, expected_rejected = expected_movies(TITLES, GENRES, RATINGS)
+
+    # Act
+    movies, rejected = create_movies(TITLES, GENRES, RATINGS)
+
+    # Assert
+    assert movies == expected == [HORROR_1]
+    assert rejected == expected_rejected == [False, True, True, True, True, True]
+
+
+def test_create_movies_compact_returns_movie_records():
+    # Act
+    movies, rejected = create_movies([MOVIE_TITLE_1, ""], [GENRE_1, GENRE_1], [RATING_1, RATING_1], compact=True)
+
+    # Assert
+    assert isinstance(movies[0], Movie)
+    assert movies == [HORROR_1]
+    assert rejected == [False, True]
+
+
+def test_create_movies_rejects_mismatched_lengths():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        create_movies([MOVIE_TITLE_1], [GENRE_1, GENRE_1], [RATING_1])
+
+
+def test_create_movies_from_object_arrays_matches_create_movie():
+    # Arrange
+    np = pytest.importorskip("numpy")
+    expected, expected_rejected = expected_movies(TITLES, GENRES, RATINGS)
+
+    # Act
+    movies, rejected = create_movies(
+        np.array(TITLES, dtype=object), np.array(GENRES, dtype=object), np.array(RATINGS, dtype=object)
+    )
+
+    # Assert
+    assert movies == expected
+    assert rejected.tolist() == expected_rejected
+
+
+def test_create_movies_from_typed_arrays():
+    # Arrange
+    np = pytest.importorskip("numpy")
+    titles = np.array(["A", "", "C", "D"])
+    genres = np.array(["Horror", "Horror", "", "Fantasy"])
+    ratings = np.array([3.5, 4.0, 2.0, float("nan")])
+
+    # Act
+    movies, rejected = create_movies(titles, genres, ratings)
+
+    # Assert
+    assert rejected.tolist() == [False, True, True, False]
+    assert movies[0] == {"title": "A", "genre": "Horror", "rating": 3.5}
+    assert type(movies[0]["rating"]) is float
+    assert movies[1]["title"] == "D"
+
+
+def test_create_movies_mixes_arrays_and_lists():
+    # Arrange
+    np = pytest.importorskip("numpy")
+
+    # Act
+    movies, rejected = create_movies([MOVIE_TITLE_1, "B"], [GENRE_1, GENRE_1], np.array([RATING_1, 0]), compact=True)
+
+    # Assert
+    assert movies == [HORROR_1]
+    assert rejected.tolist() == [False, True]
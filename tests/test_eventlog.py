@@ -0,0 +1,133 @@
+import json
+import os
+import pytest
+from viewing_party.party import *
+from viewing_party.eventlog import EventLog
+from tests.test_constants import *
+
+
+def test_event_log_replays_mutations(tmp_path):
+    # Arrange
+    with EventLog(tmp_path) as log:
+        log.add_user("jane", {"subscriptions": ["netflix"]})
+        log.add_to_watchlist("jane", FANTASY_1)
+        log.add_to_watchlist("jane", HORROR_1)
+        log.add_to_watched("jane", INTRIGUE_1)
+        log.watch_movie("jane", FANTASY_1["title"])
+
+    # Act
+    recovered = EventLog(tmp_path)
+
+    # Assert
+    assert recovered.seq == 5
+    assert recovered.replayed == 5
+    assert recovered.users["jane"]["watched"] == [INTRIGUE_1, FANTASY_1]
+    assert recovered.users["jane"]["watchlist"] == [HORROR_1]
+    assert recovered.users["jane"]["subscriptions"] == ["netflix"]
+    recovered.close()
+
+
+def test_event_log_replays_only_tail_after_snapshot(tmp_path):
+    # Arrange
+    with EventLog(tmp_path) as log:
+        log.add_user("jane")
+        log.add_to_watched("jane", FANTASY_1)
+        log.snapshot()
+        log.add_to_watched("jane", FANTASY_2)
+
+    # Act
+    recovered = EventLog(tmp_path)
+
+    # Assert
+    assert recovered.replayed == 1
+    assert recovered.seq == 3
+    assert recovered.users["jane"]["watched"] == [FANTASY_1, FANTASY_2]
+    recovered.close()
+
+
+def test_event_log_takes_periodic_snapshots(tmp_path):
+    # Arrange
+    with EventLog(tmp_path, snapshot_every=3) as log:
+        log.add_user("jane")
+        for movie in [FANTASY_1, FANTASY_2, FANTASY_3, HORROR_1]:
+            log.add_to_watched("jane", movie)
+
+    # Act
+    recovered = EventLog(tmp_path)
+
+    # Assert
+    with open(os.path.join(tmp_path, "snapshot.json")) as snapshot:
+        assert json.load(snapshot)["seq"] == 3
+    assert recovered.replayed == 2
+    assert get_most_watched_genre(recovered.users["jane"]) == "Fantasy"
+    recovered.close()
+
+
+def test_event_log_drops_torn_last_line(tmp_path):
+    # Arrange
+    with EventLog(tmp_path) as log:
+        log.add_user("jane")
+        log.add_to_watched("jane", FANTASY_1)
+    with open(os.path.join(tmp_path, "events.jsonl"), "ab") as events:
+        events.write(b'{"op":"add_to_watched","user":"ja')
+
+    # Act
+    with EventLog(tmp_path) as recovered:
+        recovered.add_to_watched("jane", FANTASY_2)
+
+    # Assert
+    with EventLog(tmp_path) as reopened:
+        assert reopened.users["jane"]["watched"] == [FANTASY_1, FANTASY_2]
+        assert reopened.seq == 3
+
+
+def test_event_log_does_not_record_failed_events(tmp_path):
+    # Arrange
+    with EventLog(tmp_path) as log:
+        log.add_user("jane")
+
+        # Act / Assert
+        with pytest.raises(KeyError):
+            log.add_to_watched("nobody", FANTASY_1)
+        with pytest.raises(ValueError):
+            log.add_user("jane")
+        assert log.seq == 1
+
+    with EventLog(tmp_path) as reopened:
+        assert reopened.replayed == 1
+
+
+def test_event_log_rejects_log_shorter_than_snapshot(tmp_path):
+    # Arrange
+    with EventLog(tmp_path) as log:
+        log.add_user("jane")
+        log.add_to_watched("jane", FANTASY_1)
+        log.snapshot()
+    with open(os.path.join(tmp_path, "events.jsonl"), "r+b") as events:
+        events.truncate(10)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        EventLog(tmp_path)
+
+
+def test_event_log_failed_watch_matches_recovered_state(tmp_path):
+    # Arrange
+    unrated = {"title": "Unrated", "genre": "Horror"}
+    with EventLog(tmp_path) as log:
+        log.add_user("jane")
+        log.add_to_watchlist("jane", unrated)
+
+        # Act
+        with pytest.raises(KeyError):
+            log.add_to_watched("jane", unrated)
+        with pytest.raises(KeyError):
+            log.watch_movie("jane", unrated["title"])
+        live = log.users["jane"].copy()
+
+    # Assert
+    with EventLog(tmp_path) as recovered:
+        assert recovered.seq == 2
+        assert recovered.users["jane"] == live
+        assert live["watchlist"] == [unrated]
+        assert live["watched"] == []
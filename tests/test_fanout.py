@@ -0,0 +1,110 @@
+import random
+from viewing_party.party import *
+from viewing_party.fanout import FanoutHub
+from tests.test_constants import *
+
+
+def hub_from_wave_5():
+    janes_data = clean_wave_5_data()
+    hub = FanoutHub()
+    friend_ids = []
+    for number, friend in enumerate(janes_data.pop("friends")):
+        hub.add_user(f"friend-{number}", friend)
+        friend_ids.append(f"friend-{number}")
+    hub.add_user("jane", janes_data, friends=friend_ids)
+    return hub
+
+
+def assert_matches_party(hub, user_id):
+    user_data = hub.user_data(user_id)
+    assert hub.get_friends_unique_watched(user_id) == get_friends_unique_watched(user_data)
+    assert hub.get_available_recs(user_id) == get_available_recs(user_data)
+    assert hub.get_new_rec_by_genre(user_id) == get_new_rec_by_genre(user_data)
+
+
+def test_fanout_matches_recommenders_on_wave_5_data():
+    # Arrange
+    hub = hub_from_wave_5()
+
+    # Act / Assert
+    assert hub.get_friends_unique_watched("jane") == [FANTASY_4b, HORROR_1b, INTRIGUE_3b]
+    assert hub.get_available_recs("jane") == [FANTASY_4b, HORROR_1b]
+    assert hub.get_new_rec_by_genre("jane") == [FANTASY_4b]
+    assert_matches_party(hub, "jane")
+
+
+def test_friend_watch_is_pushed_to_followers():
+    # Arrange
+    hub = hub_from_wave_5()
+    new_movie = {"title": "Fanned Out", "genre": "Fantasy", "rating": 4.1, "host": "netflix"}
+
+    # Act
+    hub.add_to_watchlist("friend-1", new_movie)
+    hub.watch_movie("friend-1", new_movie["title"])
+
+    # Assert
+    assert new_movie in hub.get_friends_unique_watched("jane")
+    assert new_movie in hub.get_available_recs("jane")
+    assert hub.get_new_rec_by_genre("jane") == [FANTASY_4b, new_movie]
+    assert_matches_party(hub, "jane")
+
+
+def test_own_watch_removes_title_from_recommendations():
+    # Arrange
+    hub = hub_from_wave_5()
+
+    # Act
+    hub.add_to_watched("jane", FANTASY_4b)
+
+    # Assert
+    assert FANTASY_4b not in hub.get_friends_unique_watched("jane")
+    assert hub.get_new_rec_by_genre("jane") == []
+    assert_matches_party(hub, "jane")
+
+
+def test_earlier_friend_copy_takes_over_title():
+    # Arrange
+    hub = FanoutHub()
+    hub.add_user("first")
+    hub.add_user("second", {"watched": [dict(HORROR_1, host="hulu")]})
+    hub.add_user("jane", {"subscriptions": ["netflix"]}, friends=["first", "second"])
+
+    # Act
+    hub.add_to_watched("first", dict(HORROR_1, host="netflix"))
+
+    # Assert
+    assert hub.get_available_recs("jane") == [dict(HORROR_1, host="netflix")]
+    assert_matches_party(hub, "jane")
+
+
+def test_fanout_matches_recommenders_after_random_events():
+    # Arrange
+    rng = random.Random(22)
+    genres = ["Fantasy", "Horror", "Action", "Intrigue"]
+    hosts = ["netflix", "hulu", "disney+"]
+    hub = FanoutHub()
+    user_ids = [f"user-{number}" for number in range(12)]
+    for user_id in user_ids:
+        hub.add_user(user_id, {"subscriptions": rng.sample(hosts, 2)})
+    for user_id in user_ids:
+        for friend_id in rng.sample(user_ids, 4):
+            hub.follow(user_id, friend_id)
+
+    # Act
+    for _ in range(600):
+        user_id = rng.choice(user_ids)
+        movie = {
+            "title": f"Movie {rng.randrange(80)}",
+            "genre": rng.choice(genres),
+            "rating": rng.randrange(1, 6),
+            "host": rng.choice(hosts),
+        }
+        if rng.random() < 0.5:
+            hub.add_to_watched(user_id, movie)
+        else:
+            hub.add_to_watchlist(user_id, movie)
+            hub.watch_movie(user_id, movie["title"])
+
+    # Assert
+    for user_id in user_ids:
+        assert_matches_party(hub, user_id)
@@ -0,0 +1,144 @@
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+
+def test_friend_index_maps_titles_to_friends():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+
+    # Act
+    index = FriendIndex(sonyas_data)
+
+    # Assert
+    assert len(index) == 7
+    assert index.get(FANTASY_4b["title"]).friends == {0, 1}
+    assert index.get(HORROR_1b["title"]).friends == {0}
+    assert index.get(HORROR_1b["title"]).host == "netflix"
+    assert index.get(INTRIGUE_3b["title"]).genre == "Intrigue"
+    assert index.friend_count(FANTASY_1b["title"]) == 2
+    assert index.friend_count("Non-Existent Movie Title") == 0
+    assert index.movies()[0] == FANTASY_1b
+
+
+def test_recommenders_with_friend_index_match_without():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    index = FriendIndex(sonyas_data)
+
+    # Act / Assert
+    assert get_friends_movies(sonyas_data, index) == get_friends_movies(sonyas_data)
+    assert get_unique_watched(sonyas_data, index) == get_unique_watched(sonyas_data)
+    assert get_friends_unique_watched(sonyas_data, index) == get_friends_unique_watched(sonyas_data)
+    assert get_available_recs(sonyas_data, index) == get_available_recs(sonyas_data)
+    assert get_new_rec_by_genre(sonyas_data, index) == get_new_rec_by_genre(sonyas_data)
+    assert get_rec_from_favorites(sonyas_data, index) == get_rec_from_favorites(sonyas_data)
+    assert sonyas_data == clean_wave_5_data()
+
+
+def test_friend_index_compares_whole_movies_for_favorites():
+    # Arrange
+    rerated_fantasy = dict(FANTASY_2b, rating=1.0)
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["friends"][0]["watched"].append(rerated_fantasy)
+    index = FriendIndex(sonyas_data)
+
+    # Act
+    recommendations = get_rec_from_favorites(sonyas_data, index)
+
+    # Assert
+    assert recommendations == get_rec_from_favorites(sonyas_data)
+    assert FANTASY_2b in recommendations
+
+
+def test_friend_index_with_no_friends():
+    # Arrange
+    sonyas_data = {
+        "watched": [INTRIGUE_1b],
+        "favorites": [INTRIGUE_1b],
+        "subscriptions": ["hulu"],
+        "friends": []
+    }
+    index = FriendIndex(sonyas_data)
+
+    # Act / Assert
+    assert get_friends_unique_watched(sonyas_data, index) == []
+    assert get_new_rec_by_genre(sonyas_data, index) == []
+    assert get_rec_from_favorites(sonyas_data, index) == [INTRIGUE_1b]
+
+
+def test_rec_from_favorites_with_unhashable_movie_values():
+    # Arrange
+    tagged_fantasy = dict(FANTASY_1b, tags=["elves"])
+    sonyas_data = {
+        "favorites": [tagged_fantasy, INTRIGUE_2b],
+        "friends": [
+            {
+                "watched": [tagged_fantasy, HORROR_1b]
+            }
+        ]
+    }
+
+    # Act
+    recommendations = get_rec_from_favorites(sonyas_data)
+
+    # Assert
+    assert recommendations == [INTRIGUE_2b]
+
+
+def test_rec_from_favorites_with_unhashable_favorite_only():
+    # Arrange
+    tagged_fantasy = dict(FANTASY_1b, tags=["elves"])
+    sonyas_data = {
+        "favorites": [tagged_fantasy, HORROR_1b, INTRIGUE_2b],
+        "friends": [
+            {
+                "watched": [HORROR_1b, FANTASY_1b]
+            }
+        ]
+    }
+
+    # Act
+    recommendations = get_rec_from_favorites(sonyas_data)
+
+    # Assert
+    assert recommendations == [tagged_fantasy, INTRIGUE_2b]
+
+
+def test_available_recs_first_friend_copy_decides_host():
+    # Arrange
+    amazon_horror = dict(HORROR_1b, host="amazon")
+    sonyas_data = {
+        "watched": [FANTASY_1b],
+        "subscriptions": ["netflix", "hulu"],
+        "friends": [
+            {
+                "watched": [FANTASY_1b, amazon_horror, FANTASY_4b]
+            },
+            {
+                "watched": [HORROR_1b, INTRIGUE_1b]
+            }
+        ]
+    }
+
+    # Act
+    recommendations = get_available_recs(sonyas_data)
+
+    # Assert
+    assert recommendations == [FANTASY_4b, INTRIGUE_1b]
+    assert get_available_recs(sonyas_data, FriendIndex(sonyas_data)) == recommendations
+
+
+def test_get_friends_movies_with_index_returns_a_set():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    index = FriendIndex(sonyas_data)
+
+    # Act
+    titles = get_friends_movies(sonyas_data, index)
+    titles.add("Another Title")
+
+    # Assert
+    assert isinstance(titles, set)
+    assert titles - {"Another Title"} == get_friends_movies(sonyas_data)
+    assert "Another Title" not in index
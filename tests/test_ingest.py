@@ -0,0 +1,79 @@
+import io
+import json
+import pytest
+from viewing_party.party import *
+from viewing_party.ingest import IngestReport, iter_user_records, main, run_pipeline
+from tests.test_constants import *
+
+
+def make_lines():
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["id"] = "sonya"
+    broken_data = clean_wave_5_data()
+    broken_data["watched"].append({"title": "", "genre": "Horror", "rating": 3.0})
+    broken_data["friends"][0]["watched"].append({"title": "Title A", "genre": None, "rating": 3.0})
+    return [
+        json.dumps(sonyas_data),
+        "",
+        "not json",
+        json.dumps(broken_data),
+        json.dumps(["not", "a", "record"]),
+        json.dumps({"watched": [HORROR_1b]}),
+    ]
+
+
+def test_iter_user_records_validates_movies():
+    # Arrange
+    report = IngestReport()
+
+    # Act
+    records = list(iter_user_records(make_lines(), report))
+
+    # Assert
+    assert len(records) == 3
+    assert records[1]["watched"] == clean_wave_5_data()["watched"]
+    assert records[1]["friends"] == clean_wave_5_data()["friends"]
+    assert records[2]["friends"] == []
+    assert records[2]["subscriptions"] == []
+    assert report.bad_lines == 2
+    assert report.rejected_movies == 2
+
+
+def test_iter_user_records_strict():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        list(iter_user_records(make_lines(), strict=True))
+
+
+def test_run_pipeline_writes_json_lines():
+    # Arrange
+    output = io.StringIO()
+
+    # Act
+    report = run_pipeline(make_lines(), output, get_new_rec_by_genre)
+
+    # Assert
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert results == [
+        {"id": "sonya", "recommendations": [FANTASY_4b]},
+        {"id": 4, "recommendations": [FANTASY_4b]},
+        {"id": 6, "recommendations": []},
+    ]
+    assert report.records == 3
+    assert report.records_per_second > 0
+
+
+def test_ingest_main(tmp_path, capsys):
+    # Arrange
+    source = tmp_path / "users.jsonl"
+    target = tmp_path / "recs.jsonl"
+    source.write_text("\n".join(make_lines()))
+
+    # Act
+    report = main([str(source), str(target), "--recommender", "rec_from_favorites"])
+
+    # Assert
+    first = json.loads(target.read_text().splitlines()[0])
+    assert first["recommendations"] == get_rec_from_favorites(clean_wave_5_data())
+    assert report.records == 3
+    assert "records/sec" in capsys.readouterr().err
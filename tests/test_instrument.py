@@ -0,0 +1,87 @@
+import pytest
+from viewing_party import party
+from viewing_party.party import *
+from viewing_party.instrument import Instrumentation
+from tests.test_constants import *
+
+
+@pytest.fixture
+def instrumentation():
+    instrumentation = Instrumentation()
+    yield instrumentation
+    instrumentation.disable()
+
+
+def test_disabled_instrumentation_leaves_functions_alone(instrumentation):
+    # Arrange
+    original = party.get_available_recs
+
+    # Act
+    instrumentation.enable()
+    wrapped = party.get_available_recs
+    instrumentation.disable()
+
+    # Assert
+    assert wrapped is not original
+    assert party.get_available_recs is original
+    assert instrumentation.snapshot() == {}
+
+
+def test_instrumentation_counts_calls_and_input_sizes(instrumentation):
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+
+    # Act
+    with instrumentation:
+        party.get_available_recs(sonyas_data)
+        party.get_available_recs(sonyas_data)
+        list(party.iter_rec_from_favorites(sonyas_data))
+    snapshot = instrumentation.snapshot()
+
+    # Assert
+    assert snapshot["get_available_recs"]["calls"] == 2
+    assert snapshot["get_available_recs"]["input"] == {
+        "watched": 12,
+        "friends": 4,
+        "friend_movies": 18
+    }
+    assert snapshot["iter_rec_from_favorites"]["calls"] == 1
+    assert snapshot["get_available_recs"]["seconds"] > 0
+    assert set(snapshot["get_available_recs"]["percentiles"]) == {"0.5", "0.9", "0.99"}
+
+
+def test_instrumented_functions_return_the_same_results(instrumentation):
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    expected = get_new_rec_by_genre(sonyas_data)
+
+    # Act
+    with instrumentation:
+        recommendations = party.get_new_rec_by_genre(sonyas_data)
+
+    # Assert
+    assert recommendations == expected
+    assert instrumentation.snapshot()["get_most_watched_genre"]["calls"] == 1
+
+
+def test_instrumentation_prometheus_text(instrumentation):
+    # Act
+    with instrumentation:
+        party.create_movie(MOVIE_TITLE_1, GENRE_1, RATING_1)
+    text = instrumentation.prometheus_text()
+
+    # Assert
+    assert "# TYPE viewing_party_calls_total counter" in text
+    assert 'viewing_party_calls_total{function="create_movie"} 1' in text
+    assert 'viewing_party_latency_seconds_count{function="create_movie"} 1' in text
+    assert 'viewing_party_input_items_total{function="create_movie",kind="watched"} 0' in text
+
+
+def test_instrumentation_reset(instrumentation):
+    # Act
+    with instrumentation:
+        party.get_watched_avg_rating(clean_wave_2_data())
+    instrumentation.reset()
+
+    # Assert
+    assert instrumentation.snapshot() == {}
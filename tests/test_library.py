@@ -0,0 +1,225 @@
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+
+def test_user_library_indexes_existing_lists():
+    # Arrange
+    janes_data = clean_wave_5_data()
+
+    # Act
+    library = UserLibrary(janes_data)
+
+    # Assert
+    assert isinstance(library["watched"], MovieList)
+    assert isinstance(library["watchlist"], MovieList)
+    assert library["watched"] == janes_data["watched"]
+    assert library["friends"] == janes_data["friends"]
+    assert library.has_watched(FANTASY_1b["title"])
+    assert not library.has_watched(HORROR_1b["title"])
+
+
+def test_watch_movie_moves_title_in_user_library():
+    # Arrange
+    library = UserLibrary({
+        "watchlist": [FANTASY_1, HORROR_1, INTRIGUE_1],
+        "watched": [FANTASY_2]
+    })
+
+    # Act
+    updated_data = watch_movie(library, HORROR_1["title"])
+
+    # Assert
+    assert updated_data is library
+    assert updated_data["watchlist"] == [FANTASY_1, INTRIGUE_1]
+    assert updated_data["watched"] == [FANTASY_2, HORROR_1]
+    assert library.has_watched(HORROR_1["title"])
+    assert not library.in_watchlist(HORROR_1["title"])
+
+
+def test_watch_movie_in_user_library_ignores_missing_title():
+    # Arrange
+    library = UserLibrary({
+        "watchlist": [FANTASY_1],
+        "watched": [FANTASY_2]
+    })
+
+    # Act
+    updated_data = watch_movie(library, "Non-Existent Movie Title")
+
+    # Assert
+    assert len(updated_data["watchlist"]) == 1
+    assert len(updated_data["watched"]) == 1
+
+
+def test_add_to_watched_in_user_library():
+    # Arrange
+    library = UserLibrary()
+
+    # Act
+    updated_data = add_to_watched(library, HORROR_1)
+    updated_data = add_to_watchlist(updated_data, FANTASY_1)
+
+    # Assert
+    assert updated_data["watched"][0] == HORROR_1
+    assert HORROR_1 in updated_data["watched"]
+    assert FANTASY_1 in updated_data["watchlist"]
+    assert library.has_watched(HORROR_1["title"])
+
+
+def test_movie_list_remove_missing_movie_raises():
+    # Arrange
+    movies = MovieList([FANTASY_1])
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        movies.remove(HORROR_1)
+
+
+def test_recommenders_accept_user_library():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    library = UserLibrary(clean_wave_5_data())
+
+    # Act / Assert
+    assert get_unique_watched(library) == get_unique_watched(sonyas_data)
+    assert get_friends_unique_watched(library) == get_friends_unique_watched(sonyas_data)
+    assert get_available_recs(library) == get_available_recs(sonyas_data)
+    assert get_new_rec_by_genre(library) == get_new_rec_by_genre(sonyas_data)
+    assert get_rec_from_favorites(library) == get_rec_from_favorites(sonyas_data)
+
+
+def test_user_library_aggregates_match_wave_2():
+    # Arrange
+    janes_data = clean_wave_2_data()
+    library = UserLibrary(clean_wave_2_data())
+
+    # Act / Assert
+    assert get_watched_avg_rating(library) == get_watched_avg_rating(janes_data)
+    assert get_most_watched_genre(library) == get_most_watched_genre(janes_data)
+    assert get_most_watched_genre(UserLibrary(clean_wave_2b_data())) == "Fantasy"
+
+
+def test_user_library_aggregates_follow_mutations():
+    # Arrange
+    library = UserLibrary({"watched": [], "watchlist": [ACTION_2]})
+
+    # Act
+    add_to_watched(library, INTRIGUE_1)
+    add_to_watched(library, FANTASY_1)
+    add_to_watched(library, FANTASY_2)
+    add_to_watched(library, INTRIGUE_2)
+    watch_movie(library, ACTION_2["title"])
+
+    # Assert
+    assert get_watched_avg_rating(library) == pytest.approx(3.9)
+    # Intrigue and Fantasy are tied; Intrigue was watched first
+    assert get_most_watched_genre(library) == "Intrigue"
+
+
+def test_user_library_aggregates_after_remove():
+    # Arrange
+    library = UserLibrary({"watched": [INTRIGUE_1, FANTASY_1, FANTASY_2]})
+
+    # Act
+    library["watched"].remove(FANTASY_1)
+    library["watched"].remove(FANTASY_2)
+
+    # Assert
+    assert get_most_watched_genre(library) == "Intrigue"
+    assert get_watched_avg_rating(library) == pytest.approx(2.0)
+
+
+def test_user_library_aggregates_when_empty():
+    # Arrange
+    library = UserLibrary()
+
+    # Act / Assert
+    assert get_watched_avg_rating(library) == 0
+    assert get_most_watched_genre(library) is None
+
+
+def test_user_library_keeps_duplicate_titles():
+    # Arrange
+    janes_data = {
+        "watched": [HORROR_1, HORROR_1, FANTASY_1],
+        "watchlist": [INTRIGUE_1, dict(INTRIGUE_1, rating=1.0), ACTION_1],
+        "friends": [{"watched": [HORROR_1]}],
+        "subscriptions": [],
+    }
+    library = UserLibrary(janes_data)
+
+    # Act / Assert
+    assert library["watched"] == janes_data["watched"]
+    assert library["watchlist"] == janes_data["watchlist"]
+    assert get_watched_avg_rating(library) == pytest.approx(get_watched_avg_rating(janes_data))
+    assert get_most_watched_genre(library) == get_most_watched_genre(janes_data)
+    assert get_unique_watched(library) == get_unique_watched(janes_data)
+
+
+def test_user_library_duplicate_titles_follow_mutations():
+    # Arrange
+    janes_data = {
+        "watched": [HORROR_1],
+        "watchlist": [INTRIGUE_1, dict(INTRIGUE_1, rating=1.0), ACTION_1],
+    }
+    library = UserLibrary(janes_data)
+
+    # Act
+    for user_data in (janes_data, library):
+        add_to_watched(user_data, dict(HORROR_1, rating=1.0))
+        watch_movie(user_data, INTRIGUE_1["title"])
+        watch_movie(user_data, INTRIGUE_1["title"])
+        user_data["watched"].remove(HORROR_1)
+
+    # Assert
+    assert library["watched"] == janes_data["watched"]
+    assert library["watchlist"] == janes_data["watchlist"] == [ACTION_1]
+    assert get_watched_avg_rating(library) == pytest.approx(get_watched_avg_rating(janes_data))
+    assert library.has_watched(HORROR_1["title"])
+
+
+def test_rejected_append_leaves_user_library_unchanged():
+    # Arrange
+    library = UserLibrary({"watched": [HORROR_1]})
+    version = library.version
+
+    # Act / Assert
+    with pytest.raises(KeyError):
+        add_to_watched(library, {"title": "x", "genre": "g"})
+    with pytest.raises(TypeError):
+        add_to_watched(library, {"title": "x", "genre": ["g"], "rating": 1.0})
+
+    assert library["watched"] == [HORROR_1]
+    assert not library.has_watched("x")
+    assert library.version == version
+    assert get_watched_avg_rating(library) == HORROR_1["rating"]
+    assert get_most_watched_genre(library) == HORROR_1["genre"]
+
+
+def test_rejected_watch_movie_keeps_watchlist_entry():
+    # Arrange
+    unrated = {"title": "x", "genre": "g"}
+    library = UserLibrary({"watchlist": [unrated]})
+
+    # Act / Assert
+    with pytest.raises(KeyError):
+        watch_movie(library, "x")
+
+    assert library["watchlist"] == [unrated]
+    assert library["watched"] == []
+
+
+def test_get_user_movies_returns_a_set_for_user_library():
+    # Arrange
+    library = UserLibrary({"watched": [FANTASY_1, HORROR_1]})
+
+    # Act
+    titles = get_user_movies(library)
+    add_to_watched(library, INTRIGUE_1)
+    titles.add("Another Title")
+
+    # Assert
+    assert isinstance(titles, set)
+    assert titles == {FANTASY_1["title"], HORROR_1["title"], "Another Title"}
+    assert not library.has_watched("Another Title")
@@ -0,0 +1,65 @@
+import pickle
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+
+def test_create_compact_movie():
+    # Act
+    new_movie = create_movie(MOVIE_TITLE_1, GENRE_1, RATING_1, compact=True)
+
+    # Assert
+    assert isinstance(new_movie, Movie)
+    assert new_movie["title"] == MOVIE_TITLE_1
+    assert new_movie["genre"] == GENRE_1
+    assert new_movie["rating"] == pytest.approx(RATING_1)
+    assert new_movie == HORROR_1
+    assert new_movie.get("host") is None
+
+
+def test_create_compact_movie_rejects_missing_fields():
+    # Act / Assert
+    assert create_movie(None, GENRE_1, RATING_1, compact=True) is None
+    assert create_movie(MOVIE_TITLE_1, "", RATING_1, compact=True) is None
+
+
+def test_movie_interns_genre_and_host():
+    # Arrange
+    genre = "".join(["Hor", "ror"])
+    host = "".join(["net", "flix"])
+
+    # Act
+    first = Movie("Title A", genre, 3.0, host)
+    second = Movie("Title B", "Horror", 4.0, "netflix")
+
+    # Assert
+    assert first.genre is second.genre
+    assert first.host is second.host
+
+
+def test_compact_movies_work_with_recommenders():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    compact_data = clean_wave_5_data()
+    compact_data["watched"] = [Movie.from_dict(movie) for movie in compact_data["watched"]]
+    for friend in compact_data["friends"]:
+        friend["watched"] = [Movie.from_dict(movie) for movie in friend["watched"]]
+
+    # Act / Assert
+    assert get_watched_avg_rating(compact_data) == get_watched_avg_rating(sonyas_data)
+    assert get_unique_watched(compact_data) == get_unique_watched(sonyas_data)
+    assert get_available_recs(compact_data) == get_available_recs(sonyas_data)
+    assert get_new_rec_by_genre(compact_data) == get_new_rec_by_genre(sonyas_data)
+    assert get_rec_from_favorites(compact_data) == get_rec_from_favorites(sonyas_data)
+    assert FANTASY_4b in compact_data["friends"][0]["watched"]
+
+
+def test_movie_round_trips():
+    # Arrange
+    movie = Movie.from_dict(HORROR_1b)
+
+    # Act / Assert
+    assert movie.to_dict() == HORROR_1b
+    assert pickle.loads(pickle.dumps(movie)) == movie
+    with pytest.raises(KeyError):
+        Movie.from_dict(HORROR_1)["host"]
@@ -0,0 +1,63 @@
+import pytest
+from viewing_party.party import *
+from viewing_party.parallel import run_parallel
+from tests.test_constants import *
+
+
+def make_population(user_count):
+    sonyas_data = clean_wave_5_data()
+    registry = {
+        0: sonyas_data["friends"][0],
+        1: sonyas_data["friends"][1],
+        2: {"watched": [ACTION_2b, ACTION_3b, INTRIGUE_2b, HORROR_1b]},
+    }
+
+    users = []
+    for number in range(user_count):
+        user_data = clean_wave_5_data()
+        user_data["friends"] = [number % 3, (number + 1) % 3][:number % 3]
+        user_data["watched"] = user_data["watched"][number % 4:]
+        users.append(user_data)
+
+    return users, registry
+
+
+def serial_results(users, registry):
+    results = []
+    for user_data in users:
+        resolved = dict(user_data, friends=[registry[friend] for friend in user_data["friends"]])
+        results.append({
+            "available_recs": get_available_recs(resolved),
+            "new_rec_by_genre": get_new_rec_by_genre(resolved),
+        })
+    return results
+
+
+def test_deterministic_run_matches_serial_functions():
+    # Arrange
+    users, registry = make_population(20)
+
+    # Act
+    results = list(run_parallel(users, registry, chunksize=3, deterministic=True))
+
+    # Assert
+    assert results == serial_results(users, registry)
+
+
+def test_process_pool_run_matches_serial_functions():
+    # Arrange
+    users, registry = make_population(50)
+
+    # Act
+    results = list(run_parallel(iter(users), registry, max_workers=2, chunksize=4))
+
+    # Assert
+    assert results == serial_results(users, registry)
+
+
+def test_run_parallel_validates_arguments():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        list(run_parallel([], {}, chunksize=0))
+    with pytest.raises(ValueError):
+        list(run_parallel([], {}, recommenders=("favorites",)))
@@ -0,0 +1,73 @@
+import pytest
+from viewing_party.party import *
+from viewing_party.ranking import *
+from tests.test_constants import *
+
+
+def test_top_available_recs_by_rating():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["subscriptions"].append("disney+")
+
+    # Act
+    recommendations = get_top_available_recs(sonyas_data, 2)
+
+    # Assert
+    assert recommendations == [FANTASY_4b, HORROR_1b]
+    assert sonyas_data["subscriptions"] == ["netflix", "hulu", "disney+"]
+
+
+def test_top_friends_unique_watched_by_popularity():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+
+    # Act
+    recommendations = get_top_friends_unique_watched(sonyas_data, 1, key="popularity")
+
+    # Assert
+    # FANTASY_4b is the only one both friends watched
+    assert recommendations == [FANTASY_4b]
+
+
+def test_top_k_combined_breaks_popularity_ties_by_rating():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["watched"] = []
+    index = FriendIndex(sonyas_data)
+
+    # Act
+    recommendations = get_top_friends_unique_watched(sonyas_data, 3, key="combined", friend_index=index)
+
+    # Assert
+    assert recommendations == [FANTASY_1b, FANTASY_4b, FANTASY_3b]
+
+
+def test_top_k_keeps_candidate_order_for_ties():
+    # Arrange
+    movies = [FANTASY_2, FANTASY_3, FANTASY_4, HORROR_1]
+
+    # Act
+    best = top_k(movies, 3, key=lambda movie: movie["genre"] == "Fantasy")
+
+    # Assert
+    assert best == [FANTASY_2, FANTASY_3, FANTASY_4]
+
+
+def test_top_k_with_more_than_available():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+
+    # Act
+    recommendations = get_top_rec_from_favorites(sonyas_data, 10)
+
+    # Assert
+    assert recommendations == [INTRIGUE_2b, FANTASY_2b]
+    assert get_top_new_rec_by_genre(sonyas_data, 0) == []
+
+
+def test_top_k_rejects_unknown_key():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        top_k([HORROR_1], 1, key="title")
+    with pytest.raises(ValueError):
+        top_k([HORROR_1], 1, key="popularity")
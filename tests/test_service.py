@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from viewing_party.party import *
+from viewing_party.service import RecommendationService, StubProfileBackend
+from tests.test_constants import *
+
+
+def make_backend(**kwargs):
+    sonyas_data = clean_wave_5_data()
+    profiles = {
+        "alex": sonyas_data["friends"][0],
+        "sam": sonyas_data["friends"][1],
+        "kim": {"watched": [ACTION_2b, ACTION_3b]},
+    }
+    return StubProfileBackend(profiles, **kwargs)
+
+
+def make_record(friends=("alex", "sam")):
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["friends"] = list(friends)
+    return sonyas_data
+
+
+def test_service_matches_local_recommenders():
+    # Arrange
+    service = RecommendationService(make_backend())
+
+    async def recommend_both():
+        return (
+            await service.recommend(make_record()),
+            await service.recommend(make_record(), get_new_rec_by_genre),
+        )
+
+    # Act
+    recommendations, genre_recs = asyncio.run(recommend_both())
+
+    # Assert
+    assert recommendations == get_available_recs(clean_wave_5_data())
+    assert genre_recs == get_new_rec_by_genre(clean_wave_5_data())
+
+
+def test_service_fetches_friends_concurrently():
+    # Arrange
+    backend = make_backend(latency=0.05)
+    service = RecommendationService(backend, concurrency=8)
+
+    # Act
+    asyncio.run(service.recommend(make_record(("alex", "sam", "kim"))))
+
+    # Assert
+    assert backend.max_in_flight == 3
+
+
+def test_service_limits_concurrency():
+    # Arrange
+    backend = make_backend(latency=0.01)
+    service = RecommendationService(backend, concurrency=1)
+
+    # Act
+    asyncio.run(service.recommend(make_record(("alex", "sam", "kim"))))
+
+    # Assert
+    assert backend.max_in_flight == 1
+
+
+def test_service_coalesces_shared_friends():
+    # Arrange
+    backend = make_backend(latency=0.02)
+    service = RecommendationService(backend)
+    records = [make_record(), make_record(("sam", "kim")), make_record(("alex",))]
+
+    # Act
+    results = asyncio.run(service.recommend_many(records))
+
+    # Assert
+    assert backend.fetches == 3
+    assert service.coalesced == 2
+    assert results[0] == get_available_recs(clean_wave_5_data())
+
+
+def test_service_skips_slow_and_missing_friends():
+    # Arrange
+    backend = make_backend(latencies={"kim": 1.0})
+    service = RecommendationService(backend, timeout=0.05)
+    record = make_record(("alex", "kim", "nobody"))
+
+    # Act
+    user_data = asyncio.run(service.assemble(record))
+
+    # Assert
+    assert user_data["friends"] == [clean_wave_5_data()["friends"][0], {"watched": []}, {"watched": []}]
+    assert sorted(service.failures) == ["kim", "nobody"]
+
+
+def test_service_keeps_a_bounded_list_of_failures():
+    # Arrange
+    service = RecommendationService(make_backend(), max_failures=2)
+    record = make_record(("nobody-1", "nobody-2", "alex", "nobody-3"))
+
+    # Act
+    asyncio.run(service.assemble(record))
+
+    # Assert
+    assert service.failed == 3
+    assert len(service.failures) == 2
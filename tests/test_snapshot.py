@@ -0,0 +1,124 @@
+import pytest
+from viewing_party.party import *
+from viewing_party.snapshot import SnapshotReader, write_snapshot
+from tests.test_constants import *
+
+
+def make_population():
+    sonyas_data = clean_wave_5_data()
+    registry = {"kim": {"watched": [ACTION_2b, HORROR_1b, INTRIGUE_3b]}}
+    return [
+        sonyas_data,
+        {"watched": [], "friends": [sonyas_data["friends"][1], "kim"], "subscriptions": ["disney+"]},
+        {"watched": [HORROR_1, INTRIGUE_1b], "favorites": [HORROR_1], "friends": ["kim"]},
+    ], registry
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    users, registry = make_population()
+    path = tmp_path / "users.snap"
+    write_snapshot(path, users, registry)
+    return path
+
+
+def test_snapshot_recommenders_match_party(snapshot_path):
+    # Arrange
+    users, registry = make_population()
+
+    # Act
+    with SnapshotReader(snapshot_path) as reader:
+        # Assert
+        assert len(reader) == 3
+        for user, user_data in enumerate(users):
+            resolved = dict(user_data, friends=[
+                friend if isinstance(friend, dict) else registry[friend]
+                for friend in user_data["friends"]
+            ])
+            resolved.setdefault("favorites", [])
+            resolved.setdefault("subscriptions", [])
+            assert reader.get_watched_avg_rating(user) == get_watched_avg_rating(resolved)
+            assert reader.get_most_watched_genre(user) == get_most_watched_genre(resolved)
+            assert reader.get_unique_watched(user) == get_unique_watched(resolved)
+            assert reader.get_friends_unique_watched(user) == get_friends_unique_watched(resolved)
+            assert reader.get_available_recs(user) == get_available_recs(resolved)
+            assert reader.get_new_rec_by_genre(user) == get_new_rec_by_genre(resolved)
+            assert reader.get_rec_from_favorites(user) == get_rec_from_favorites(resolved)
+
+
+def test_snapshot_load_user(snapshot_path):
+    # Act
+    with SnapshotReader(snapshot_path) as reader:
+        sonyas_data = reader.load_user(0)
+
+    # Assert
+    assert sonyas_data == clean_wave_5_data()
+
+
+def test_snapshot_stores_shared_friends_once(snapshot_path):
+    # Act
+    with SnapshotReader(snapshot_path) as reader:
+        row_count = reader.row_count
+        friend_rows = [list(reader.friends(user)) for user in range(len(reader))]
+
+    # Assert
+    assert row_count == 6
+    assert friend_rows == [[3, 4], [4, 5], [5]]
+
+
+def test_snapshot_numpy_column(snapshot_path):
+    # Arrange
+    np = pytest.importorskip("numpy")
+
+    # Act
+    with SnapshotReader(snapshot_path) as reader:
+        ratings = reader.numpy_column("movie_ratings").copy()
+        expected = list(reader.columns["movie_ratings"])
+
+    # Assert
+    assert ratings.dtype == np.float64
+    assert ratings.tolist() == expected
+
+
+def test_snapshot_closes_while_results_are_alive(snapshot_path):
+    # Act
+    with SnapshotReader(snapshot_path) as reader:
+        watched = reader.watched(0)
+        friends = reader.friends(0)
+        expected = list(reader.columns["watched"][:len(watched)])
+
+    # Assert
+    assert watched == expected
+    assert friends == [3, 4]
+
+
+def test_snapshot_closes_while_numpy_column_is_alive(snapshot_path):
+    # Arrange
+    pytest.importorskip("numpy")
+    reader = SnapshotReader(snapshot_path)
+    ratings = reader.numpy_column("movie_ratings")
+    expected = list(reader.columns["movie_ratings"])
+
+    # Act
+    reader.close()
+    reader.close()
+
+    # Assert
+    assert ratings.tolist() == expected
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    # Arrange
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"x" * 64)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        SnapshotReader(path)
+
+
+def test_snapshot_rejects_unknown_user(snapshot_path):
+    # Act / Assert
+    with SnapshotReader(snapshot_path) as reader:
+        with pytest.raises(IndexError):
+            reader.get_available_recs(3)
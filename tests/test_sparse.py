@@ -0,0 +1,68 @@
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+np = pytest.importorskip("numpy")
+
+from viewing_party.sparse import SparseWatched
+
+
+def make_population():
+    amandas_data = clean_wave_3_data()
+    shared_friend = amandas_data["friends"][1]
+    return [
+        amandas_data,
+        {"watched": [], "friends": [shared_friend]},
+        {"watched": [HORROR_1, FANTASY_4], "friends": []},
+        {"watched": [INTRIGUE_3, ACTION_1, INTRIGUE_3], "friends": [shared_friend, {"watched": [ACTION_2]}]},
+    ]
+
+
+def test_sparse_unique_watched_matches_party():
+    # Arrange
+    users = make_population()
+
+    # Act
+    unique_watched = SparseWatched.from_users(users).get_unique_watched()
+
+    # Assert
+    assert unique_watched == [get_unique_watched(user_data) for user_data in users]
+
+
+def test_sparse_friends_unique_watched_matches_party():
+    # Arrange
+    users = make_population()
+
+    # Act
+    friends_unique = SparseWatched.from_users(users).get_friends_unique_watched()
+
+    # Assert
+    assert friends_unique == [get_friends_unique_watched(user_data) for user_data in users]
+
+
+def test_sparse_friend_union_and_shared_rows():
+    # Arrange
+    users = make_population()
+
+    # Act
+    matrix = SparseWatched.from_users(users)
+    indptr, movie_ids = matrix.friend_union()
+
+    # Assert
+    # four users plus three distinct friends
+    assert len(matrix.indptr) == 8
+    assert indptr.tolist() == [0, 7, 11, 11, 16]
+    assert matrix.decode(indptr, movie_ids)[1] == [FANTASY_1, ACTION_1, INTRIGUE_1, INTRIGUE_3]
+
+
+def test_sparse_with_registry_ids():
+    # Arrange
+    registry = {"sam": {"watched": [FANTASY_1, HORROR_1]}}
+    users = [{"watched": [FANTASY_1, FANTASY_2], "friends": ["sam"]}]
+
+    # Act
+    matrix = SparseWatched.from_users(users, registry)
+
+    # Assert
+    assert matrix.get_unique_watched() == [[FANTASY_2]]
+    assert matrix.get_friends_unique_watched() == [[HORROR_1]]
@@ -0,0 +1,109 @@
+import pytest
+from viewing_party.party import *
+from viewing_party.store import SQLiteStore
+from tests.test_constants import *
+
+
+@pytest.fixture
+def store():
+    with SQLiteStore() as store:
+        yield store
+
+
+def test_store_recommenders_match_party(store):
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+
+    # Act
+    user_id = store.add_user(sonyas_data)
+
+    # Assert
+    assert store.get_watched_avg_rating(user_id) == pytest.approx(get_watched_avg_rating(sonyas_data))
+    assert store.get_most_watched_genre(user_id) == get_most_watched_genre(sonyas_data)
+    assert store.get_unique_watched(user_id) == get_unique_watched(sonyas_data)
+    assert store.get_friends_unique_watched(user_id) == get_friends_unique_watched(sonyas_data)
+    assert store.get_available_recs(user_id) == get_available_recs(sonyas_data)
+    assert store.get_new_rec_by_genre(user_id) == get_new_rec_by_genre(sonyas_data)
+    assert store.get_rec_from_favorites(user_id) == get_rec_from_favorites(sonyas_data)
+
+
+def test_store_round_trips_user_data(store):
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["watchlist"] = [HORROR_1b]
+
+    # Act
+    user_id = store.add_user(sonyas_data)
+
+    # Assert
+    assert store.load_user(user_id) == sonyas_data
+
+
+def test_store_shares_friend_rows(store):
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    for friend_id, friend in enumerate(sonyas_data["friends"], 100):
+        friend["id"] = friend_id
+    other_data = {"watched": [], "friends": sonyas_data["friends"]}
+
+    # Act
+    store.add_user(sonyas_data)
+    other_id = store.add_user(other_data)
+
+    # Assert
+    assert store.connection.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 4
+    assert store.get_friends_unique_watched(other_id) == get_friends_unique_watched(other_data)
+
+
+def test_store_shares_friend_dicts_without_id_within_one_user(store):
+    # Arrange
+    friend = {"watched": [HORROR_1b]}
+    sonyas_data = {"watched": [], "friends": [friend, friend]}
+
+    # Act
+    user_id = store.add_user(sonyas_data)
+    store.add_user({"watched": [], "friends": [friend]})
+
+    # Assert
+    assert store.connection.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 4
+    assert store.load_user(user_id)["friends"] == [friend, friend]
+
+
+def test_store_failed_add_user_leaves_nothing_behind(store):
+    # Arrange
+    bad_data = {"watched": [FANTASY_1, {"title": "B"}], "friends": [{"id": 7, "watched": [HORROR_1]}]}
+
+    # Act
+    with pytest.raises(KeyError):
+        store.add_user(bad_data)
+    user_id = store.add_user({"watched": [FANTASY_1], "friends": [{"id": 7, "watched": [HORROR_1]}]})
+
+    # Assert
+    assert store.get_movies("watched", user_id) == [FANTASY_1]
+    assert store.get_friends_unique_watched(user_id) == [HORROR_1]
+
+
+def test_store_mutations(store):
+    # Arrange
+    user_id = store.add_user({"watched": [FANTASY_2], "watchlist": [FANTASY_1, HORROR_1]})
+
+    # Act
+    store.watch_movie(user_id, HORROR_1["title"])
+    store.watch_movie(user_id, "Non-Existent Movie Title")
+    store.add_to_watchlist(user_id, INTRIGUE_1)
+    store.add_to_watched(user_id, ACTION_1)
+
+    # Assert
+    assert store.get_movies("watchlist", user_id) == [FANTASY_1, INTRIGUE_1]
+    assert store.get_movies("watched", user_id) == [FANTASY_2, HORROR_1, ACTION_1]
+
+
+def test_store_empty_user(store):
+    # Arrange
+    user_id = store.add_user({})
+
+    # Act / Assert
+    assert store.get_watched_avg_rating(user_id) == 0
+    assert store.get_most_watched_genre(user_id) is None
+    assert store.get_new_rec_by_genre(user_id) == []
+    assert store.get_available_recs(user_id) == []
@@ -0,0 +1,59 @@
+import itertools
+import pytest
+from viewing_party.party import *
+from tests.test_constants import *
+
+
+class ExplodingList:
+    def __iter__(self):
+        raise AssertionError("friend should not have been scanned")
+
+
+def test_iter_recommenders_match_list_versions():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+
+    # Act / Assert
+    assert list(iter_friends_unique_watched(sonyas_data)) == get_friends_unique_watched(sonyas_data)
+    assert list(iter_available_recs(sonyas_data)) == get_available_recs(sonyas_data)
+    assert list(iter_new_rec_by_genre(sonyas_data)) == get_new_rec_by_genre(sonyas_data)
+    assert list(iter_rec_from_favorites(sonyas_data)) == get_rec_from_favorites(sonyas_data)
+    assert sonyas_data == clean_wave_5_data()
+
+
+def test_iter_friends_unique_watched_stops_early():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["friends"].append({"watched": ExplodingList()})
+
+    # Act
+    recommendations = list(itertools.islice(iter_friends_unique_watched(sonyas_data), 2))
+
+    # Assert
+    assert recommendations == [FANTASY_4b, HORROR_1b]
+
+
+def test_iter_available_recs_stops_early():
+    # Arrange
+    sonyas_data = clean_wave_5_data()
+    sonyas_data["friends"].append({"watched": ExplodingList()})
+
+    # Act
+    recommendations = list(itertools.islice(iter_available_recs(sonyas_data), 1))
+
+    # Assert
+    assert recommendations == [FANTASY_4b]
+
+
+def test_iter_new_rec_by_genre_is_empty_without_watched():
+    # Arrange
+    sonyas_data = {
+        "watched": [],
+        "friends": [{"watched": ExplodingList()}]
+    }
+
+    # Act
+    recommendations = list(iter_new_rec_by_genre(sonyas_data))
+
+    # Assert
+    assert recommendations == []
@@ -0,0 +1,195 @@
+import sys
+import threading
+import pytest
+from viewing_party.party import *
+from viewing_party.threadsafe import ConcurrentUserLibrary, LibraryRegistry
+from tests.test_constants import *
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_watchlist_moves_lose_no_updates():
+    # Arrange
+    library = ConcurrentUserLibrary()
+    per_thread = 300
+
+    def work(number):
+        for index in range(per_thread):
+            movie = create_movie(f"Movie {number}-{index}", "Horror", 3.0)
+            library.add_to_watchlist(movie)
+            assert library.watch_movie(movie["title"])
+
+    # Act
+    run_threads(8, work)
+    snapshot = library.snapshot()
+
+    # Assert
+    assert len(snapshot["watched"]) == 8 * per_thread
+    assert len(snapshot["watchlist"]) == 0
+    assert get_most_watched_genre(snapshot) == "Horror"
+
+
+def test_each_title_moves_exactly_once():
+    # Arrange
+    library = ConcurrentUserLibrary({"watchlist": [FANTASY_1, FANTASY_2, HORROR_1]})
+    moved = []
+
+    def work(number):
+        for movie in (FANTASY_1, FANTASY_2, HORROR_1):
+            if library.watch_movie(movie["title"]):
+                moved.append(movie["title"])
+
+    # Act
+    run_threads(6, work)
+
+    # Assert
+    assert sorted(moved) == sorted([FANTASY_1["title"], FANTASY_2["title"], HORROR_1["title"]])
+    assert library.snapshot()["watched"] == [FANTASY_1, FANTASY_2, HORROR_1]
+
+
+def test_snapshots_are_consistent_while_writing():
+    # Arrange
+    library = ConcurrentUserLibrary({"friends": clean_wave_5_data()["friends"], "subscriptions": ["netflix"]})
+    stop = threading.Event()
+    errors = []
+
+    def write(number):
+        for index in range(500):
+            library.add_to_watchlist(create_movie(f"Movie {index}", "Action", 4.0))
+            library.watch_movie(f"Movie {index}")
+        stop.set()
+
+    def read(number):
+        while not stop.is_set():
+            snapshot = library.snapshot()
+            watched_count = len(snapshot["watched"])
+            titles = [movie["title"] for movie in snapshot["watched"]]
+            if titles != [f"Movie {index}" for index in range(watched_count)]:
+                errors.append(titles)
+            if len(snapshot["watchlist"]) > 1:
+                errors.append(list(snapshot["watchlist"]))
+            get_available_recs(snapshot)
+            # A snapshot never changes once handed out.
+            if len(snapshot["watched"]) != watched_count:
+                errors.append(snapshot)
+
+    threads = [threading.Thread(target=write, args=(0,))]
+    threads += [threading.Thread(target=read, args=(number,)) for number in range(3)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert errors == []
+    assert len(library.snapshot()["watched"]) == 500
+
+
+def test_snapshot_is_shared_until_next_write():
+    # Arrange
+    library = ConcurrentUserLibrary({"watched": [FANTASY_1]})
+
+    # Act
+    first = library.snapshot()
+    second = library.snapshot()
+    library.add_to_watched(HORROR_1)
+    third = library.snapshot()
+
+    # Assert
+    assert first is second
+    assert third is not first
+    assert first["watched"] == [FANTASY_1]
+    assert third["watched"] == [FANTASY_1, HORROR_1]
+
+
+def test_snapshot_does_not_wait_for_writers():
+    # Arrange
+    library = ConcurrentUserLibrary({"watched": [FANTASY_1]})
+    library.add_to_watched(HORROR_1)
+    snapshots = []
+
+    # Act
+    with library._lock:
+        # A writer holds the lock; the reader still gets a snapshot.
+        reader = threading.Thread(target=lambda: snapshots.append(library.snapshot()))
+        reader.start()
+        reader.join(timeout=5)
+
+    # Assert
+    assert snapshots[0]["watched"] == [FANTASY_1, HORROR_1]
+
+
+def read_aggregates_concurrently(make_snapshot, rounds=20, thread_count=4):
+    results = set()
+
+    # Switch threads often and start the readers together, so that readers
+    # writing to a shared snapshot would race.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(rounds):
+            snapshot = make_snapshot()
+            barrier = threading.Barrier(thread_count)
+
+            def read(number):
+                barrier.wait()
+                results.add((get_watched_avg_rating(snapshot), get_most_watched_genre(snapshot)))
+
+            run_threads(thread_count, read)
+    finally:
+        sys.setswitchinterval(interval)
+    return results
+
+
+def test_snapshot_aggregates_after_rewatch_are_safe_to_share():
+    # Arrange
+    def make_snapshot():
+        library = ConcurrentUserLibrary({
+            "watched": [create_movie(f"Movie {index}", "Horror", 3.0) for index in range(3000)]
+        })
+        library.add_to_watched(create_movie("Movie 0", "Horror", 3.0))
+        return library.snapshot()
+
+    # Act
+    results = read_aggregates_concurrently(make_snapshot)
+
+    # Assert
+    assert results == {(3.0, "Horror")}
+
+
+def test_copied_watched_list_is_never_stale():
+    # Arrange
+    def make_snapshot():
+        library = UserLibrary({
+            "watched": [create_movie(f"Movie {index}", "Horror", 3.0) for index in range(3000)]
+        })
+        library["watched"].remove(library["watched"].get("Movie 0"))
+        return library.copy()
+
+    # Act
+    results = read_aggregates_concurrently(make_snapshot)
+
+    # Assert
+    assert results == {(3.0, "Horror")}
+
+
+def test_library_registry_creates_one_library_per_user():
+    # Arrange
+    registry = LibraryRegistry()
+    libraries = []
+
+    # Act
+    run_threads(8, lambda number: libraries.append(registry.get(number % 2, {"watched": [FANTASY_1]})))
+
+    # Assert
+    assert len(registry) == 2
+    assert len({id(library) for library in libraries}) == 2
+    assert 0 in registry
@@ -0,0 +1,228 @@
+from viewing_party.party import get_most_watched_genre, get_user_movies
+
+RECOMMENDERS = (
+    "unique_watched",
+    "friends_unique_watched",
+    "available_recs",
+    "new_rec_by_genre",
+)
+
+
+class FriendProfile:
+    """
+    A friend's watched list, preprocessed once for every user who lists them.
+
+    Attributes:
+        titles (frozenset): Every title the friend has watched.
+        movies (list): (title, host, movie) for the first movie with each
+            title, in watched order.
+        by_genre (dict): genre -> list of (title, movie) for the first movie
+            with each title in that genre, in watched order.
+    """
+
+    __slots__ = ("titles", "movies", "by_genre")
+
+    def __init__(self, friend):
+        movies = []
+        by_genre = {}
+        seen_titles = set()
+        seen_by_genre = {}
+
+        for movie in friend["watched"]:
+            title = movie["title"]
+            if title not in seen_titles:
+                seen_titles.add(title)
+                movies.append((title, movie.get("host"), movie))
+
+            genre = movie["genre"]
+            genre_titles = seen_by_genre.setdefault(genre, set())
+            if title not in genre_titles:
+                genre_titles.add(title)
+                by_genre.setdefault(genre, []).append((title, movie))
+
+        self.titles = frozenset(seen_titles)
+        self.movies = movies
+        self.by_genre = by_genre
+
+
+class BatchEngine:
+    """
+    Runs the Wave 3-5 recommenders over many users who share friends.
+
+    Each friend is turned into a FriendProfile the first time a user lists
+    them, and that profile is reused for later users. Results for each user
+    are identical to the single-user functions in party.py.
+
+    A user's ``friends`` may hold friend dicts, ids into ``friend_registry``,
+    or a mix of both. Profiles of registry ids are kept for the engine's
+    lifetime; friends are assumed not to change, so call forget() if one
+    does. Profiles of friend dicts are only shared within one chunk of users
+    (see run and recommend_chunk), so memory doesn't grow with the number
+    of friend dicts an engine has seen.
+
+    Args:
+        friend_registry (dict): friend id -> friend data with a 'watched' list.
+    """
+
+    def __init__(self, friend_registry=None):
+        self.friend_registry = friend_registry if friend_registry is not None else {}
+        self._profiles = {}
+
+    def profile(self, friend, scope=None):
+        """
+        Returns the FriendProfile for a friend dict or registry id.
+
+        Args:
+            friend: A friend dict or an id into friend_registry.
+            scope (dict): Optional cache for friend dicts, shared by the
+                calls that pass the same scope and dropped with it.
+        """
+        if isinstance(friend, dict):
+            if scope is None:
+                return FriendProfile(friend)
+            cached = scope.get(id(friend))
+            if cached is None:
+                # Keeping the dict in the scope stops its id being reused.
+                cached = scope[id(friend)] = (friend, FriendProfile(friend))
+            return cached[1]
+
+        profile = self._profiles.get(friend)
+        if profile is None:
+            profile = self._profiles[friend] = FriendProfile(self.friend_registry[friend])
+        return profile
+
+    def forget(self, friend_id):
+        """
+        Drops a registry friend's profile so they are re-read next time.
+        """
+        self._profiles.pop(friend_id, None)
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def resolve(self, user_data):
+        """
+        Returns a copy of user_data with registry ids replaced by friend data.
+
+        The copy can be passed to the single-user functions in party.py.
+        """
+        resolved = dict(user_data)
+        resolved["friends"] = [
+            friend if isinstance(friend, dict) else self.friend_registry[friend]
+            for friend in user_data["friends"]
+        ]
+        return resolved
+
+    def _profiles_for(self, user_data, scope=None):
+        if scope is None:
+            scope = {}
+        return [self.profile(friend, scope) for friend in user_data["friends"]]
+
+    def get_unique_watched(self, user_data, profiles=None):
+        if profiles is None:
+            profiles = self._profiles_for(user_data)
+
+        friends_watched_titles = set().union(*(profile.titles for profile in profiles))
+        return [
+            movie
+            for movie in user_data["watched"]
+            if movie["title"] not in friends_watched_titles
+        ]
+
+    def get_friends_unique_watched(self, user_data, profiles=None):
+        if profiles is None:
+            profiles = self._profiles_for(user_data)
+
+        user_watched_titles = get_user_movies(user_data)
+        unique_movies = []
+        added_titles = set()
+
+        for profile in profiles:
+            for title, host, movie in profile.movies:
+                if title not in user_watched_titles and title not in added_titles:
+                    added_titles.add(title)
+                    unique_movies.append(movie)
+
+        return unique_movies
+
+    def get_available_recs(self, user_data, profiles=None):
+        if profiles is None:
+            profiles = self._profiles_for(user_data)
+
+        subscriptions = set(user_data["subscriptions"])
+        user_watched_titles = get_user_movies(user_data)
+        recommended_movies = []
+        seen_titles = set()
+
+        for profile in profiles:
+            for title, host, movie in profile.movies:
+                if title in seen_titles or title in user_watched_titles:
+                    continue
+
+                seen_titles.add(title)
+                if host in subscriptions:
+                    recommended_movies.append(movie)
+
+        return recommended_movies
+
+    def get_new_rec_by_genre(self, user_data, profiles=None):
+        most_watched_genre = get_most_watched_genre(user_data)
+        if not most_watched_genre:
+            return []
+
+        if profiles is None:
+            profiles = self._profiles_for(user_data)
+
+        watched_titles = get_user_movies(user_data)
+        rec_movies = []
+        seen_titles = set()
+
+        for profile in profiles:
+            for title, movie in profile.by_genre.get(most_watched_genre, ()):
+                if title not in watched_titles and title not in seen_titles:
+                    seen_titles.add(title)
+                    rec_movies.append(movie)
+
+        return rec_movies
+
+    def recommend(self, user_data, recommenders=RECOMMENDERS, scope=None):
+        """
+        Returns a dict of recommender name -> result for one user.
+
+        Args:
+            user_data (dict): The user to recommend for.
+            recommenders (tuple): Names from RECOMMENDERS to run.
+            scope (dict): Optional friend-dict profile cache; see profile.
+        """
+        profiles = self._profiles_for(user_data, scope)
+        return {
+            name: getattr(self, f"get_{name}")(user_data, profiles)
+            for name in recommenders
+        }
+
+    def recommend_chunk(self, users, recommenders=RECOMMENDERS):
+        """
+        Returns recommend(user_data) for a list of users, sharing the
+        profiles of friend dicts between them.
+        """
+        scope = {}
+        return [self.recommend(user_data, recommenders, scope) for user_data in users]
+
+    def run(self, users, recommenders=RECOMMENDERS, chunksize=256):
+        """
+        Yields recommend(user_data) for every user, in order.
+
+        Args:
+            users (iterable): user_data records.
+            recommenders (tuple): Names from RECOMMENDERS to run.
+            chunksize (int): Users that share friend-dict profiles.
+        """
+        unknown = set(recommenders) - set(RECOMMENDERS)
+        if unknown:
+            raise ValueError(f"unknown recommenders: {sorted(unknown)}")
+
+        scope = {}
+        for number, user_data in enumerate(users, 1):
+            yield self.recommend(user_data, recommenders, scope)
+            if number % chunksize == 0:
+                scope = {}
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+
+from viewing_party.library import MovieList, UserLibrary
+from viewing_party.party import (
+    get_available_recs,
+    get_friends_unique_watched,
+    get_new_rec_by_genre,
+    get_unique_watched,
+)
+
+
+def _friend_version(friend):
+    watched = friend["watched"]
+    if isinstance(watched, MovieList):
+        return watched.version
+
+    # Plain lists carry no version; appending (add_to_watched, watch_movie)
+    # changes the length, which is the best signal available.
+    return (id(watched), len(watched))
+
+
+class RecommendationCache:
+    """
+    A bounded LRU cache for recommendations, invalidated by mutation version.
+
+    Entries are keyed by the recommender and the user. Each entry records the
+    user's version (see UserLibrary.version), their subscriptions and the
+    versions of their friends' watched lists; a lookup only hits when all of
+    them are unchanged. add_to_watched, add_to_watchlist and watch_movie bump
+    those versions, so mutating the user or one of their friends invalidates
+    the entry.
+
+    Only UserLibrary users can be versioned. Plain user_data dicts are always
+    recomputed and counted as bypasses.
+
+    Args:
+        maxsize (int): The most entries kept before the least recently used
+            one is evicted.
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypasses = 0
+
+    def _fingerprint(self, user_data):
+        return (
+            user_data.version,
+            tuple(user_data.get("subscriptions", ())),
+            tuple(
+                (id(friend), _friend_version(friend))
+                for friend in user_data.get("friends", ())
+            ),
+        )
+
+    def call(self, recommender, user_data):
+        """
+        Returns recommender(user_data), from the cache when it is still valid.
+
+        Args:
+            recommender (function): A recommender taking only user_data.
+            user_data (dict): The user to recommend for.
+
+        Returns:
+            list: A new list holding the recommended movies.
+        """
+        if not isinstance(user_data, UserLibrary):
+            self.bypasses += 1
+            return recommender(user_data)
+
+        key = (recommender, id(user_data))
+        fingerprint = self._fingerprint(user_data)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is user_data and entry[1] == fingerprint:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return list(entry[3])
+
+        self.misses += 1
+        result = recommender(user_data)
+
+        # Holding the user and friends keeps their ids from being reused
+        # while the entry is alive.
+        friends = tuple(user_data.get("friends", ()))
+        self._entries[key] = (user_data, fingerprint, friends, result)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return list(result)
+
+    def get_unique_watched(self, user_data):
+        return self.call(get_unique_watched, user_data)
+
+    def get_friends_unique_watched(self, user_data):
+        return self.call(get_friends_unique_watched, user_data)
+
+    def get_available_recs(self, user_data):
+        return self.call(get_available_recs, user_data)
+
+    def get_new_rec_by_genre(self, user_data):
+        return self.call(get_new_rec_by_genre, user_data)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        """
+        Returns the hit/miss/eviction counters and the current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bypasses": self.bypasses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self):
+        return len(self._entries)
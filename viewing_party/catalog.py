@@ -0,0 +1,174 @@
+class EncodedUser:
+    """
+    A user whose movies are stored as MovieCatalog ids.
+
+    Attributes:
+        watched (list): Ids of the watched movies, in order.
+        watchlist (list): Ids of the watchlist movies, in order.
+        favorites (list): Ids of the favorite movies, in order.
+        friends (list): One list of watched ids per friend.
+        subscriptions (frozenset): The user's streaming hosts.
+    """
+
+    __slots__ = ("watched", "watchlist", "favorites", "friends", "subscriptions")
+
+    def __init__(self, watched=(), watchlist=(), favorites=(), friends=(), subscriptions=()):
+        self.watched = list(watched)
+        self.watchlist = list(watchlist)
+        self.favorites = list(favorites)
+        self.friends = list(friends)
+        self.subscriptions = frozenset(subscriptions)
+
+
+class MovieCatalog:
+    """
+    Assigns every distinct movie a dense integer id.
+
+    Users are encoded once with encode_user; after that the recommenders
+    below do all of their set arithmetic on small ints instead of hashing
+    title strings or comparing whole dicts, and only turn ids back into
+    movies for the result.
+
+    A movie is identified by its title. The first movie added with a title is
+    the canonical one: its genre and host are used for filtering and it is
+    what decode returns. This matches the recommenders in party.py as long as
+    movies with the same title are equal, which holds for well-formed data;
+    in particular get_rec_from_favorites compares titles here rather than
+    whole movie dicts.
+    """
+
+    def __init__(self, movies=()):
+        self._ids = {}
+        self.movies = []
+        self.genres = []
+        self.hosts = []
+
+        for movie in movies:
+            self.add(movie)
+
+    def add(self, movie):
+        """
+        Returns the id for a movie, registering it if its title is new.
+        """
+        title = movie["title"]
+        movie_id = self._ids.get(title)
+        if movie_id is None:
+            movie_id = self._ids[title] = len(self.movies)
+            self.movies.append(movie)
+            self.genres.append(movie["genre"])
+            self.hosts.append(movie.get("host"))
+        return movie_id
+
+    def id_of(self, title):
+        """
+        Returns the id for a title, or None if the catalog doesn't have it.
+        """
+        return self._ids.get(title)
+
+    def title_of(self, movie_id):
+        return self.movies[movie_id]["title"]
+
+    def __len__(self):
+        return len(self.movies)
+
+    def __contains__(self, title):
+        return title in self._ids
+
+    def encode(self, movies):
+        add = self.add
+        return [add(movie) for movie in movies]
+
+    def decode(self, movie_ids):
+        movies = self.movies
+        return [movies[movie_id] for movie_id in movie_ids]
+
+    def encode_user(self, user_data, friend_cache=None):
+        """
+        Returns an EncodedUser for user_data.
+
+        Args:
+            user_data (dict): Any of 'watched', 'watchlist', 'favorites',
+                'friends' and 'subscriptions'; missing keys are empty.
+            friend_cache (dict): Optional dict reused across calls so that a
+                friend dict shared by many users is only encoded once. It
+                maps id(friend) -> (friend, encoded ids).
+
+        Returns:
+            EncodedUser: The encoded user.
+        """
+        friends = []
+        for friend in user_data.get("friends", ()):
+            if friend_cache is None:
+                friends.append(self.encode(friend["watched"]))
+                continue
+
+            cached = friend_cache.get(id(friend))
+            if cached is None or cached[0] is not friend:
+                cached = friend_cache[id(friend)] = (friend, self.encode(friend["watched"]))
+            friends.append(cached[1])
+
+        return EncodedUser(
+            watched=self.encode(user_data.get("watched", ())),
+            watchlist=self.encode(user_data.get("watchlist", ())),
+            favorites=self.encode(user_data.get("favorites", ())),
+            friends=friends,
+            subscriptions=user_data.get("subscriptions", ()),
+        )
+
+    def _friend_ids(self, user):
+        return set().union(*user.friends)
+
+    def _most_watched_genre(self, user):
+        genres = self.genres
+        genre_counts = {}
+        for movie_id in user.watched:
+            genre = genres[movie_id]
+            genre_counts[genre] = genre_counts.get(genre, 0) + 1
+
+        most_watched_genre = None
+        max_count = 0
+        for genre, count in genre_counts.items():
+            if count > max_count:
+                most_watched_genre = genre
+                max_count = count
+        return most_watched_genre
+
+    def get_unique_watched(self, user):
+        friend_ids = self._friend_ids(user)
+        return self.decode(movie_id for movie_id in user.watched if movie_id not in friend_ids)
+
+    def _iter_friends_unique_ids(self, user):
+        seen_ids = set(user.watched)
+        for friend in user.friends:
+            for movie_id in friend:
+                if movie_id not in seen_ids:
+                    seen_ids.add(movie_id)
+                    yield movie_id
+
+    def get_friends_unique_watched(self, user):
+        return self.decode(self._iter_friends_unique_ids(user))
+
+    def get_available_recs(self, user):
+        hosts = self.hosts
+        subscriptions = user.subscriptions
+        return self.decode(
+            movie_id
+            for movie_id in self._iter_friends_unique_ids(user)
+            if hosts[movie_id] in subscriptions
+        )
+
+    def get_new_rec_by_genre(self, user):
+        most_watched_genre = self._most_watched_genre(user)
+        if not most_watched_genre:
+            return []
+
+        genres = self.genres
+        return self.decode(
+            movie_id
+            for movie_id in self._iter_friends_unique_ids(user)
+            if genres[movie_id] == most_watched_genre
+        )
+
+    def get_rec_from_favorites(self, user):
+        friend_ids = self._friend_ids(user)
+        return self.decode(movie_id for movie_id in user.favorites if movie_id not in friend_ids)
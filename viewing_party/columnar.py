@@ -0,0 +1,128 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("the columnar engine needs numpy; install it with `pip install numpy`")
+
+
+class WatchedColumns:
+    """
+    Every user's watched movies as parallel NumPy arrays.
+
+    Row i of the arrays is one watched movie: ``user_ids[i]`` is the user's
+    position in the population, ``ratings[i]`` the movie's rating and
+    ``genre_codes[i]`` an index into ``genres``. Rows for a user keep their
+    watched order, which is what the tie-breaking in most_watched_genres
+    relies on.
+
+    Build one with from_users; it needs numpy.
+    """
+
+    def __init__(self, user_ids, ratings, genre_codes, genres, user_count):
+        _require_numpy()
+        self.user_ids = user_ids
+        self.ratings = ratings
+        self.genre_codes = genre_codes
+        self.genres = genres
+        self.user_count = user_count
+
+    @classmethod
+    def from_users(cls, users):
+        """
+        Returns WatchedColumns for a sequence of user_data records.
+        """
+        _require_numpy()
+
+        user_ids = []
+        ratings = []
+        genre_codes = []
+        codes = {}
+
+        user_count = 0
+        for user_id, user_data in enumerate(users):
+            user_count = user_id + 1
+            for movie in user_data["watched"]:
+                user_ids.append(user_id)
+                ratings.append(movie["rating"])
+                genre_codes.append(codes.setdefault(movie["genre"], len(codes)))
+
+        return cls(
+            np.array(user_ids, dtype=np.int64),
+            np.array(ratings, dtype=np.float64),
+            np.array(genre_codes, dtype=np.int64),
+            list(codes),
+            user_count,
+        )
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    def watched_counts(self):
+        return np.bincount(self.user_ids, minlength=self.user_count)
+
+    def average_ratings(self):
+        """
+        Returns every user's get_watched_avg_rating as a float array.
+
+        Users who haven't watched anything get 0.
+        """
+        counts = self.watched_counts()
+        # bincount adds the weights in row order, the same order as the
+        # scalar loop, so the sums agree exactly.
+        totals = np.bincount(self.user_ids, weights=self.ratings, minlength=self.user_count)
+
+        averages = np.zeros(self.user_count, dtype=np.float64)
+        np.divide(totals, counts, out=averages, where=counts > 0)
+        return averages
+
+    def most_watched_genres(self):
+        """
+        Returns every user's get_most_watched_genre as a list.
+
+        Ties go to the genre the user watched first, and users who haven't
+        watched anything get None, as in the scalar function.
+        """
+        genre_count = max(len(self.genres), 1)
+        keys = self.user_ids * genre_count + self.genre_codes
+
+        counts = np.bincount(keys, minlength=self.user_count * genre_count)
+        counts = counts.reshape(self.user_count, genre_count)
+
+        # Row of each (user, genre)'s first watched movie.
+        first_rows = np.full(self.user_count * genre_count, len(keys), dtype=np.int64)
+        unique_keys, first_index = np.unique(keys, return_index=True)
+        first_rows[unique_keys] = first_index
+        first_rows = first_rows.reshape(self.user_count, genre_count)
+
+        max_counts = counts.max(axis=1)
+        tied_first_rows = np.where(counts == max_counts[:, None], first_rows, len(keys))
+        best_codes = tied_first_rows.argmin(axis=1)
+
+        genres = self.genres
+        return [
+            genres[code] if max_count else None
+            for code, max_count in zip(best_codes.tolist(), max_counts.tolist())
+        ]
+
+
+def truthy_mask(values):
+    """
+    Returns a boolean array that is True where ``bool(value)`` would be.
+
+    Strings are truthy when non-empty, numbers when non-zero (NaN included)
+    and object arrays fall back to calling bool on each element.
+    """
+    _require_numpy()
+
+    values = np.asarray(values)
+    if values.dtype.kind in "US":
+        return np.char.str_len(values) > 0
+    if values.dtype.kind == "b":
+        return values.copy()
+    if values.dtype.kind in "iufc":
+        return values != 0
+    return np.frompyfunc(bool, 1, 1)(values).astype(bool)
@@ -0,0 +1,174 @@
+import json
+import os
+
+from viewing_party.library import UserLibrary
+from viewing_party.party import add_to_watched, add_to_watchlist, watch_movie
+
+LOG_NAME = "events.jsonl"
+SNAPSHOT_NAME = "snapshot.json"
+
+
+def _encode(record):
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _plain(user_data):
+    # Friends point at other users' dicts, so they are not logged.
+    plain = {key: value for key, value in user_data.items() if key != "friends"}
+    plain["watched"] = [dict(movie) for movie in user_data.get("watched", ())]
+    plain["watchlist"] = [dict(movie) for movie in user_data.get("watchlist", ())]
+    return plain
+
+
+class EventLog:
+    """
+    Users whose mutations are recorded in an append-only JSON Lines log.
+
+    Every add_user, add_to_watched, add_to_watchlist and watch_movie call is
+    applied to an in-memory UserLibrary and appended to ``events.jsonl`` in
+    ``directory`` as one line with an increasing ``seq`` number. snapshot()
+    writes the current users to ``snapshot.json`` together with the log's
+    byte offset at that point. Opening an EventLog on an existing directory
+    loads the snapshot and replays only the events after that offset.
+
+    A line cut short by a crash is dropped from the log when it is reopened;
+    a log shorter than the offset the snapshot recorded raises ValueError.
+    Friends are not recorded; user ids must be JSON values.
+
+    Args:
+        directory (str): Where the log and snapshot live. Created if missing.
+        snapshot_every (int): Take a snapshot after this many events. None
+            means only when snapshot() is called.
+        fsync (bool): fsync the log after every event, not just flush it.
+    """
+
+    def __init__(self, directory, snapshot_every=None, fsync=False):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.users = {}
+        self.seq = 0
+        self.replayed = 0
+        self._since_snapshot = 0
+
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        end = self._recover()
+        if os.path.exists(self.log_path) and os.path.getsize(self.log_path) > end:
+            with open(self.log_path, "r+b") as log:
+                log.truncate(end)
+        self._file = open(self.log_path, "ab")
+
+    def _recover(self):
+        offset = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as snapshot:
+                state = json.load(snapshot)
+            self.seq = state["seq"]
+            offset = state["offset"]
+            self.users = {user_id: UserLibrary(user_data) for user_id, user_data in state["users"]}
+
+        size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        if offset > size:
+            raise ValueError(
+                f"{self.log_path!r} is shorter than the snapshot says ({size} < {offset} bytes)"
+            )
+        if not size:
+            return 0
+
+        with open(self.log_path, "rb") as log:
+            log.seek(offset)
+            for line in log:
+                if not line.endswith(b"\n"):
+                    break
+                event = json.loads(line)
+                self._apply(event)
+                self.seq = event["seq"]
+                self.replayed += 1
+                offset += len(line)
+        return offset
+
+    def _apply(self, event):
+        op = event["op"]
+        user_id = event["user"]
+        if op == "add_user":
+            self.users[user_id] = UserLibrary(event["data"])
+        elif op == "add_to_watched":
+            add_to_watched(self.users[user_id], event["movie"])
+        elif op == "add_to_watchlist":
+            add_to_watchlist(self.users[user_id], event["movie"])
+        elif op == "watch_movie":
+            watch_movie(self.users[user_id], event["title"])
+        else:
+            raise ValueError(f"unknown event {op!r}")
+
+    def _record(self, event):
+        # Encoded and applied first, so an event that fails is never logged.
+        # The mutations leave the users unchanged when they raise, so the
+        # log and the live state stay in step.
+        event["seq"] = self.seq + 1
+        line = _encode(event)
+        self._apply(event)
+        self.seq += 1
+        self._file.write(line)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        self._since_snapshot += 1
+        if self.snapshot_every and self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def add_user(self, user_id, user_data=None):
+        """
+        Adds a user. Raises ValueError if the id is already taken.
+        """
+        if user_id in self.users:
+            raise ValueError(f"user {user_id!r} already exists")
+        self._record({"op": "add_user", "user": user_id, "data": _plain(user_data or {})})
+        return self.users[user_id]
+
+    def add_to_watched(self, user_id, movie):
+        self._record({"op": "add_to_watched", "user": user_id, "movie": dict(movie)})
+        return self.users[user_id]
+
+    def add_to_watchlist(self, user_id, movie):
+        self._record({"op": "add_to_watchlist", "user": user_id, "movie": dict(movie)})
+        return self.users[user_id]
+
+    def watch_movie(self, user_id, title):
+        self._record({"op": "watch_movie", "user": user_id, "title": title})
+        return self.users[user_id]
+
+    def snapshot(self):
+        """
+        Writes every user to the snapshot file, replacing the previous one.
+
+        The log is fsynced first, so it is never shorter on disk than the
+        offset the snapshot records.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        state = {
+            "seq": self.seq,
+            "offset": self._file.tell(),
+            "users": [[user_id, _plain(user_data)] for user_id, user_data in self.users.items()],
+        }
+
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as snapshot:
+            json.dump(state, snapshot, separators=(",", ":"))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        self._since_snapshot = 0
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,183 @@
+from bisect import bisect_left, insort
+
+from viewing_party.library import UserLibrary
+from viewing_party.party import add_to_watched, add_to_watchlist, get_most_watched_genre, watch_movie
+
+
+class _RankedMovies:
+    """
+    Movies kept in recommendation order, at most one per title.
+
+    Each movie has a key, (friend position, position in that friend's
+    watched list); for every title only the movie with the smallest key is
+    kept, which is the first one the read-time recommenders would find.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._order = []
+
+    def offer(self, key, title, movie):
+        """
+        Keeps the movie if its title is new or it comes before the kept one.
+        """
+        existing = self._entries.get(title)
+        if existing is not None:
+            if existing[0] < key:
+                return False
+            self._order.pop(bisect_left(self._order, (existing[0], title)))
+
+        self._entries[title] = (key, movie)
+        insort(self._order, (key, title))
+        return True
+
+    def discard(self, title):
+        existing = self._entries.pop(title, None)
+        if existing is not None:
+            self._order.pop(bisect_left(self._order, (existing[0], title)))
+
+    def get(self, title):
+        return self._entries.get(title)
+
+    def movies(self):
+        entries = self._entries
+        return [entries[title][1] for key, title in self._order]
+
+    def __len__(self):
+        return len(self._order)
+
+
+class _View:
+    """
+    One user's materialized recommendations.
+    """
+
+    def __init__(self, user_data):
+        self.user_data = user_data
+        self.friends = []
+        self.subscriptions = set(user_data.get("subscriptions", ()))
+        self.friends_unique = _RankedMovies()
+        self.available = _RankedMovies()
+        self.by_genre = {}
+
+    def push(self, key, movie):
+        title = movie["title"]
+        if self.user_data.has_watched(title):
+            return
+
+        if self.friends_unique.offer(key, title, movie):
+            # The first copy of a title decides whether it is available.
+            self.available.discard(title)
+            if movie.get("host") in self.subscriptions:
+                self.available.offer(key, title, movie)
+
+        genre_movies = self.by_genre.get(movie["genre"])
+        if genre_movies is None:
+            genre_movies = self.by_genre[movie["genre"]] = _RankedMovies()
+        genre_movies.offer(key, title, movie)
+
+    def discard(self, title):
+        self.friends_unique.discard(title)
+        self.available.discard(title)
+        for genre_movies in self.by_genre.values():
+            genre_movies.discard(title)
+
+
+class FanoutHub:
+    """
+    Keeps every user's Wave 3-5 recommendations up to date at write time.
+
+    Users are added to the hub and follow each other by id. When a user's
+    watched list changes through add_to_watched or watch_movie, the movie is
+    pushed into the materialized recommendations of everyone who follows
+    them, and the user's own recommendations drop the title. Reads then only
+    copy out the precomputed result.
+
+    Results match get_friends_unique_watched, get_available_recs and
+    get_new_rec_by_genre run on user_data(user_id). Users are stored as
+    UserLibrary objects. Subscriptions are read when a user is added.
+    """
+
+    def __init__(self):
+        self.users = {}
+        self._views = {}
+        self._followers = {}
+
+    def add_user(self, user_id, user_data=None, friends=()):
+        """
+        Adds a user, then follows each friend id in order.
+
+        Raises:
+            ValueError: If the user id is already in the hub.
+        """
+        if user_id in self.users:
+            raise ValueError(f"user {user_id!r} is already in the hub")
+
+        library = UserLibrary(user_data or {})
+        library.pop("friends", None)
+        self.users[user_id] = library
+        self._views[user_id] = _View(library)
+        self._followers[user_id] = []
+
+        for friend_id in friends:
+            self.follow(user_id, friend_id)
+        return library
+
+    def follow(self, user_id, friend_id):
+        """
+        Appends friend_id to the user's friends and pushes their movies.
+
+        Raises:
+            KeyError: If either user is not in the hub.
+        """
+        view = self._views[user_id]
+        friend_position = len(view.friends)
+
+        view.friends.append(friend_id)
+        self._followers[friend_id].append((user_id, friend_position))
+        for position, movie in enumerate(self.users[friend_id]["watched"]):
+            view.push((friend_position, position), movie)
+
+    def _watched(self, user_id, movie):
+        # Watched lists only grow through the hub, so the movie is last.
+        position = len(self.users[user_id]["watched"]) - 1
+        self._views[user_id].discard(movie["title"])
+
+        for follower_id, friend_position in self._followers[user_id]:
+            self._views[follower_id].push((friend_position, position), movie)
+
+    def add_to_watched(self, user_id, movie):
+        add_to_watched(self.users[user_id], movie)
+        self._watched(user_id, movie)
+
+    def add_to_watchlist(self, user_id, movie):
+        add_to_watchlist(self.users[user_id], movie)
+
+    def watch_movie(self, user_id, title):
+        library = self.users[user_id]
+        movie = library["watchlist"].get(title)
+        watch_movie(library, title)
+        if movie is not None:
+            self._watched(user_id, movie)
+
+    def user_data(self, user_id):
+        """
+        Returns the user's data with their friends, for the party.py functions.
+        """
+        return dict(
+            self.users[user_id],
+            friends=[self.users[friend_id] for friend_id in self._views[user_id].friends],
+        )
+
+    def get_friends_unique_watched(self, user_id):
+        return self._views[user_id].friends_unique.movies()
+
+    def get_available_recs(self, user_id):
+        return self._views[user_id].available.movies()
+
+    def get_new_rec_by_genre(self, user_id):
+        view = self._views[user_id]
+        most_watched_genre = get_most_watched_genre(view.user_data)
+        if not most_watched_genre or most_watched_genre not in view.by_genre:
+            return []
+        return view.by_genre[most_watched_genre].movies()
@@ -0,0 +1,105 @@
+class FriendTitle:
+    """
+    Everything the recommenders need to know about one title the user's
+    friends have watched.
+
+    Attributes:
+        movie (dict): The canonical movie, i.e. the first one with this title
+            found when walking the friends in order.
+        friends (set): Ids of the friends who watched the title. A friend's id
+            is its position in ``user_data["friends"]``.
+        genre (str): The canonical movie's genre.
+        host (str): The canonical movie's host, or None if it has none.
+        variants (list): Every distinct movie dict seen with this title. This
+            is almost always just ``[movie]``.
+    """
+
+    __slots__ = ("movie", "friends", "genre", "host", "variants")
+
+    def __init__(self, movie):
+        self.movie = movie
+        self.friends = set()
+        self.genre = movie["genre"]
+        self.host = movie.get("host")
+        self.variants = [movie]
+
+    def __repr__(self):
+        return f"FriendTitle({self.movie!r}, friends={sorted(self.friends)!r})"
+
+
+class FriendIndex:
+    """
+    An inverted index of the titles a user's friends have watched.
+
+    Building the index walks every friend's ``watched`` list once. The Wave
+    3-5 recommenders accept it as an optional ``friend_index`` argument, so a
+    page that renders several recommendation rows only pays for that walk
+    once.
+
+    Args:
+        user_data (dict): Contains a list of 'friends', each with a 'watched'
+            list of movies.
+    """
+
+    def __init__(self, user_data):
+        self.titles = {}
+        self.by_genre = {}
+
+        for friend_id, friend in enumerate(user_data["friends"]):
+            for movie in friend["watched"]:
+                self._add(friend_id, movie)
+
+    def _add(self, friend_id, movie):
+        title = movie["title"]
+
+        entry = self.titles.get(title)
+        if entry is None:
+            entry = self.titles[title] = FriendTitle(movie)
+        elif movie is not entry.movie and movie not in entry.variants:
+            entry.variants.append(movie)
+        entry.friends.add(friend_id)
+
+        # Kept per genre so a title that shows up under two genres is still
+        # recommended for the one it was not first seen with.
+        self.by_genre.setdefault(movie["genre"], {}).setdefault(title, movie)
+
+    def __contains__(self, title):
+        return title in self.titles
+
+    def __len__(self):
+        return len(self.titles)
+
+    def get(self, title):
+        return self.titles.get(title)
+
+    def title_set(self):
+        """
+        Returns a set-like view of every title the friends have watched.
+        """
+        return self.titles.keys()
+
+    def movies(self):
+        """
+        Returns the canonical movies in the order friends first watched them.
+        """
+        return [entry.movie for entry in self.titles.values()]
+
+    def genre_movies(self, genre):
+        """
+        Returns a title -> movie dict of the friends' movies in a genre.
+        """
+        return self.by_genre.get(genre, {})
+
+    def friend_count(self, title):
+        """
+        Returns how many friends have watched the title.
+        """
+        entry = self.titles.get(title)
+        return len(entry.friends) if entry else 0
+
+    def contains_movie(self, movie):
+        """
+        Returns True if any friend watched a movie equal to the given one.
+        """
+        entry = self.titles.get(movie["title"])
+        return entry is not None and movie in entry.variants
@@ -0,0 +1,190 @@
+import argparse
+import json
+import sys
+import time
+
+from viewing_party.party import (
+    create_movie,
+    get_available_recs,
+    get_friends_unique_watched,
+    get_new_rec_by_genre,
+    get_rec_from_favorites,
+    get_unique_watched,
+)
+
+MOVIE_LISTS = ("watched", "watchlist", "favorites")
+
+RECOMMENDERS = {
+    "unique_watched": get_unique_watched,
+    "friends_unique_watched": get_friends_unique_watched,
+    "available_recs": get_available_recs,
+    "new_rec_by_genre": get_new_rec_by_genre,
+    "rec_from_favorites": get_rec_from_favorites,
+}
+
+
+class IngestReport:
+    """
+    Counters for one ingestion run.
+
+    Attributes:
+        records (int): User records parsed and processed.
+        bad_lines (int): Lines that were not a JSON object and were skipped.
+        rejected_movies (int): Movies dropped because create_movie would
+            have rejected their title, genre or rating.
+        seconds (float): Wall-clock time of the run so far.
+    """
+
+    def __init__(self):
+        self.records = 0
+        self.bad_lines = 0
+        self.rejected_movies = 0
+        self.seconds = 0.0
+
+    @property
+    def records_per_second(self):
+        return self.records / self.seconds if self.seconds else 0.0
+
+    def as_dict(self):
+        return {
+            "records": self.records,
+            "bad_lines": self.bad_lines,
+            "rejected_movies": self.rejected_movies,
+            "seconds": self.seconds,
+            "records_per_second": self.records_per_second,
+        }
+
+    def __str__(self):
+        return (
+            f"{self.records} records in {self.seconds:.2f}s "
+            f"({self.records_per_second:,.0f} records/sec), "
+            f"{self.bad_lines} bad lines, {self.rejected_movies} rejected movies"
+        )
+
+
+def is_valid_movie(movie):
+    """
+    Returns True if create_movie would accept the movie's fields.
+    """
+    return isinstance(movie, dict) and create_movie(
+        movie.get("title"), movie.get("genre"), movie.get("rating")
+    ) is not None
+
+
+def _valid_movies(movies, report):
+    valid = [movie for movie in movies if is_valid_movie(movie)]
+    report.rejected_movies += len(movies) - len(valid)
+    return valid
+
+
+def clean_record(record, report):
+    """
+    Fills in missing user_data keys and drops invalid movies, in place.
+    """
+    for key in MOVIE_LISTS:
+        record[key] = _valid_movies(record.get(key) or [], report)
+
+    record["subscriptions"] = record.get("subscriptions") or []
+    record["friends"] = [
+        dict(friend, watched=_valid_movies(friend.get("watched") or [], report))
+        for friend in record.get("friends") or []
+        if isinstance(friend, dict)
+    ]
+    return record
+
+
+def _iter_numbered_records(lines, report, strict):
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            record = error
+
+        if not isinstance(record, dict):
+            if strict:
+                raise ValueError(f"line {line_number} is not a JSON object")
+            report.bad_lines += 1
+            continue
+
+        report.records += 1
+        yield line_number, clean_record(record, report)
+
+
+def iter_user_records(lines, report=None, strict=False):
+    """
+    Parses JSON Lines user records one at a time.
+
+    Only one record is held in memory at once, so memory use does not grow
+    with the size of the input.
+
+    Args:
+        lines (iterable): Lines of text, e.g. an open file.
+        report (IngestReport): Optional counters to update.
+        strict (bool): Raise ValueError on a bad line instead of skipping it.
+
+    Yields:
+        dict: Cleaned user_data records.
+    """
+    if report is None:
+        report = IngestReport()
+
+    for line_number, record in _iter_numbered_records(lines, report, strict):
+        yield record
+
+
+def run_pipeline(lines, output, recommender=get_available_recs, strict=False):
+    """
+    Streams user records through a recommender into a JSON Lines output.
+
+    Each output line is ``{"id": ..., "recommendations": [...]}``, where id is
+    the record's "id" or, if it has none, its line number in the input
+    (counting from 1, blank and skipped lines included).
+
+    Args:
+        lines (iterable): Input lines of user records.
+        output (file): A text file to write results to.
+        recommender (function): Takes user_data and returns a list of movies.
+        strict (bool): Raise ValueError on a bad line instead of skipping it.
+
+    Returns:
+        IngestReport: Counters and throughput for the run.
+    """
+    report = IngestReport()
+    start = time.perf_counter()
+
+    for line_number, record in _iter_numbered_records(lines, report, strict):
+        result = {"id": record.get("id", line_number), "recommendations": recommender(record)}
+        output.write(json.dumps(result) + "\n")
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a recommender over a JSON Lines file of users.")
+    parser.add_argument("input", help="JSON Lines file of user records, or - for stdin")
+    parser.add_argument("output", help="JSON Lines file to write, or - for stdout")
+    parser.add_argument("--recommender", choices=sorted(RECOMMENDERS), default="available_recs")
+    parser.add_argument("--strict", action="store_true", help="fail on malformed lines")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        report = run_pipeline(source, target, RECOMMENDERS[args.recommender], args.strict)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    print(report, file=sys.stderr)
+    return report
+
+
+if __name__ == "__main__":
+    main()
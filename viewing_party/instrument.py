@@ -0,0 +1,220 @@
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+
+from viewing_party import party
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class FunctionStats:
+    """
+    Call counters for one instrumented function.
+
+    Attributes:
+        calls (int): Completed calls.
+        seconds (float): Cumulative wall-clock time.
+        latencies (deque): The most recent call durations, for percentiles.
+        watched (int): Total user 'watched' items passed in.
+        friends (int): Total friends passed in.
+        friend_movies (int): Total movies across those friends.
+    """
+
+    def __init__(self, sample_size):
+        self.calls = 0
+        self.seconds = 0.0
+        self.latencies = deque(maxlen=sample_size)
+        self.watched = 0
+        self.friends = 0
+        self.friend_movies = 0
+
+    def percentiles(self):
+        """
+        Returns quantile -> latency over the recent calls, for QUANTILES.
+        """
+        ordered = sorted(self.latencies)
+        if not ordered:
+            return {str(quantile): 0.0 for quantile in QUANTILES}
+        return {
+            str(quantile): ordered[min(int(quantile * len(ordered)), len(ordered) - 1)]
+            for quantile in QUANTILES
+        }
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "percentiles": self.percentiles(),
+            "input": {
+                "watched": self.watched,
+                "friends": self.friends,
+                "friend_movies": self.friend_movies,
+            },
+        }
+
+
+def _input_sizes(args):
+    user_data = args[0] if args else None
+    if not isinstance(user_data, dict):
+        return 0, 0, 0
+
+    friends = user_data.get("friends") or ()
+    return (
+        len(user_data.get("watched") or ()),
+        len(friends),
+        sum(len(friend["watched"]) for friend in friends if isinstance(friend, dict)),
+    )
+
+
+class Instrumentation:
+    """
+    Opt-in call counting and latency tracking for party.py's public functions.
+
+    enable() swaps each public function in the module for a wrapper that
+    records calls, latency and input sizes; disable() puts the originals
+    back. While disabled nothing is wrapped, so there is no overhead at all.
+
+    Only lookups through the module see the wrappers (``party.get_available_recs``
+    or functions inside party.py calling each other); names imported with
+    ``from viewing_party.party import ...`` before enable() keep pointing at
+    the originals. Since party functions call one another, a nested call is
+    counted under its own name too.
+
+    Generator functions (the iter_* recommenders) are timed from the first
+    item to exhaustion or close.
+
+    Args:
+        module: The module to instrument; party by default.
+        sample_size (int): How many recent latencies each function keeps for
+            percentiles.
+    """
+
+    def __init__(self, module=party, sample_size=1024):
+        self.module = module
+        self.sample_size = sample_size
+        self.stats = {}
+        self._originals = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def _functions(self):
+        return {
+            name: function
+            for name, function in inspect.getmembers(self.module, inspect.isfunction)
+            if not name.startswith("_") and function.__module__ == self.module.__name__
+        }
+
+    def _record(self, name, seconds, sizes):
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = FunctionStats(self.sample_size)
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.latencies.append(seconds)
+            stats.watched += sizes[0]
+            stats.friends += sizes[1]
+            stats.friend_movies += sizes[2]
+
+    def _wrap(self, name, function):
+        record = self._record
+        clock = time.perf_counter
+
+        if inspect.isgeneratorfunction(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                sizes = _input_sizes(args)
+                start = clock()
+                try:
+                    yield from function(*args, **kwargs)
+                finally:
+                    record(name, clock() - start, sizes)
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                sizes = _input_sizes(args)
+                start = clock()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    record(name, clock() - start, sizes)
+
+        return wrapper
+
+    def enable(self):
+        if self.enabled:
+            return
+        for name, function in self._functions().items():
+            self._originals[name] = function
+            setattr(self.module, name, self._wrap(name, function))
+
+    def disable(self):
+        for name, function in self._originals.items():
+            setattr(self.module, name, function)
+        self._originals = {}
+
+    def reset(self):
+        with self._lock:
+            self.stats = {}
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def snapshot(self):
+        """
+        Returns function name -> counters, as plain dicts.
+        """
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in sorted(self.stats.items())}
+
+    def prometheus_text(self, prefix="viewing_party"):
+        """
+        Returns the counters in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_calls_total Completed calls per function.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        lines += [
+            f'{prefix}_calls_total{{function="{name}"}} {entry["calls"]}'
+            for name, entry in snapshot.items()
+        ]
+
+        lines += [
+            f"# HELP {prefix}_latency_seconds Call latency over recent calls.",
+            f"# TYPE {prefix}_latency_seconds summary",
+        ]
+        for name, entry in snapshot.items():
+            for quantile, value in entry["percentiles"].items():
+                lines.append(f'{prefix}_latency_seconds{{function="{name}",quantile="{quantile}"}} {value!r}')
+            lines.append(f'{prefix}_latency_seconds_sum{{function="{name}"}} {entry["seconds"]!r}')
+            lines.append(f'{prefix}_latency_seconds_count{{function="{name}"}} {entry["calls"]}')
+
+        lines += [
+            f"# HELP {prefix}_input_items_total Input items passed in, by kind.",
+            f"# TYPE {prefix}_input_items_total counter",
+        ]
+        for name, entry in snapshot.items():
+            for kind, value in entry["input"].items():
+                lines.append(f'{prefix}_input_items_total{{function="{name}",kind="{kind}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+# The default instrumentation for party.py.
+instrumentation = Instrumentation()
+enable = instrumentation.enable
+disable = instrumentation.disable
+reset = instrumentation.reset
+snapshot = instrumentation.snapshot
+prometheus_text = instrumentation.prometheus_text
@@ -0,0 +1,297 @@
+class MovieList:
+    """
+    An insertion-ordered list of movies indexed by title.
+
+    Behaves like the plain ``watched``/``watchlist`` lists (append, remove,
+    iteration, ``len``, ``in`` and indexing) but keeps a title -> entries
+    index so that title lookups and removals are O(1). A title may appear
+    more than once, as in a list: each append adds a new entry, and title
+    lookups and removals use the earliest entry with that title.
+
+    ``version`` increases on every change, so callers can tell whether the
+    list has been mutated since they last looked at it.
+    """
+
+    def __init__(self, movies=()):
+        # Entries are keyed by an increasing number, so _movies keeps list
+        # order and _titles keeps each title's entries in list order.
+        self._movies = {}
+        self._titles = {}
+        self._next_key = 0
+        self.version = 0
+
+        for movie in movies:
+            self.append(movie)
+
+    def append(self, movie):
+        # A movie that _check rejects leaves the list unchanged.
+        self._check(movie)
+
+        key = self._next_key
+        self._next_key += 1
+        self._movies[key] = movie
+        self._titles.setdefault(movie["title"], []).append(key)
+        self.version += 1
+        self._added(movie)
+
+    def _pop_key(self, title, position):
+        keys = self._titles[title]
+        key = keys.pop(position)
+        if not keys:
+            del self._titles[title]
+
+        movie = self._movies.pop(key)
+        self.version += 1
+        self._removed(movie)
+        return movie
+
+    def remove(self, movie):
+        """
+        Removes the first entry equal to the movie, like list.remove.
+
+        Raises:
+            ValueError: If the movie is not in the list.
+        """
+        try:
+            keys = self._titles[movie["title"]]
+        except (KeyError, TypeError):
+            keys = ()
+
+        for position, key in enumerate(keys):
+            if self._movies[key] == movie:
+                self._pop_key(movie["title"], position)
+                return
+
+        raise ValueError("MovieList.remove(movie): movie not in list")
+
+    def pop_title(self, title, default=None):
+        """
+        Removes and returns the first movie with the given title.
+
+        Args:
+            title (str): The title to remove.
+            default: Returned when no movie has that title.
+
+        Returns:
+            dict: The removed movie, or ``default``.
+        """
+        if title not in self._titles:
+            return default
+
+        return self._pop_key(title, 0)
+
+    def _check(self, movie):
+        # Raises for a movie the list can't index, before anything changes.
+        hash(movie["title"])
+
+    def _added(self, movie):
+        pass
+
+    def _removed(self, movie):
+        pass
+
+    def get(self, title, default=None):
+        """
+        Returns the first movie with the given title, or ``default``.
+        """
+        keys = self._titles.get(title)
+        if keys is None:
+            return default
+        return self._movies[keys[0]]
+
+    def get_all(self, title):
+        """
+        Returns every movie with the given title, in list order.
+        """
+        return [self._movies[key] for key in self._titles.get(title, ())]
+
+    def has_title(self, title):
+        return title in self._titles
+
+    def titles(self):
+        """
+        Returns a live, set-like view of the titles in the list.
+        """
+        return self._titles.keys()
+
+    def __contains__(self, movie):
+        try:
+            keys = self._titles.get(movie["title"], ())
+        except (KeyError, TypeError):
+            return False
+
+        return any(self._movies[key] == movie for key in keys)
+
+    def __iter__(self):
+        return iter(self._movies.values())
+
+    def __len__(self):
+        return len(self._movies)
+
+    def __getitem__(self, index):
+        # Positional access is O(n); it exists for compatibility with lists.
+        return list(self._movies.values())[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (MovieList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MovieList({list(self)!r})"
+
+    def copy(self):
+        """
+        Returns a shallow copy with the same version.
+        """
+        copied = self.__class__.__new__(self.__class__)
+        copied._movies = dict(self._movies)
+        copied._titles = {title: list(keys) for title, keys in self._titles.items()}
+        copied._next_key = self._next_key
+        copied.version = self.version
+        return copied
+
+
+class WatchedList(MovieList):
+    """
+    A MovieList that keeps running rating and genre aggregates.
+
+    Appends update the rating total, the per-genre counts and the current
+    top genre as they go, so average_rating and most_watched_genre are O(1)
+    reads. Removing a movie marks the aggregates stale; they are rebuilt on
+    the next read so results always match a full rescan.
+    """
+
+    def __init__(self, movies=()):
+        self._reset_aggregates()
+        super().__init__(movies)
+
+    def _reset_aggregates(self):
+        self._rating_total = 0
+        self._genre_counts = {}
+        self._genre_rank = {}
+        self._top_genre = None
+        self._top_count = 0
+        self._stale = False
+
+    def _check(self, movie):
+        # Everything _added relies on, so it can't fail half way through.
+        super()._check(movie)
+        self._rating_total + movie["rating"]
+        hash(movie["genre"])
+
+    def _added(self, movie):
+        if self._stale:
+            return
+
+        self._rating_total += movie["rating"]
+
+        genre = movie["genre"]
+        count = self._genre_counts.get(genre, 0) + 1
+        self._genre_counts[genre] = count
+        rank = self._genre_rank.setdefault(genre, len(self._genre_rank))
+
+        # Ties go to the genre seen first, as in get_most_watched_genre.
+        if count > self._top_count or (
+            count == self._top_count and rank < self._genre_rank[self._top_genre]
+        ):
+            self._top_genre = genre
+            self._top_count = count
+
+    def _removed(self, movie):
+        self._stale = True
+
+    def copy(self):
+        """
+        Returns a shallow copy whose aggregates are up to date, so reading
+        them never writes to the copy.
+        """
+        self._refresh()
+        copied = super().copy()
+        copied._rating_total = self._rating_total
+        copied._genre_counts = dict(self._genre_counts)
+        copied._genre_rank = dict(self._genre_rank)
+        copied._top_genre = self._top_genre
+        copied._top_count = self._top_count
+        copied._stale = self._stale
+        return copied
+
+    def _refresh(self):
+        if self._stale:
+            self._reset_aggregates()
+            for movie in self:
+                self._added(movie)
+
+    def rating_total(self):
+        self._refresh()
+        return self._rating_total
+
+    def genre_counts(self):
+        """
+        Returns a copy of the genre -> number of watched movies counts.
+        """
+        self._refresh()
+        return dict(self._genre_counts)
+
+    def average_rating(self):
+        """
+        Returns the average rating of the watched movies, or 0 if empty.
+        """
+        if not self:
+            return 0
+
+        return self.rating_total() / len(self)
+
+    def most_watched_genre(self):
+        """
+        Returns the most watched genre, or None if nothing has been watched.
+        """
+        self._refresh()
+        return self._top_genre
+
+
+class UserLibrary(dict):
+    """
+    A user_data dictionary whose ``watched`` and ``watchlist`` are MovieLists.
+
+    A UserLibrary can be passed anywhere a user_data dict is accepted. Moving
+    a title from the watchlist to watched and checking whether the user has
+    seen a title are O(1) instead of a scan over the lists.
+
+    Args:
+        user_data (dict): Optional user_data to copy; its ``watched`` and
+            ``watchlist`` lists are indexed by title.
+    """
+
+    def __init__(self, user_data=(), **kwargs):
+        super().__init__(user_data, **kwargs)
+        self["watched"] = WatchedList(self.get("watched", ()))
+        self["watchlist"] = MovieList(self.get("watchlist", ()))
+
+    def copy(self):
+        """
+        Returns a UserLibrary whose lists can change independently of this one.
+
+        ``watched``, ``watchlist`` and ``friends`` are copied; the movies and
+        friend dicts themselves are shared.
+        """
+        copied = UserLibrary.__new__(UserLibrary)
+        dict.update(copied, self)
+        copied["watched"] = self["watched"].copy()
+        copied["watchlist"] = self["watchlist"].copy()
+        if "friends" in self:
+            copied["friends"] = list(self["friends"])
+        return copied
+
+    @property
+    def version(self):
+        """
+        A counter that increases whenever ``watched`` or ``watchlist`` change.
+        """
+        return self["watched"].version + self["watchlist"].version
+
+    def has_watched(self, title):
+        return self["watched"].has_title(title)
+
+    def in_watchlist(self, title):
+        return self["watchlist"].has_title(title)
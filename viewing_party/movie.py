@@ -0,0 +1,59 @@
+import sys
+from collections.abc import Mapping
+
+_FIELDS = ("title", "genre", "rating", "host")
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Movie(Mapping):
+    """
+    A compact, read-only movie record.
+
+    A Movie stores its fields in __slots__ instead of a per-movie dict, and
+    interns ``genre`` and ``host`` so the handful of distinct values are
+    shared by every movie. It is a Mapping, so ``movie["title"]``,
+    ``movie.get("host")`` and comparisons with plain movie dicts all work the
+    same as they do for the dicts create_movie returns.
+
+    ``host`` is optional, as it is for movie dicts: a Movie without one has no
+    "host" key.
+    """
+
+    __slots__ = _FIELDS
+
+    def __init__(self, title, genre, rating, host=None):
+        self.title = title
+        self.genre = _intern(genre)
+        self.rating = rating
+        self.host = _intern(host)
+
+    @classmethod
+    def from_dict(cls, movie):
+        return cls(movie["title"], movie["genre"], movie["rating"], movie.get("host"))
+
+    def to_dict(self):
+        return dict(self)
+
+    def __getitem__(self, key):
+        if key in _FIELDS:
+            value = getattr(self, key)
+            if value is not None or key != "host":
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        if self.host is None:
+            return iter(_FIELDS[:3])
+        return iter(_FIELDS)
+
+    def __len__(self):
+        return 3 if self.host is None else 4
+
+    def __repr__(self):
+        return f"Movie({dict(self)!r})"
+
+    def __reduce__(self):
+        return (Movie, (self.title, self.genre, self.rating, self.host))
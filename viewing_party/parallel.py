@@ -0,0 +1,95 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from viewing_party.batch import RECOMMENDERS, BatchEngine
+
+DEFAULT_RECOMMENDERS = ("available_recs", "new_rec_by_genre")
+
+# Each worker process builds one engine from the friend registry it was
+# started with, so friend data is pickled once per worker, not once per task.
+_worker_engine = None
+
+
+def _init_worker(friend_registry):
+    global _worker_engine
+    _worker_engine = BatchEngine(friend_registry)
+
+
+def _run_chunk(users, recommenders):
+    # Friend dicts unpickled with this chunk are only cached for the chunk.
+    return _worker_engine.recommend_chunk(users, recommenders)
+
+
+def _chunks(users, chunksize):
+    chunk = []
+    for user_data in users:
+        chunk.append(user_data)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_parallel(
+    users,
+    friend_registry,
+    recommenders=DEFAULT_RECOMMENDERS,
+    max_workers=None,
+    chunksize=256,
+    deterministic=False,
+):
+    """
+    Runs recommenders for many users across a process pool.
+
+    Users are sent to the workers in chunks and results come back in input
+    order as soon as each chunk is done. At most two chunks per worker are
+    in flight, so ``users`` may be a lazy iterable of any length.
+
+    Users should list their friends as ids into ``friend_registry``. The
+    registry is handed to every worker once when it starts; friend dicts
+    embedded in user records would be pickled again with every chunk.
+
+    Args:
+        users (iterable): user_data records.
+        friend_registry (dict): friend id -> friend data with a 'watched' list.
+        recommenders (tuple): Names from batch.RECOMMENDERS to run.
+        max_workers (int): Worker processes; defaults to the CPU count.
+        chunksize (int): Users per task.
+        deterministic (bool): Run every chunk in this process instead of a
+            pool. The output is the same; this mode exists so results can be
+            checked against the serial functions without a pool.
+
+    Yields:
+        dict: recommender name -> result, one per user, in input order.
+    """
+    unknown = set(recommenders) - set(RECOMMENDERS)
+    if unknown:
+        raise ValueError(f"unknown recommenders: {sorted(unknown)}")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    if deterministic:
+        engine = BatchEngine(friend_registry)
+        for chunk in _chunks(users, chunksize):
+            yield from engine.recommend_chunk(chunk, recommenders)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = 2 * max_workers
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(friend_registry,),
+    ) as executor:
+        pending = deque()
+
+        for chunk in _chunks(users, chunksize):
+            pending.append(executor.submit(_run_chunk, chunk, recommenders))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
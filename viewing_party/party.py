@@ -1,13 +1,69 @@
+from collections import Counter, deque
+
+from viewing_party.friends import FriendIndex
+from viewing_party.library import MovieList, UserLibrary, WatchedList
+from viewing_party.movie import Movie
+
 # ------------- WAVE 1 --------------------
 
-def create_movie(title, genre, rating):
+def create_movie(title, genre, rating, compact=False):
     if title is None or genre is None or rating is None:
         return None
 
     if all([title, genre, rating]):
+        if compact:
+            return Movie(title, genre, rating)
         return {"title": title, "genre": genre, "rating": rating}
 
 
+def create_movies(titles, genres, ratings, compact=False):
+    """
+    Creates many movies at once from parallel columns.
+
+    A row is kept exactly when create_movie would return a movie for it:
+    its title, genre and rating are all truthy. If any column is a NumPy
+    array the rows are checked with vectorized operations (this needs
+    numpy); otherwise each row is checked in Python.
+
+    Args:
+        titles (sequence of str): The movie titles.
+        genres (sequence of str): The genres, one per title.
+        ratings (sequence of float): The ratings, one per title.
+        compact (bool): Return Movie records instead of dicts.
+
+    Returns:
+        tuple: The created movies in row order, and a mask that is True for
+        each rejected row. The mask is a NumPy bool array when NumPy input
+        was given and a list of bools otherwise.
+
+    Raises:
+        ValueError: If the columns have different lengths.
+    """
+    columns = (titles, genres, ratings)
+    if any(hasattr(column, "dtype") for column in columns):
+        from viewing_party.columnar import _require_numpy, np, truthy_mask
+
+        _require_numpy()
+        columns = [np.asarray(column) for column in columns]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("titles, genres and ratings must have the same length")
+
+        valid = truthy_mask(columns[0]) & truthy_mask(columns[1]) & truthy_mask(columns[2])
+        rows = zip(*(column[valid].tolist() for column in columns))
+        rejected = ~valid
+    else:
+        columns = [list(column) for column in columns]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("titles, genres and ratings must have the same length")
+
+        rejected = [not all(row) for row in zip(*columns)]
+        rows = [row for row, is_rejected in zip(zip(*columns), rejected) if not is_rejected]
+
+    if compact:
+        return [Movie(title, genre, rating) for title, genre, rating in rows], rejected
+    return [{"title": title, "genre": genre, "rating": rating} for title, genre, rating in rows], rejected
+
+
 def add_to_watched(user_data, movie):
     user_data["watched"].append(movie)
     return user_data
@@ -19,6 +75,16 @@ def add_to_watchlist(user_data, movie):
 
 
 def watch_movie(user_data, title):
+    watchlist = user_data["watchlist"]
+
+    if isinstance(watchlist, MovieList):
+        movie = watchlist.get(title)
+        if movie is not None:
+            # Appended first, so a movie watched rejects stays on the watchlist.
+            user_data["watched"].append(movie)
+            watchlist.pop_title(title)
+        return user_data
+
     for movie in user_data["watchlist"]:
         if movie["title"] == title:
             user_data["watchlist"].remove(movie)
@@ -28,10 +94,86 @@ def watch_movie(user_data, title):
     return user_data
 
 
+def add_many_to_watched(user_data, movies):
+    """
+    Adds each movie to the watched list, in order, like add_to_watched.
+    """
+    watched = user_data["watched"]
+    if isinstance(watched, MovieList):
+        for movie in movies:
+            watched.append(movie)
+    else:
+        watched.extend(movies)
+    return user_data
+
+
+def add_many_to_watchlist(user_data, movies):
+    """
+    Adds each movie to the watchlist, in order, like add_to_watchlist.
+    """
+    watchlist = user_data["watchlist"]
+    if isinstance(watchlist, MovieList):
+        for movie in movies:
+            watchlist.append(movie)
+    else:
+        watchlist.extend(movies)
+    return user_data
+
+
+def watch_movies(user_data, titles):
+    """
+    Moves movies from the watchlist to watched, like calling watch_movie for
+    each title in order, with a single pass over the watchlist.
+
+    Titles not in the watchlist are skipped. A title given twice moves the
+    first two watchlist movies with that title, as two watch_movie calls
+    would.
+
+    Args:
+        user_data (dict): Contains 'watchlist' and 'watched' lists.
+        titles (iterable of str): The titles to watch, in order.
+
+    Returns:
+        dict: The same user_data, updated in place.
+    """
+    titles = list(titles)
+
+    if isinstance(user_data["watchlist"], MovieList):
+        for title in titles:
+            watch_movie(user_data, title)
+        return user_data
+
+    wanted = Counter(titles)
+    found = {}
+    kept = []
+
+    for movie in user_data["watchlist"]:
+        title = movie["title"]
+        if wanted[title]:
+            wanted[title] -= 1
+            found.setdefault(title, deque()).append(movie)
+        else:
+            kept.append(movie)
+
+    if not found:
+        return user_data
+
+    user_data["watchlist"][:] = kept
+    for title in titles:
+        movies = found.get(title)
+        if movies:
+            user_data["watched"].append(movies.popleft())
+
+    return user_data
+
+
 # -----------------------------------------
 # ------------- WAVE 2 --------------------
 # -----------------------------------------
 def get_watched_avg_rating(user_data):
+    if isinstance(user_data["watched"], WatchedList):
+        return user_data["watched"].average_rating()
+
     if not user_data["watched"]:
         return 0
 
@@ -47,6 +189,9 @@ def get_most_watched_genre(user_data):
     if user_data["watched"] is None:
         return None
 
+    if isinstance(user_data["watched"], WatchedList):
+        return user_data["watched"].most_watched_genre()
+
     genre_avg = {}
 
     for movie in user_data["watched"]:
@@ -83,6 +228,9 @@ def get_user_movies(user_data):
 
     Written by: Mariya Mokrynska
     """
+    if isinstance(user_data["watched"], MovieList):
+        return set(user_data["watched"].titles())
+
     user_watched_titles = set()
 
     for movie in user_data["watched"]:
@@ -91,18 +239,30 @@ def get_user_movies(user_data):
     return user_watched_titles
 
 
-def get_friends_movies(user_data):
+def _user_titles(user_data):
+    # For the recommenders below, which only test membership: a UserLibrary's
+    # live title view avoids copying its titles into a new set.
+    if isinstance(user_data["watched"], MovieList):
+        return user_data["watched"].titles()
+    return get_user_movies(user_data)
+
+
+def get_friends_movies(user_data, friend_index=None):
     """
     Helper function to get a set of movie titles that the user's friends have watched.
 
     Args:
     user_data (dict): Contains a list of 'friends', each with a 'watched' list of movies.
+    friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
 
     Returns:
     set: A set of movie titles watched by the user's friends.
 
     Written by: Mariya Mokrynska
     """
+    if friend_index is not None:
+        return set(friend_index.title_set())
+
     friends_watched_titles = set()
 
     for friend in user_data["friends"]:
@@ -128,12 +288,13 @@ def get_unique_watched(user_data):
 # version 2
 
 
-def get_unique_watched(user_data):
+def get_unique_watched(user_data, friend_index=None):
     """
     Returns a list of movies the user has watched, but none of their friends have.
 
     Args:
         user_data (dict): Contains 'watched' (movies the user watched) and 'friends' (friend's watched movies).
+        friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
 
     Returns:
         list: Movies the user has watched but not their friends.
@@ -141,8 +302,11 @@ def get_unique_watched(user_data):
     Written by: Mariya Mokrynska
     """
     unique_movies_list = []
-    user_watched_titles = get_user_movies(user_data)
-    friends_watched_titles = get_friends_movies(user_data)
+    user_watched_titles = _user_titles(user_data)
+    if friend_index is not None:
+        friends_watched_titles = friend_index.title_set()
+    else:
+        friends_watched_titles = get_friends_movies(user_data)
 
     # Get the set difference: user watched but friends have not
     unique_titles = user_watched_titles - friends_watched_titles
@@ -158,7 +322,7 @@ def get_unique_watched(user_data):
 # Written by: Mariya Mokrynska
 """ def get_friends_unique_watched(user_data):
     friends_unique_movies_list = []
-    user_watched_titles = get_user_movies(user_data)
+    user_watched_titles = _user_titles(user_data)
     previous_titles = set()
 
     for friend in user_data["friends"]:
@@ -172,34 +336,52 @@ def get_unique_watched(user_data):
 # version 2
 
 
-def get_friends_unique_watched(user_data):
+def iter_friends_unique_watched(user_data, friend_index=None):
     """
-    Returns a list of movies that at least one of the user's friends has watched, but the user has not.
+    Lazily yields the movies get_friends_unique_watched returns, in the same order.
+
+    Friends are only scanned as far as the caller consumes, so taking the
+    first few results with itertools.islice stops early.
 
     Args:
         user_data (dict): A dictionary containing the user's watched movies and friends' watched movies.
+        friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
 
-    Returns:
-        list: A list of movie dictionaries that friends have watched but the user has not.
-
-    Written by: Mariya Mokrynska
+    Yields:
+        dict: Movies that friends have watched but the user has not.
     """
-    friends_watched_titles = get_friends_movies(user_data)
-    user_watched_titles = get_user_movies(user_data)
+    user_watched_titles = _user_titles(user_data)
 
-    # Get the set difference: movies that friends have watched but the user has not
-    unique_titles = friends_watched_titles - user_watched_titles
+    if friend_index is not None:
+        for title, entry in friend_index.titles.items():
+            if title not in user_watched_titles:
+                yield entry.movie
+        return
 
-    unique_movies = []
     added_titles = set()
 
     for friend in user_data["friends"]:
         for movie in friend["watched"]:
-            if movie["title"] in unique_titles and movie["title"] not in added_titles:
-                unique_movies.append(movie)
-                added_titles.add(movie["title"])
+            title = movie["title"]
+            if title not in user_watched_titles and title not in added_titles:
+                added_titles.add(title)
+                yield movie
+
+
+def get_friends_unique_watched(user_data, friend_index=None):
+    """
+    Returns a list of movies that at least one of the user's friends has watched, but the user has not.
+
+    Args:
+        user_data (dict): A dictionary containing the user's watched movies and friends' watched movies.
+        friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
+
+    Returns:
+        list: A list of movie dictionaries that friends have watched but the user has not.
 
-    return unique_movies
+    Written by: Mariya Mokrynska
+    """
+    return list(iter_friends_unique_watched(user_data, friend_index))
 
 
 # -----------------------------------------
@@ -207,13 +389,49 @@ def get_friends_unique_watched(user_data):
 # -----------------------------------------
 
 
-def get_available_recs(user_data):
+def iter_available_recs(user_data, friend_index=None):
+    """
+    Lazily yields the movies get_available_recs returns, in the same order.
+
+    Args:
+    user_data (dict): Contains 'subscriptions' (list of str) and 'friends' (list of dicts with 'watched' movies).
+    friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
+
+    Yields:
+    dict: Movies the user hasn't watched, watched by friends, on the user's subscriptions.
+    """
+    subscriptions = set(user_data["subscriptions"])
+    user_watched_titles = _user_titles(user_data)
+
+    if friend_index is not None:
+        for title, entry in friend_index.titles.items():
+            if title not in user_watched_titles and entry.host in subscriptions:
+                yield entry.movie
+        return
+
+    # One pass over the friends: the first movie seen with a title decides
+    # whether that title is recommended, as in get_friends_unique_watched.
+    seen_titles = set()
+
+    for friend in user_data["friends"]:
+        for friend_movie in friend["watched"]:
+            title = friend_movie["title"]
+            if title in seen_titles or title in user_watched_titles:
+                continue
+
+            seen_titles.add(title)
+            if friend_movie["host"] in subscriptions:
+                yield friend_movie
+
+
+def get_available_recs(user_data, friend_index=None):
     """
     Recommends movies the user hasn't watched but their friends have, 
     available on the user's subscribed streaming services.
 
     Args:
     user_data (dict): Contains 'subscriptions' (list of str) and 'friends' (list of dicts with 'watched' movies).
+    friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
 
     Returns:
     list of dict: Recommended movies that the user hasn't watched, are watched by friends, 
@@ -221,28 +439,37 @@ def get_available_recs(user_data):
 
     Written by: Mariya Mokrynska
     """
-    recommended_movies_list = []
-    user_watched_titles = get_user_movies(user_data)
-    friends_unique_movies_list = get_friends_unique_watched(user_data)
-
-    for friend_movie in friends_unique_movies_list:
-        if friend_movie["title"] not in user_watched_titles and friend_movie["host"] in user_data["subscriptions"]:
-            recommended_movies_list.append(friend_movie)
-
-    return recommended_movies_list
+    return list(iter_available_recs(user_data, friend_index))
 
 
 # -----------------------------------------
 # ------------- WAVE 5 --------------------
 # -----------------------------------------
-def get_new_rec_by_genre(user_data):
+def iter_new_rec_by_genre(user_data, friend_index=None):
+    """
+    Lazily yields the movies get_new_rec_by_genre returns, in the same order.
+
+    Args:
+        user_data (dict): Contains 'watched' and 'friends' (list of dicts with 'watched' movies).
+        friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
+
+    Yields:
+        dict: Friends' movies in the user's most watched genre that the user hasn't watched.
+    """
     most_watched_genre = get_most_watched_genre(user_data)
 
     if not most_watched_genre:
-        return []
+        return
+
+    watched_titles = _user_titles(user_data)
+
+    if friend_index is not None:
+        genre_movies = friend_index.genre_movies(most_watched_genre)
+        for title, movie in genre_movies.items():
+            if title not in watched_titles:
+                yield movie
+        return
 
-    rec_movies = []
-    watched_titles = {movie["title"] for movie in user_data["watched"]}
     seen_movies = set()
 
     for friend in user_data["friends"]:
@@ -252,23 +479,75 @@ def get_new_rec_by_genre(user_data):
                 movie["title"] not in watched_titles and
                 movie["title"] not in seen_movies
             ):
-                rec_movies.append(movie)
                 seen_movies.add(movie["title"])
-    return rec_movies
+                yield movie
+
+
+def get_new_rec_by_genre(user_data, friend_index=None):
+    return list(iter_new_rec_by_genre(user_data, friend_index))
+
 
+def _movie_key(movie):
+    # Two movies hash to the same key exactly when they compare equal.
+    return frozenset(movie.items())
 
-def get_rec_from_favorites(user_data):
-    rec_movies = []
+
+def iter_rec_from_favorites(user_data, friend_index=None):
+    """
+    Lazily yields the movies get_rec_from_favorites returns, in the same order.
+
+    Every friend has to be checked before a favorite is known to be unwatched,
+    so the friends are hashed up front; only the favorites are streamed.
+
+    Args:
+        user_data (dict): Contains 'favorites' and 'friends' (list of dicts with 'watched' movies).
+        friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
+
+    Yields:
+        dict: The favorites no friend has watched.
+    """
+    if friend_index is None:
+        try:
+            friends_movie_keys = {
+                _movie_key(movie)
+                for friend in user_data["friends"]
+                for movie in friend["watched"]
+            }
+        except TypeError:
+            # A movie holds an unhashable value; fall back to the title index.
+            friend_index = FriendIndex(user_data)
+        else:
+            for movie in user_data["favorites"]:
+                try:
+                    watched_by_friend = _movie_key(movie) in friends_movie_keys
+                except TypeError:
+                    # This favorite holds an unhashable value; check it
+                    # against the title index instead.
+                    if friend_index is None:
+                        friend_index = FriendIndex(user_data)
+                    watched_by_friend = friend_index.contains_movie(movie)
+                if not watched_by_friend:
+                    yield movie
+            return
 
     for movie in user_data["favorites"]:
-        movie_in_favorites = True
+        if not friend_index.contains_movie(movie):
+            yield movie
+
 
-        for friend in user_data["friends"]:
-            if movie in friend["watched"]:
-                movie_in_favorites = False
-                break
+def get_rec_from_favorites(user_data, friend_index=None):
+    """
+    Returns the user's favorites that none of their friends have watched.
 
-        if movie_in_favorites:
-            rec_movies.append(movie)
+    Friends' movies are hashed once, so this is linear in the total number of
+    favorites and friend movies instead of favorites x friends x watched.
+    Movies are compared as whole dicts, like ``movie in friend["watched"]``.
 
-    return rec_movies
+    Args:
+        user_data (dict): Contains 'favorites' and 'friends' (list of dicts with 'watched' movies).
+        friend_index (FriendIndex): Optional prebuilt index of the friends' movies.
+
+    Returns:
+        list: The favorites no friend has watched, in favorites order.
+    """
+    return list(iter_rec_from_favorites(user_data, friend_index))
@@ -0,0 +1,91 @@
+import heapq
+
+from viewing_party.friends import FriendIndex
+from viewing_party.party import (
+    iter_available_recs,
+    iter_friends_unique_watched,
+    iter_new_rec_by_genre,
+    iter_rec_from_favorites,
+)
+
+RANK_KEYS = ("rating", "popularity", "combined")
+
+
+def rank_key(key, friend_index=None):
+    """
+    Returns a function that scores a movie for ranking.
+
+    Args:
+        key (str or function): "rating" ranks by the movie's rating,
+            "popularity" by how many friends watched the title and "combined"
+            by popularity with rating breaking ties. A function taking a movie
+            is returned unchanged.
+        friend_index (FriendIndex): Needed for "popularity" and "combined".
+
+    Returns:
+        function: Maps a movie to a sortable score; higher ranks first.
+    """
+    if callable(key):
+        return key
+
+    if key == "rating":
+        return lambda movie: movie["rating"]
+
+    if key not in RANK_KEYS:
+        raise ValueError(f"unknown rank key {key!r}; expected one of {RANK_KEYS}")
+
+    if friend_index is None:
+        raise ValueError(f"rank key {key!r} needs a friend_index")
+
+    if key == "popularity":
+        return lambda movie: friend_index.friend_count(movie["title"])
+
+    return lambda movie: (friend_index.friend_count(movie["title"]), movie["rating"])
+
+
+def top_k(movies, k, key="rating", friend_index=None):
+    """
+    Returns the k best movies from an iterable, best first.
+
+    Selection uses a bounded heap, so only k candidates are held in memory at
+    a time however many movies the iterable yields. Movies that score the
+    same keep the order they were yielded in.
+
+    Args:
+        movies (iterable): Candidate movies.
+        k (int): How many movies to return.
+        key (str or function): See rank_key.
+        friend_index (FriendIndex): Needed for "popularity" and "combined".
+
+    Returns:
+        list: At most k movies.
+    """
+    if k <= 0:
+        return []
+
+    return heapq.nlargest(k, movies, key=rank_key(key, friend_index))
+
+
+def _top_recs(recommender, user_data, k, key, friend_index):
+    # Popularity needs friend counts, which means indexing the friends; the
+    # same index then feeds the recommender so the friends are scanned once.
+    if friend_index is None and key in ("popularity", "combined"):
+        friend_index = FriendIndex(user_data)
+
+    return top_k(recommender(user_data, friend_index), k, key, friend_index)
+
+
+def get_top_friends_unique_watched(user_data, k, key="rating", friend_index=None):
+    return _top_recs(iter_friends_unique_watched, user_data, k, key, friend_index)
+
+
+def get_top_available_recs(user_data, k, key="rating", friend_index=None):
+    return _top_recs(iter_available_recs, user_data, k, key, friend_index)
+
+
+def get_top_new_rec_by_genre(user_data, k, key="rating", friend_index=None):
+    return _top_recs(iter_new_rec_by_genre, user_data, k, key, friend_index)
+
+
+def get_top_rec_from_favorites(user_data, k, key="rating", friend_index=None):
+    return _top_recs(iter_rec_from_favorites, user_data, k, key, friend_index)
@@ -0,0 +1,127 @@
+import asyncio
+from collections import deque
+
+from viewing_party.party import get_available_recs
+
+
+class StubProfileBackend:
+    """
+    An in-process stand-in for the profile service, for tests and benchmarks.
+
+    Args:
+        profiles (dict): friend id -> friend data with a 'watched' list.
+        latency (float): Seconds every fetch sleeps before answering.
+        latencies (dict): Optional per-friend latency overrides.
+    """
+
+    def __init__(self, profiles, latency=0.0, latencies=None):
+        self.profiles = profiles
+        self.latency = latency
+        self.latencies = latencies or {}
+        self.fetches = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_watched(self, friend_id):
+        """
+        Returns the friend's watched list.
+
+        Raises:
+            KeyError: If the backend has no such friend.
+        """
+        self.fetches += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latencies.get(friend_id, self.latency))
+            return self.profiles[friend_id]["watched"]
+        finally:
+            self.in_flight -= 1
+
+
+class RecommendationService:
+    """
+    Fetches friends' watched lists concurrently, then runs a recommender.
+
+    User records list their friends by id. recommend() fetches every friend
+    at once, with at most ``concurrency`` fetches in flight across all
+    requests, and a friend that concurrent requests share is only fetched
+    once: later requests wait on the fetch already in flight. A fetch that
+    takes longer than ``timeout`` seconds or fails is left out, and the
+    friend is recommended from as if they had watched nothing. ``failed``
+    counts such fetches and ``failures`` holds the ids of the most recent
+    ``max_failures`` of them.
+
+    Use a service from one event loop; its concurrency limit belongs to
+    the loop it is first used in.
+
+    Args:
+        backend: Anything with an ``async fetch_watched(friend_id)``.
+        concurrency (int): Most fetches in flight at once.
+        timeout (float): Seconds to wait for one fetch, or None.
+        max_failures (int): How many failed friend ids to remember.
+    """
+
+    def __init__(self, backend, concurrency=32, timeout=1.0, max_failures=100):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.backend = backend
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._in_flight = {}
+        self.coalesced = 0
+        self.failed = 0
+        self.failures = deque(maxlen=max_failures)
+
+    async def _fetch(self, friend_id):
+        try:
+            async with self._semaphore:
+                return await asyncio.wait_for(self.backend.fetch_watched(friend_id), self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed += 1
+            self.failures.append(friend_id)
+            return None
+
+    async def fetch_friend(self, friend_id):
+        """
+        Returns the friend's watched list, or None if the fetch failed.
+        """
+        task = self._in_flight.get(friend_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(friend_id))
+            self._in_flight[friend_id] = task
+            task.add_done_callback(lambda done: self._in_flight.pop(friend_id, None))
+        else:
+            self.coalesced += 1
+
+        # Shielded so one caller being cancelled doesn't cancel the fetch
+        # for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    async def assemble(self, user_record):
+        """
+        Returns user_record with its friend ids replaced by friend data.
+        """
+        friend_ids = user_record.get("friends", ())
+        watched_lists = await asyncio.gather(*(self.fetch_friend(friend_id) for friend_id in friend_ids))
+
+        user_data = dict(user_record)
+        user_data["friends"] = [{"watched": watched or []} for watched in watched_lists]
+        return user_data
+
+    async def recommend(self, user_record, recommender=get_available_recs):
+        """
+        Fetches the user's friends and returns recommender(user_data).
+        """
+        return recommender(await self.assemble(user_record))
+
+    async def recommend_many(self, user_records, recommender=get_available_recs):
+        """
+        Runs recommend for every record concurrently, results in input order.
+        """
+        return await asyncio.gather(
+            *(self.recommend(user_record, recommender) for user_record in user_records)
+        )
@@ -0,0 +1,395 @@
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"VPSNAP01"
+NO_HOST = 0xFFFFFFFF
+
+# Every section is a little-endian array of fixed-width values. Rows are the
+# users followed by their friends; the *_indptr sections are CSR offsets.
+SECTIONS = (
+    ("string_offsets", "I"),
+    ("string_data", "B"),
+    ("movie_titles", "I"),
+    ("movie_genres", "I"),
+    ("movie_hosts", "I"),
+    ("movie_ratings", "d"),
+    ("watched_indptr", "I"),
+    ("watched", "I"),
+    ("friends_indptr", "I"),
+    ("friends", "I"),
+    ("favorites_indptr", "I"),
+    ("favorites", "I"),
+    ("subscriptions_indptr", "I"),
+    ("subscriptions", "I"),
+)
+
+_HEADER = struct.Struct("<8sII")
+_SECTION = struct.Struct("<QQ")
+_ALIGN = 8
+
+
+def _require_little_endian():
+    # Sections are written and mapped in native order, which the format
+    # fixes as little-endian.
+    if sys.byteorder != "little":
+        raise ValueError("snapshots are only supported on little-endian machines")
+
+
+class _Strings:
+    def __init__(self):
+        self.ids = {}
+        self.offsets = array("I", [0])
+        self.data = bytearray()
+
+    def add(self, text):
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.ids)
+            self.data += text.encode("utf-8")
+            self.offsets.append(len(self.data))
+        return string_id
+
+
+def write_snapshot(path, users, friend_registry=None):
+    """
+    Writes user_data records to a binary snapshot file.
+
+    The snapshot keeps what the recommenders read: watched, favorites,
+    friends and subscriptions. Watchlists are not stored.
+
+    Args:
+        path (str): The file to write.
+        users (iterable): user_data records. Their 'friends' may hold friend
+            dicts or ids into ``friend_registry``; each distinct friend is
+            stored once.
+        friend_registry (dict): friend id -> friend data.
+
+    Returns:
+        int: The number of users written.
+    """
+    _require_little_endian()
+    users = list(users)
+    strings = _Strings()
+    movie_ids = {}
+    columns = {name: array(typecode) for name, typecode in SECTIONS}
+
+    def movie_id(movie):
+        host = movie.get("host")
+        key = (movie["title"], movie["genre"], movie["rating"], host)
+        found = movie_ids.get(key)
+        if found is None:
+            found = movie_ids[key] = len(movie_ids)
+            columns["movie_titles"].append(strings.add(movie["title"]))
+            columns["movie_genres"].append(strings.add(movie["genre"]))
+            columns["movie_hosts"].append(NO_HOST if host is None else strings.add(host))
+            columns["movie_ratings"].append(movie["rating"])
+        return found
+
+    def append_row(name, values):
+        indptr = columns[f"{name}_indptr"]
+        if not indptr:
+            indptr.append(0)
+        columns[name].extend(values)
+        indptr.append(len(columns[name]))
+
+    rows = [user_data.get("watched", ()) for user_data in users]
+    friend_rows = {}
+
+    for user_data in users:
+        row_ids = []
+        for friend in user_data.get("friends", ()):
+            key = ("dict", id(friend)) if isinstance(friend, dict) else ("id", friend)
+            row = friend_rows.get(key)
+            if row is None:
+                data = friend if isinstance(friend, dict) else friend_registry[friend]
+                row = friend_rows[key] = len(rows)
+                rows.append(data["watched"])
+            row_ids.append(row)
+
+        append_row("friends", row_ids)
+        append_row("favorites", [movie_id(movie) for movie in user_data.get("favorites", ())])
+        append_row("subscriptions", [strings.add(host) for host in user_data.get("subscriptions", ())])
+
+    for watched in rows:
+        append_row("watched", [movie_id(movie) for movie in watched])
+
+    for name in ("watched", "friends", "favorites", "subscriptions"):
+        if not columns[f"{name}_indptr"]:
+            columns[f"{name}_indptr"].append(0)
+
+    columns["string_offsets"] = strings.offsets
+    columns["string_data"] = array("B", bytes(strings.data))
+
+    payloads = [columns[name] for name, typecode in SECTIONS]
+    header_size = _HEADER.size + _SECTION.size * len(SECTIONS)
+    offset = -(-header_size // _ALIGN) * _ALIGN
+
+    table = []
+    for payload in payloads:
+        size = len(payload) * payload.itemsize
+        table.append((offset, size))
+        offset += -(-size // _ALIGN) * _ALIGN
+
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(_HEADER.pack(MAGIC, len(users), len(rows)))
+        for section in table:
+            snapshot_file.write(_SECTION.pack(*section))
+
+        for (start, size), payload in zip(table, payloads):
+            snapshot_file.write(b"\0" * (start - snapshot_file.tell()))
+            snapshot_file.write(payload.tobytes())
+
+    return len(users)
+
+
+class SnapshotReader:
+    """
+    Reads a snapshot written by write_snapshot through mmap.
+
+    The arrays are memoryviews straight onto the mapped file, so opening a
+    snapshot costs the same however large it is, and the recommenders below
+    work on integer ids, only building movie dicts for their results. Users
+    are addressed by their position in the list passed to write_snapshot.
+
+    The recommenders return the same movies, in the same order, as the
+    functions in party.py. Use as a context manager or call close().
+
+    Args:
+        path (str): The snapshot file.
+    """
+
+    def __init__(self, path):
+        _require_little_endian()
+        with open(path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._buffer = memoryview(self._mmap)
+        magic, self.user_count, self.row_count = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path!r} is not a viewing party snapshot")
+
+        self.columns = {}
+        for number, (name, typecode) in enumerate(SECTIONS):
+            start, size = _SECTION.unpack_from(self._buffer, _HEADER.size + number * _SECTION.size)
+            self.columns[name] = self._buffer[start:start + size].cast(typecode)
+
+        self._strings = {}
+
+    def close(self):
+        """
+        Releases the mapping. Safe to call more than once.
+
+        Arrays from numpy_column still point into the file; if any are
+        alive the file stays mapped until the last one is gone.
+        """
+        columns, self.columns = getattr(self, "columns", {}), {}
+        buffers = list(columns.values()) + [self._buffer]
+        self._buffer = None
+        for buffer in buffers:
+            if buffer is None:
+                continue
+            try:
+                buffer.release()
+            except BufferError:
+                pass
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Still exported; unmapped when the last view is collected.
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.user_count
+
+    def numpy_column(self, name):
+        """
+        Returns a section as a zero-copy NumPy array (needs numpy).
+
+        The array reads the mapped file directly; close() leaves the file
+        mapped until the array is gone. Copy it to keep it independently.
+        """
+        import numpy as np
+
+        column = self.columns[name]
+        return np.frombuffer(column, dtype=np.dtype(column.format).newbyteorder("<"))
+
+    def string(self, string_id):
+        text = self._strings.get(string_id)
+        if text is None:
+            offsets = self.columns["string_offsets"]
+            data = self.columns["string_data"]
+            text = bytes(data[offsets[string_id]:offsets[string_id + 1]]).decode("utf-8")
+            self._strings[string_id] = text
+        return text
+
+    def movie(self, movie_id):
+        """
+        Returns the movie dict for a movie id.
+        """
+        columns = self.columns
+        movie = {
+            "title": self.string(columns["movie_titles"][movie_id]),
+            "genre": self.string(columns["movie_genres"][movie_id]),
+            "rating": columns["movie_ratings"][movie_id],
+        }
+        host = columns["movie_hosts"][movie_id]
+        if host != NO_HOST:
+            movie["host"] = self.string(host)
+        return movie
+
+    def _row(self, name, row):
+        indptr = self.columns[f"{name}_indptr"]
+        return self.columns[name][indptr[row]:indptr[row + 1]]
+
+    def _check_user(self, user):
+        if not 0 <= user < self.user_count:
+            raise IndexError(f"user {user} is not in the snapshot")
+
+    def _watched(self, row):
+        return self._row("watched", row)
+
+    def _friends(self, user):
+        self._check_user(user)
+        return self._row("friends", user)
+
+    def watched(self, row):
+        """
+        Returns the movie ids a row has watched, as a list.
+        """
+        return self._watched(row).tolist()
+
+    def friends(self, user):
+        """
+        Returns the rows of a user's friends, as a list.
+        """
+        return self._friends(user).tolist()
+
+    def load_user(self, user):
+        """
+        Materializes a user_data dict for one user.
+        """
+        self._check_user(user)
+        return {
+            "watched": [self.movie(movie_id) for movie_id in self._watched(user)],
+            "favorites": [self.movie(movie_id) for movie_id in self._row("favorites", user)],
+            "subscriptions": [self.string(host) for host in self._row("subscriptions", user)],
+            "friends": [
+                {"watched": [self.movie(movie_id) for movie_id in self._watched(row)]}
+                for row in self._friends(user)
+            ],
+        }
+
+    def _user_titles(self, user):
+        titles = self.columns["movie_titles"]
+        return {titles[movie_id] for movie_id in self._watched(user)}
+
+    def _iter_friends_unique(self, user, genre=None):
+        titles = self.columns["movie_titles"]
+        genres = self.columns["movie_genres"]
+        seen_titles = self._user_titles(user)
+
+        for row in self._friends(user):
+            for movie_id in self._watched(row):
+                title = titles[movie_id]
+                if title in seen_titles:
+                    continue
+                if genre is not None and genres[movie_id] != genre:
+                    continue
+                seen_titles.add(title)
+                yield movie_id
+
+    def get_watched_avg_rating(self, user):
+        self._check_user(user)
+        watched = self._watched(user)
+        if not watched:
+            return 0
+
+        ratings = self.columns["movie_ratings"]
+        total_rating = 0
+        for movie_id in watched:
+            total_rating += ratings[movie_id]
+        return total_rating / len(watched)
+
+    def _most_watched_genre_id(self, user):
+        genres = self.columns["movie_genres"]
+        genre_counts = {}
+        for movie_id in self._watched(user):
+            genre = genres[movie_id]
+            genre_counts[genre] = genre_counts.get(genre, 0) + 1
+
+        most_watched_genre = None
+        max_count = 0
+        for genre, count in genre_counts.items():
+            if count > max_count:
+                most_watched_genre = genre
+                max_count = count
+        return most_watched_genre
+
+    def get_most_watched_genre(self, user):
+        self._check_user(user)
+        genre = self._most_watched_genre_id(user)
+        return None if genre is None else self.string(genre)
+
+    def get_unique_watched(self, user):
+        titles = self.columns["movie_titles"]
+        friend_titles = {
+            titles[movie_id]
+            for row in self._friends(user)
+            for movie_id in self._watched(row)
+        }
+        return [
+            self.movie(movie_id)
+            for movie_id in self._watched(user)
+            if titles[movie_id] not in friend_titles
+        ]
+
+    def get_friends_unique_watched(self, user):
+        return [self.movie(movie_id) for movie_id in self._iter_friends_unique(user)]
+
+    def get_available_recs(self, user):
+        self._check_user(user)
+        hosts = self.columns["movie_hosts"]
+        subscriptions = set(self._row("subscriptions", user))
+        titles = self.columns["movie_titles"]
+        seen_titles = self._user_titles(user)
+        recommended = []
+
+        for row in self._friends(user):
+            for movie_id in self._watched(row):
+                title = titles[movie_id]
+                if title in seen_titles:
+                    continue
+                seen_titles.add(title)
+                if hosts[movie_id] in subscriptions:
+                    recommended.append(self.movie(movie_id))
+
+        return recommended
+
+    def get_new_rec_by_genre(self, user):
+        self._check_user(user)
+        genre = self._most_watched_genre_id(user)
+        if genre is None:
+            return []
+        return [self.movie(movie_id) for movie_id in self._iter_friends_unique(user, genre)]
+
+    def get_rec_from_favorites(self, user):
+        friend_movies = {
+            movie_id
+            for row in self._friends(user)
+            for movie_id in self._watched(row)
+        }
+        return [
+            self.movie(movie_id)
+            for movie_id in self._row("favorites", user)
+            if movie_id not in friend_movies
+        ]
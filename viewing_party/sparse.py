@@ -0,0 +1,162 @@
+from viewing_party.catalog import MovieCatalog
+from viewing_party.columnar import _require_numpy, np
+
+
+def _split(indptr, ids):
+    ids = ids.tolist()
+    bounds = indptr.tolist()
+    return [ids[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+
+def _indptr(row_of, row_count):
+    indptr = np.zeros(row_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row_of, minlength=row_count), out=indptr[1:])
+    return indptr
+
+
+class SparseWatched:
+    """
+    A CSR user x movie matrix of who watched what, built with NumPy only.
+
+    Rows 0..user_count-1 are the users; the rows after them are their
+    friends, each stored once however many users list them. Row r's movie
+    ids are ``indices[indptr[r]:indptr[r + 1]]`` in watched order, and user
+    u's friend rows are ``friend_rows[friend_indptr[u]:friend_indptr[u + 1]]``.
+    Movie ids come from a MovieCatalog, so a movie is identified by title.
+
+    friend_union, user_only and friend_only compute the Wave 3 set
+    differences for every user at once with array operations and return
+    them as (indptr, movie ids) pairs in the same CSR layout.
+    """
+
+    def __init__(self, indptr, indices, friend_indptr, friend_rows, user_count, catalog):
+        _require_numpy()
+        self.indptr = indptr
+        self.indices = indices
+        self.friend_indptr = friend_indptr
+        self.friend_rows = friend_rows
+        self.user_count = user_count
+        self.catalog = catalog
+        self._friend_movies = None
+
+    @classmethod
+    def from_users(cls, users, friend_registry=None):
+        """
+        Returns a SparseWatched for a sequence of user_data records.
+
+        Args:
+            users (iterable): user_data records. Their 'friends' may hold
+                friend dicts or ids into ``friend_registry``.
+            friend_registry (dict): friend id -> friend data.
+        """
+        _require_numpy()
+        users = list(users)
+        catalog = MovieCatalog()
+
+        rows = [user_data["watched"] for user_data in users]
+        friend_row_of = {}
+        friend_rows = []
+        friend_counts = []
+
+        for user_data in users:
+            friends = user_data.get("friends", ())
+            friend_counts.append(len(friends))
+            for friend in friends:
+                key = ("dict", id(friend)) if isinstance(friend, dict) else ("id", friend)
+                row = friend_row_of.get(key)
+                if row is None:
+                    data = friend if isinstance(friend, dict) else friend_registry[friend]
+                    row = friend_row_of[key] = len(rows)
+                    rows.append(data["watched"])
+                friend_rows.append(row)
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(watched) for watched in rows], out=indptr[1:])
+        indices = np.array(
+            [catalog.add(movie) for watched in rows for movie in watched],
+            dtype=np.int64,
+        )
+
+        friend_indptr = np.zeros(len(users) + 1, dtype=np.int64)
+        np.cumsum(friend_counts, out=friend_indptr[1:])
+
+        return cls(
+            indptr,
+            indices,
+            friend_indptr,
+            np.array(friend_rows, dtype=np.int64),
+            len(users),
+            catalog,
+        )
+
+    def _keys(self, users, movie_ids):
+        # One int64 per (user, movie) pair, ordered by user first.
+        return users * max(len(self.catalog), 1) + movie_ids
+
+    def _user_entries(self):
+        stop = self.indptr[self.user_count]
+        users = np.repeat(np.arange(self.user_count), np.diff(self.indptr[:self.user_count + 1]))
+        return users, self.indices[:stop]
+
+    def _friend_union_entries(self):
+        if self._friend_movies is not None:
+            return self._friend_movies
+
+        # Expand every (user, friend) edge into that friend's movies, keeping
+        # user, then friend, then watched order.
+        starts = self.indptr[self.friend_rows]
+        lengths = self.indptr[self.friend_rows + 1] - starts
+        edge_users = np.repeat(np.arange(self.user_count), np.diff(self.friend_indptr))
+
+        total = int(lengths.sum())
+        edge_offsets = np.cumsum(lengths) - lengths
+        positions = np.arange(total) - np.repeat(edge_offsets, lengths)
+        movie_ids = self.indices[np.repeat(starts, lengths) + positions]
+        users = np.repeat(edge_users, lengths)
+
+        # Keep each (user, movie) pair's first occurrence, in order.
+        keys = self._keys(users, movie_ids)
+        first = np.sort(np.unique(keys, return_index=True)[1])
+        self._friend_movies = (users[first], movie_ids[first])
+        return self._friend_movies
+
+    def friend_union(self):
+        """
+        Returns (indptr, movie ids) of every movie each user's friends watched.
+        """
+        users, movie_ids = self._friend_union_entries()
+        return _indptr(users, self.user_count), movie_ids
+
+    def user_only(self):
+        """
+        Returns (indptr, movie ids) of each user's watched movies that none of
+        their friends watched, in watched order (get_unique_watched).
+        """
+        users, movie_ids = self._user_entries()
+        friend_users, friend_movie_ids = self._friend_union_entries()
+
+        keep = ~np.isin(self._keys(users, movie_ids), self._keys(friend_users, friend_movie_ids))
+        return _indptr(users[keep], self.user_count), movie_ids[keep]
+
+    def friend_only(self):
+        """
+        Returns (indptr, movie ids) of movies each user's friends watched but
+        the user didn't, in friend order (get_friends_unique_watched).
+        """
+        users, movie_ids = self._user_entries()
+        friend_users, friend_movie_ids = self._friend_union_entries()
+
+        keep = ~np.isin(self._keys(friend_users, friend_movie_ids), self._keys(users, movie_ids))
+        return _indptr(friend_users[keep], self.user_count), friend_movie_ids[keep]
+
+    def decode(self, indptr, movie_ids):
+        """
+        Turns an (indptr, movie ids) pair into one list of movies per user.
+        """
+        return [self.catalog.decode(row) for row in _split(indptr, movie_ids)]
+
+    def get_unique_watched(self):
+        return self.decode(*self.user_only())
+
+    def get_friends_unique_watched(self):
+        return self.decode(*self.friend_only())
@@ -0,0 +1,353 @@
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS movies (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    genre TEXT NOT NULL,
+    rating REAL NOT NULL,
+    host TEXT
+);
+CREATE TABLE IF NOT EXISTS watched (
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    position INTEGER NOT NULL,
+    movie_id INTEGER NOT NULL REFERENCES movies (id),
+    PRIMARY KEY (user_id, position)
+);
+CREATE TABLE IF NOT EXISTS watchlist (
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    position INTEGER NOT NULL,
+    movie_id INTEGER NOT NULL REFERENCES movies (id),
+    PRIMARY KEY (user_id, position)
+);
+CREATE TABLE IF NOT EXISTS favorites (
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    position INTEGER NOT NULL,
+    movie_id INTEGER NOT NULL REFERENCES movies (id),
+    PRIMARY KEY (user_id, position)
+);
+CREATE TABLE IF NOT EXISTS friendships (
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    position INTEGER NOT NULL,
+    friend_id INTEGER NOT NULL REFERENCES users (id),
+    PRIMARY KEY (user_id, position)
+);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    host TEXT NOT NULL,
+    PRIMARY KEY (user_id, host)
+);
+CREATE INDEX IF NOT EXISTS movies_title ON movies (title);
+CREATE INDEX IF NOT EXISTS watched_movie ON watched (movie_id);
+CREATE INDEX IF NOT EXISTS watchlist_movie ON watchlist (user_id, movie_id);
+CREATE INDEX IF NOT EXISTS friendships_friend ON friendships (friend_id);
+"""
+
+MOVIE_LISTS = ("watched", "watchlist", "favorites")
+
+# Titles the user has watched, for NOT IN filters.
+_USER_TITLES = """
+    SELECT um.title FROM watched uw JOIN movies um ON um.id = uw.movie_id
+    WHERE uw.user_id = :user
+"""
+
+# Friends' movies the user hasn't watched, keeping the first movie seen for
+# each title when walking the friends in order, as get_friends_unique_watched
+# does. :genre narrows the candidates before deduplication when not NULL.
+_FRIENDS_UNIQUE = f"""
+    WITH candidates AS (
+        SELECT m.title, m.genre, m.rating, m.host,
+               f.position AS friend_position, fw.position AS watched_position,
+               ROW_NUMBER() OVER (
+                   PARTITION BY m.title ORDER BY f.position, fw.position
+               ) AS occurrence
+        FROM friendships f
+        JOIN watched fw ON fw.user_id = f.friend_id
+        JOIN movies m ON m.id = fw.movie_id
+        WHERE f.user_id = :user
+          AND (:genre IS NULL OR m.genre = :genre)
+          AND m.title NOT IN ({_USER_TITLES})
+    )
+    SELECT title, genre, rating, host FROM candidates
+    WHERE occurrence = 1 {{host_filter}}
+    ORDER BY friend_position, watched_position
+"""
+
+
+def _to_movie(row):
+    title, genre, rating, host = row
+    movie = {"title": title, "genre": genre, "rating": rating}
+    if host is not None:
+        movie["host"] = host
+    return movie
+
+
+class SQLiteStore:
+    """
+    A user_data store on SQLite, with the recommenders as indexed queries.
+
+    Every list in user_data (watched, watchlist, favorites, friends) is a
+    table keyed by (user_id, position), so results come back in the same
+    order as from the functions in party.py and in the same dict shape.
+    Movies are stored once per distinct (title, genre, rating, host).
+
+    Friends are users too: add_user stores each friend dict as its own user
+    and links it with a friendships row. A friend dict with an integer "id" is
+    stored once under that user id and reused by later add_user calls; one
+    without is stored once per add_user call. Friends can also be given as
+    existing user ids.
+
+    The store keeps no Python-side caches, so its memory use doesn't grow
+    with the data and a rolled-back write leaves nothing behind.
+
+    Args:
+        path (str): The database file, or ":memory:".
+    """
+
+    def __init__(self, path=":memory:"):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ----- writing -----
+
+    def _movie_id(self, movie):
+        key = (movie["title"], movie["genre"], movie["rating"], movie.get("host"))
+        row = self.connection.execute(
+            "SELECT id FROM movies WHERE title = ? AND genre = ? AND rating = ? AND host IS ?",
+            key,
+        ).fetchone()
+        if row is not None:
+            return row[0]
+
+        return self.connection.execute(
+            "INSERT INTO movies (title, genre, rating, host) VALUES (?, ?, ?, ?)", key
+        ).lastrowid
+
+    def _append(self, table, user_id, movies):
+        start = self.connection.execute(
+            f"SELECT COALESCE(MAX(position) + 1, 0) FROM {table} WHERE user_id = ?", (user_id,)
+        ).fetchone()[0]
+        self.connection.executemany(
+            f"INSERT INTO {table} (user_id, position, movie_id) VALUES (?, ?, ?)",
+            [
+                (user_id, position, self._movie_id(movie))
+                for position, movie in enumerate(movies, start)
+            ],
+        )
+
+    def _friend_id(self, friend, added):
+        if not isinstance(friend, dict):
+            return friend
+
+        friend_id = friend.get("id")
+        if friend_id is not None:
+            exists = self.connection.execute(
+                "SELECT 1 FROM users WHERE id = ?", (friend_id,)
+            ).fetchone()
+            return friend_id if exists else self._add_user(friend, friend_id, added)
+
+        # Without an id a friend dict is only recognised within one
+        # add_user call, where the caller keeps it (and its id()) alive.
+        friend_id = added.get(id(friend))
+        if friend_id is None:
+            friend_id = added[id(friend)] = self._add_user(friend, None, added)
+        return friend_id
+
+    def _add_user(self, user_data, user_id=None, added=None):
+        if added is None:
+            added = {}
+        user_id = self.connection.execute(
+            "INSERT INTO users (id) VALUES (?)", (user_id,)
+        ).lastrowid
+
+        for table in MOVIE_LISTS:
+            self._append(table, user_id, user_data.get(table, ()))
+
+        self.connection.executemany(
+            "INSERT INTO friendships (user_id, position, friend_id) VALUES (?, ?, ?)",
+            [
+                (user_id, position, self._friend_id(friend, added))
+                for position, friend in enumerate(user_data.get("friends", ()))
+            ],
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO subscriptions (user_id, host) VALUES (?, ?)",
+            [(user_id, host) for host in user_data.get("subscriptions", ())],
+        )
+        return user_id
+
+    def add_user(self, user_data, user_id=None):
+        """
+        Stores a user_data dict and returns the new user's id.
+
+        Args:
+            user_data (dict): Any of 'watched', 'watchlist', 'favorites',
+                'friends' and 'subscriptions'.
+            user_id (int): Optional id to store the user under.
+        """
+        with self.connection:
+            return self._add_user(user_data, user_id)
+
+    def add_to_watched(self, user_id, movie):
+        with self.connection:
+            self._append("watched", user_id, [movie])
+
+    def add_to_watchlist(self, user_id, movie):
+        with self.connection:
+            self._append("watchlist", user_id, [movie])
+
+    def watch_movie(self, user_id, title):
+        """
+        Moves the first watchlist movie with the title to watched, if any.
+        """
+        with self.connection:
+            row = self.connection.execute(
+                """
+                SELECT w.position, w.movie_id FROM watchlist w
+                JOIN movies m ON m.id = w.movie_id
+                WHERE w.user_id = ? AND m.title = ?
+                ORDER BY w.position LIMIT 1
+                """,
+                (user_id, title),
+            ).fetchone()
+            if row is None:
+                return
+
+            position, movie_id = row
+            self.connection.execute(
+                "DELETE FROM watchlist WHERE user_id = ? AND position = ?", (user_id, position)
+            )
+            self.connection.execute(
+                """
+                INSERT INTO watched (user_id, position, movie_id)
+                SELECT ?, COALESCE(MAX(position) + 1, 0), ? FROM watched WHERE user_id = ?
+                """,
+                (user_id, movie_id, user_id),
+            )
+
+    # ----- reading -----
+
+    def _movies(self, sql, params):
+        return [_to_movie(row) for row in self.connection.execute(sql, params)]
+
+    def get_movies(self, table, user_id):
+        """
+        Returns one of the user's movie lists ('watched', 'watchlist' or
+        'favorites') in order.
+        """
+        if table not in MOVIE_LISTS:
+            raise ValueError(f"unknown movie list {table!r}")
+
+        return self._movies(
+            f"""
+            SELECT m.title, m.genre, m.rating, m.host FROM {table} l
+            JOIN movies m ON m.id = l.movie_id
+            WHERE l.user_id = ? ORDER BY l.position
+            """,
+            (user_id,),
+        )
+
+    def load_user(self, user_id):
+        """
+        Returns the user as a user_data dict, with friends' watched lists.
+        """
+        user_data = {table: self.get_movies(table, user_id) for table in MOVIE_LISTS}
+        user_data["subscriptions"] = [
+            host for host, in self.connection.execute(
+                "SELECT host FROM subscriptions WHERE user_id = ? ORDER BY rowid", (user_id,)
+            )
+        ]
+        user_data["friends"] = [
+            {"watched": self.get_movies("watched", friend_id)}
+            for friend_id, in self.connection.execute(
+                "SELECT friend_id FROM friendships WHERE user_id = ? ORDER BY position", (user_id,)
+            )
+        ]
+        return user_data
+
+    def get_watched_avg_rating(self, user_id):
+        average = self.connection.execute(
+            "SELECT AVG(m.rating) FROM watched w JOIN movies m ON m.id = w.movie_id WHERE w.user_id = ?",
+            (user_id,),
+        ).fetchone()[0]
+        return 0 if average is None else average
+
+    def get_most_watched_genre(self, user_id):
+        row = self.connection.execute(
+            """
+            SELECT m.genre FROM watched w JOIN movies m ON m.id = w.movie_id
+            WHERE w.user_id = ?
+            GROUP BY m.genre
+            ORDER BY COUNT(*) DESC, MIN(w.position)
+            LIMIT 1
+            """,
+            (user_id,),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def get_unique_watched(self, user_id):
+        return self._movies(
+            """
+            SELECT m.title, m.genre, m.rating, m.host FROM watched w
+            JOIN movies m ON m.id = w.movie_id
+            WHERE w.user_id = :user AND m.title NOT IN (
+                SELECT fm.title FROM friendships f
+                JOIN watched fw ON fw.user_id = f.friend_id
+                JOIN movies fm ON fm.id = fw.movie_id
+                WHERE f.user_id = :user
+            )
+            ORDER BY w.position
+            """,
+            {"user": user_id},
+        )
+
+    def get_friends_unique_watched(self, user_id):
+        return self._movies(
+            _FRIENDS_UNIQUE.format(host_filter=""),
+            {"user": user_id, "genre": None},
+        )
+
+    def get_available_recs(self, user_id):
+        return self._movies(
+            _FRIENDS_UNIQUE.format(
+                host_filter="AND host IN (SELECT host FROM subscriptions WHERE user_id = :user)"
+            ),
+            {"user": user_id, "genre": None},
+        )
+
+    def get_new_rec_by_genre(self, user_id):
+        most_watched_genre = self.get_most_watched_genre(user_id)
+        if not most_watched_genre:
+            return []
+
+        return self._movies(
+            _FRIENDS_UNIQUE.format(host_filter=""),
+            {"user": user_id, "genre": most_watched_genre},
+        )
+
+    def get_rec_from_favorites(self, user_id):
+        return self._movies(
+            """
+            SELECT m.title, m.genre, m.rating, m.host FROM favorites fav
+            JOIN movies m ON m.id = fav.movie_id
+            WHERE fav.user_id = :user AND fav.movie_id NOT IN (
+                SELECT fw.movie_id FROM friendships f
+                JOIN watched fw ON fw.user_id = f.friend_id
+                WHERE f.user_id = :user
+            )
+            ORDER BY fav.position
+            """,
+            {"user": user_id},
+        )
@@ -0,0 +1,149 @@
+import threading
+
+from viewing_party.library import UserLibrary
+from viewing_party.party import add_to_watched, add_to_watchlist, watch_movie
+
+
+class ConcurrentUserLibrary:
+    """
+    A UserLibrary that several threads can mutate and read at once.
+
+    Every mutation takes this user's lock, so moving a title from the
+    watchlist to watched is atomic and no update is lost. Readers call
+    snapshot() and pass the result to any recommender: it is a UserLibrary
+    that never changes, shared by every reader until the next write.
+
+    Readers don't take the writer lock. The first read after a write copies
+    the library (O(n)) outside the lock and checks a sequence number that
+    writers bump before and after each change; if a write overlapped the
+    copy it is retried. Only a reader that keeps losing to writers, after
+    ``copy_attempts`` tries, copies under the lock and so briefly blocks
+    writers.
+
+    Args:
+        user_data (dict): Optional initial user_data.
+        copy_attempts (int): Unlocked copies to try before taking the lock.
+    """
+
+    def __init__(self, user_data=(), copy_attempts=3):
+        self._library = UserLibrary(user_data)
+        self._lock = threading.Lock()
+        self.copy_attempts = copy_attempts
+        # Odd while a write is in progress. The snapshot is (seq, library)
+        # and is only valid while seq is current.
+        self._seq = 0
+        self._snapshot = (None, None)
+
+    def _begin_write(self):
+        self._seq += 1
+
+    def _end_write(self):
+        self._seq += 1
+
+    def add_to_watched(self, movie):
+        with self._lock:
+            self._begin_write()
+            try:
+                add_to_watched(self._library, movie)
+            finally:
+                self._end_write()
+
+    def add_to_watchlist(self, movie):
+        with self._lock:
+            self._begin_write()
+            try:
+                add_to_watchlist(self._library, movie)
+            finally:
+                self._end_write()
+
+    def watch_movie(self, title):
+        """
+        Atomically moves a title from the watchlist to watched.
+
+        Returns:
+            bool: True if the title was on the watchlist and moved.
+        """
+        with self._lock:
+            if not self._library.in_watchlist(title):
+                return False
+            self._begin_write()
+            try:
+                watch_movie(self._library, title)
+            finally:
+                self._end_write()
+            return True
+
+    def _try_copy(self):
+        # The watched list only grows here, so its aggregates are never
+        # stale and copying it doesn't write to it.
+        seq = self._seq
+        if seq % 2:
+            return None
+        try:
+            copied = self._library.copy()
+        except RuntimeError:
+            # A dict changed size while it was being copied.
+            return None
+        if self._seq != seq:
+            return None
+        self._snapshot = (seq, copied)
+        return copied
+
+    def snapshot(self):
+        """
+        Returns a consistent, read-only UserLibrary of the current state.
+
+        Don't mutate the snapshot; it is shared with other readers.
+        """
+        seq, snapshot = self._snapshot
+        if seq == self._seq:
+            return snapshot
+
+        for _ in range(self.copy_attempts):
+            snapshot = self._try_copy()
+            if snapshot is not None:
+                return snapshot
+
+        with self._lock:
+            seq, snapshot = self._snapshot
+            if seq != self._seq:
+                snapshot = self._library.copy()
+                self._snapshot = (self._seq, snapshot)
+            return snapshot
+
+    @property
+    def version(self):
+        return self._library.version
+
+
+class LibraryRegistry:
+    """
+    ConcurrentUserLibrary objects by user id, one lock per user.
+
+    Threads working on different users never wait for each other; only
+    creating a user's library takes the registry lock.
+    """
+
+    def __init__(self):
+        self._libraries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id, user_data=()):
+        """
+        Returns the user's library, creating it from user_data if new.
+        """
+        library = self._libraries.get(user_id)
+        if library is not None:
+            return library
+
+        with self._lock:
+            library = self._libraries.get(user_id)
+            if library is None:
+                library = self._libraries[user_id] = ConcurrentUserLibrary(user_data)
+            return library
+
+    def __contains__(self, user_id):
+        return user_id in self._libraries
+
+    def __len__(self):
+        return len(self._libraries)